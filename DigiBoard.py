@@ -1,18 +1,23 @@
 import os
 import sys
 import time
+# Reference point for the startup profiler; taken before anything else is
+# imported so that the module import cost itself can be measured.
+_MODULE_T0 = time.perf_counter()
+_MODULE_T0_WALL = time.time()
 import threading
+from contextlib import contextmanager
 from pathlib import Path
 import random  
+import hashlib
+import math
+import heapq
 import json
 import logging
-import fitz  
-try:
-    from PIL import Image, ImageTk  
-except ImportError as exc:
-    raise ImportError(
-    
-    ) from exc
+import re
+import tempfile
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
 try:
     import tkinter as tk
     from tkinter import ttk
@@ -22,6 +27,171 @@ except ImportError as exc:
         "on Linux you may need to install the python3‑tk package."
     ) from exc
 
+# PyMuPDF and Pillow are the most expensive imports by far.  They are
+# loaded on a background thread (see _start_heavy_imports) so that Tk can
+# create its window and the configuration can be read in parallel.  Code
+# that needs them calls _require_heavy() first, which waits for the
+# background import (or performs it synchronously if it was never
+# started) and then exposes the modules under their usual global names.
+fitz = None
+Image = None
+ImageTk = None
+_heavy_thread: threading.Thread | None = None
+_heavy_error: BaseException | None = None
+
+
+class StartupProfiler:
+    """Collect wall-clock timings for the phases of application startup.
+
+    Recording a phase is only a couple of ``perf_counter`` calls, so phases
+    are always recorded; the breakdown is printed (and logged) only when the
+    application is started with ``--profile-startup``.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.origin = _MODULE_T0
+        self.phases: list[tuple[str, float, float, bool]] = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, end: float | None = None, background: bool = False) -> None:
+        """Record a phase that ran from ``start`` to ``end`` (perf_counter values)."""
+        if end is None:
+            end = time.perf_counter()
+        with self._lock:
+            self.phases.append((name, start, end, background))
+
+    @contextmanager
+    def phase(self, name: str, background: bool = False):
+        """Context manager recording the duration of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, background=background)
+
+    def report(self) -> str:
+        """Return a human readable, phase-by-phase breakdown in milliseconds."""
+        lines = ["Startup profile (milliseconds since process start):"]
+        bootstrap = _bootstrap_seconds()
+        offset = bootstrap if bootstrap is not None else 0.0
+        if bootstrap is not None:
+            lines.append(f"  {'interpreter + bundle bootstrap':<40} {bootstrap * 1000:9.1f}")
+        else:
+            lines.append(f"  {'interpreter + bundle bootstrap':<40} {'n/a':>9}")
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p[1])
+        last_end = self.origin
+        for name, start, end, background in phases:
+            label = f"{name} (background)" if background else name
+            at = (start - self.origin + offset) * 1000
+            lines.append(f"  {label:<40} {(end - start) * 1000:9.1f}   @ {at:8.1f}")
+            if not background:
+                last_end = max(last_end, end)
+        total = (last_end - self.origin + offset) * 1000
+        lines.append(f"  {'total to first frame':<40} {total:9.1f}")
+        return "\n".join(lines)
+
+
+PROFILER = StartupProfiler()
+
+
+def _process_start_time(pid: int) -> float | None:
+    """Return the creation time of process ``pid`` as a Unix timestamp.
+
+    Used only by the startup profiler.  Returns None when the platform does
+    not expose the information.
+    """
+    try:
+        if sys.platform.startswith("win"):
+            import ctypes
+            from ctypes import wintypes
+
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+            if not handle:
+                return None
+            try:
+                times = [wintypes.FILETIME() for _ in range(4)]
+                if not kernel32.GetProcessTimes(handle, *[ctypes.byref(t) for t in times]):
+                    return None
+            finally:
+                kernel32.CloseHandle(handle)
+            ticks = (times[0].dwHighDateTime << 32) | times[0].dwLowDateTime
+            # FILETIME counts 100 ns intervals since 1601-01-01
+            return ticks / 1e7 - 11644473600
+        with open(f"/proc/{pid}/stat", "r", encoding="utf-8") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])
+        with open("/proc/stat", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("btime"):
+                    boot_time = int(line.split()[1])
+                    break
+            else:
+                return None
+        return boot_time + start_ticks / os.sysconf("SC_CLK_TCK")
+    except Exception:
+        return None
+
+
+def _bootstrap_seconds() -> float | None:
+    """Seconds between process creation and the first line of this module.
+
+    A PyInstaller one-file build runs a bootloader process that extracts the
+    bundle and then starts the interpreter as a child process, so in that
+    case the parent's start time is used to include the extraction.
+    """
+    pid = os.getppid() if getattr(sys, "frozen", False) else os.getpid()
+    started = _process_start_time(pid)
+    if started is None:
+        return None
+    return max(0.0, _MODULE_T0_WALL - started)
+
+
+def _import_heavy() -> None:
+    """Import PyMuPDF and Pillow, storing any failure for _require_heavy()."""
+    global fitz, Image, ImageTk, _heavy_error
+    start = time.perf_counter()
+    try:
+        import fitz as _fitz
+        try:
+            from PIL import Image as _Image, ImageTk as _ImageTk
+        except ImportError as exc:
+            raise ImportError(
+                "Pillow is required to run this script; install it with 'pip install pillow'."
+            ) from exc
+    except BaseException as exc:
+        _heavy_error = exc
+        return
+    fitz, Image, ImageTk = _fitz, _Image, _ImageTk
+    PROFILER.record("import fitz + PIL", start, background=threading.current_thread() is not threading.main_thread())
+
+
+def _start_heavy_imports() -> None:
+    """Begin importing PyMuPDF and Pillow on a background thread."""
+    global _heavy_thread
+    if _heavy_thread is None and fitz is None:
+        _heavy_thread = threading.Thread(target=_import_heavy, name="heavy-imports", daemon=True)
+        _heavy_thread.start()
+
+
+def _require_heavy() -> None:
+    """Make sure PyMuPDF and Pillow are imported, waiting for the background import."""
+    if fitz is not None and Image is not None:
+        return
+    if _heavy_thread is not None:
+        start = time.perf_counter()
+        _heavy_thread.join()
+        PROFILER.record("wait for fitz + PIL", start)
+    else:
+        _import_heavy()
+    if _heavy_error is not None:
+        raise _heavy_error
+
+
+PROFILER.record("stdlib imports", _MODULE_T0)
+
 # Change this to point at the directory containing your notice PDFs
 PDF_DIR = Path(__file__).resolve().parent / "notices"
 
@@ -45,7 +215,6 @@ def _app_dir():
 
 APP_DIR = _app_dir()
 CONFIG_PATH = APP_DIR / "config.json"
-LOG_PATH = APP_DIR / "noticeboard.log"
 
 
 def load_config():
@@ -61,8 +230,8 @@ def load_config():
         "wheel_mode": "navigate",
         "page_indicator": "top-right",
         "toolbar": False,
-        # Shuffle the order of all pages after loading.  If true, pages from
-        # multiple PDFs are combined and then shuffled randomly.
+        # Show the pages of all notices interleaved in random order instead
+        # of file by file.  The order is reshuffled after every full cycle.
         "shuffle_pages": False,
         # Number of pixels to pan when using pan controls (w/a/s/d).  Larger
         # values move faster across zoomed pages.
@@ -113,9 +282,112 @@ def load_config():
         # bouncy or stuttering animations.  Set to True for smooth
         # scrolling.
         "scroll_animation": False,
+        # Window resizes and display changes are handled once the window
+        # has settled for this many milliseconds; the visible page plus
+        # relayout_prefetch upcoming pages are then re-fitted.
+        "resize_debounce_ms": 250,
+        "relayout_prefetch": 2,
+        # Duration of the carousel scroll and selection pulse animations,
+        # and the target time between animation frames.  Frames are
+        # skipped rather than queued when the machine cannot keep up.
+        "scroll_duration_ms": 350,
+        "pulse_duration_ms": 480,
+        "animation_frame_ms": 16,
         # Font size for the clock/time display in the top bar.  A smaller
         # value reduces the space occupied by the clock.  Defaults to 24.
         "clock_font_size": 18,
+        # Maximum number of PDF documents kept open for re-rendering pages
+        # without parsing the file again.  Each open document holds a file
+        # handle; the least recently used one is closed beyond this limit.
+        "max_open_documents": 16,
+        # Directory for files the noticeboard writes itself (search index,
+        # caches).  Leave empty to use the folder next to the script or
+        # executable, falling back to a per-user folder if that is not
+        # writable.
+        "data_dir": "",
+        # Extract the text of every notice in the background and keep a
+        # search index so notices can be found with "/" or Ctrl+F.
+        "search_index": True,
+        # Upper bound, in megabytes, for memory held by rendered pages,
+        # thumbnails, fitted frames and Tk images.  When exceeded, pages
+        # far away from the current position are dropped first (and
+        # rendered again when needed); the current page and its neighbours
+        # go last.  0 disables the limit.
+        "memory_budget_mb": 512,
+        # Port for the local health/metrics HTTP endpoint (/health and
+        # /metrics).  0 disables it.  health_host selects the interface;
+        # the default only accepts connections from this machine.
+        "health_port": 0,
+        "health_host": "127.0.0.1",
+        # Log a warning (with the offending call site) whenever the user
+        # interface is unresponsive for longer than this many milliseconds.
+        # 0 disables the stall detector.
+        "stall_threshold_ms": 1000,
+        # How often, in minutes, to log a ranking of the stalls seen so far.
+        "stall_summary_minutes": 60,
+        # noticeboard.log is rotated when it reaches this size (kilobytes);
+        # this many old logs are kept as noticeboard.log.1, .2, ...
+        "log_max_kb": 1024,
+        "log_backups": 3,
+        # Identical log messages repeated within this many seconds are
+        # suppressed and counted instead (e.g. the same page failing to
+        # render on every rotation).  0 logs every message.
+        "log_repeat_window": 300,
+        # Render pages in a separate supervised process.  A page that takes
+        # longer than render_timeout seconds, or crashes the renderer, is
+        # quarantined: it is shown as a placeholder and not retried until
+        # the file changes.  The worker is restarted automatically.
+        "render_isolation": True,
+        "render_timeout": 20,
+        # Pages that take at least this many milliseconds to render are
+        # also saved to a disk cache (bounded by disk_cache_mb) so they are
+        # loaded rather than rasterised again after eviction or a restart.
+        "disk_cache_min_ms": 150,
+        "disk_cache_mb": 512,
+        # Share of the memory budget reserved for keeping the most
+        # expensive pages in memory regardless of their position.
+        "pin_budget_fraction": 0.25,
+        # Keep pages without any colour as 8-bit grayscale images.  Each
+        # page is checked on its first render; later renders ask PyMuPDF
+        # for grayscale directly.
+        "grayscale_pages": True,
+        # Notices with more pages than stream_threshold are not rendered up
+        # front.  Only stream_window pages ahead of the one on screen (and
+        # the one before it) are kept, so memory does not grow with length.
+        "stream_threshold": 30,
+        "stream_window": 4,
+        # Save the position in the rotation, its order, zoom and fit mode
+        # every state_save_interval seconds and on exit, and resume from
+        # there on the next start with the pages served from the disk cache.
+        "warm_restart": True,
+        "state_save_interval": 60,
+        # Height in pixels of the page thumbnails in the overview grid
+        # (opened with the "o" key).
+        "overview_thumb_height": 160,
+        # Render new and changed notices in pdf_dir into the disk cache
+        # ahead of time, in a low-priority background process.  The folder
+        # is rescanned every prewarm_scan_interval seconds.  Inside the
+        # quiet prewarm_windows (e.g. ["22:00-06:00"]) pages are rendered
+        # back to back; outside them only at half pace, or not at all when
+        # prewarm_background is false.
+        "prewarm": True,
+        "prewarm_windows": [],
+        "prewarm_background": True,
+        "prewarm_scan_interval": 300,
+        # Per-notice validity: "start"/"end" times ("2026-10-01" or
+        # "2026-10-01T08:00") per file name in this file in pdf_dir, or a
+        # "[start..end]" tag in the file name.  Notices join and leave the
+        # rotation on time, and are rendered schedule_prerender_minutes
+        # before they start.
+        "schedule_manifest": "schedule.json",
+        "schedule_prerender_minutes": 10,
+        # URL of a central frame server (see --serve-frames).  When set, the
+        # board plays frames pre-rendered for frame_resolution (default: its
+        # display area) instead of the PDFs in pdf_dir, and checks for
+        # changes every frame_sync_interval seconds.
+        "frame_server": "",
+        "frame_resolution": "",
+        "frame_sync_interval": 60,
     }
     if CONFIG_PATH.exists():
         try:
@@ -128,15 +400,8 @@ def load_config():
     return cfg
 
 # Load user configuration
-CFG = load_config()
-
-# Initialise logging.  Messages about PDF loading and errors are written to
-# noticeboard.log in the application directory.
-logging.basicConfig(
-    filename=LOG_PATH,
-    format="%(asctime)s %(levelname)s: %(message)s",
-    level=logging.INFO,
-)
+with PROFILER.phase("load_config"):
+    CFG = load_config()
 
 # Override PDF_DIR, LOGO_PATH and LOGO_MAX_HEIGHT based on configuration.
 PDF_DIR = (APP_DIR / CFG.get("pdf_dir", "notices")).resolve()
@@ -153,299 +418,3504 @@ try:
 except Exception:
     LOGO_MAX_HEIGHT = 100
 
-class DigitalNoticeboard:
-    def __init__(self, root: tk.Tk, pdf_paths, cycle_interval: int = 10) -> None:
-     
-        self.root = root
-        self.pdf_paths = pdf_paths
-        # Load configuration values
-        cfg = CFG
-        self.fit_mode = cfg.get("fit_mode", "fit_page")
-        self.zoom = 1.0
-        try:
-            self.zoom_step = max(0.01, float(cfg.get("zoom_step", 0.1)))
-        except Exception:
-            self.zoom_step = 0.1
-        self.wheel_mode = cfg.get("wheel_mode", "navigate")
-        self.background_color = cfg.get("background_color", "#FFFFFF")
-        self.page_indicator_pos = cfg.get("page_indicator", "top-right")
-        self.show_toolbar = bool(cfg.get("toolbar", False))
-        # Shuffle pages after loading?  True/False
-        self.shuffle_pages = bool(cfg.get("shuffle_pages", False))
-        # Pan step for panning controls (pixels)
-        try:
-            self.pan_step = int(cfg.get("pan_step", 50))
-        except Exception:
-            self.pan_step = 50
-        # Idle/screen saver settings
-        try:
-            self.idle_timeout = int(cfg.get("idle_timeout", 0))
-        except Exception:
-            self.idle_timeout = 0
-        self.idle_overlay_color = cfg.get("idle_overlay_color", "#000000")
-        self.idle_overlay_text = cfg.get("idle_overlay_text", "Idle")
 
-        # Number of thumbnails to display in bottom row
-        try:
-            self.thumbnails_count = int(cfg.get("thumbnails_count", 4))
-        except Exception:
-            self.thumbnails_count = 4
-        # Height of thumbnails in pixels.  Use the configured value if
-        # provided; otherwise fall back to a sensible default.
-        try:
-            self.thumbnail_height = int(cfg.get("thumbnail_height", 150))
-        except Exception:
-            self.thumbnail_height = 150
-        # Whether to show date with the clock
-        self.show_date = bool(cfg.get("show_date", False))
-        # Shuffle files during rotation
-        self.shuffle_files = bool(cfg.get("shuffle_files", False))
-        try:
-            self.max_logo_height = int(cfg.get("max_logo_height", LOGO_MAX_HEIGHT))
-        except Exception:
-            self.max_logo_height = LOGO_MAX_HEIGHT
-        # Highlight colour for the active thumbnail
-        self.highlight_color = cfg.get("highlight_color", "#FF0000")
-        # Factor for enlarging the selected thumbnail
-        try:
-            self.thumbnail_enlarge_factor = float(cfg.get("thumbnail_enlarge_factor", 1.2))
-            if self.thumbnail_enlarge_factor < 1.0:
-                self.thumbnail_enlarge_factor = 1.0
-        except Exception:
-            self.thumbnail_enlarge_factor = 1.2
+def _data_dir() -> Path:
+    """Return a writable directory for the application's own files.
 
-        # ------------------------------------------------------------------
-        # Screen‑size adaptive scaling
-        #
-        # When running on displays of varying resolutions (for example when
-        # remoting into the noticeboard on a small monitor), fixed pixel
-        # values for the logo and thumbnail heights can cause the bottom
-        # carousel to overflow off screen.  To make the user interface
-        # responsive, compute reasonable defaults based on the current screen
-        # dimensions.  If a value is already provided in the configuration
-        # file, it will cap the computed size rather than being ignored.
-        try:
-            # Retrieve the height of the primary display in pixels.  This
-            # allows the program to adapt to monitors of different sizes.
-            screen_h = self.root.winfo_screenheight()
-        except Exception:
-            screen_h = 0
-        if screen_h:
-            # Target the thumbnail row height at roughly 12 percent of the
-            # screen height.  If the configured value is smaller it will be
-            # kept, otherwise it is limited to this computed size to
-            # prevent overflow on short displays.
-            computed_thumb_h = int(screen_h * 0.12)
-            if computed_thumb_h > 0:
-                self.thumbnail_height = min(self.thumbnail_height, computed_thumb_h)
-            # Set the maximum height for the logo images to approximately
-            # 8 percent of the screen height.  The existing configuration
-            # value will prevail if it is smaller.
-            computed_logo_h = int(screen_h * 0.08)
-            if computed_logo_h > 0:
-                self.max_logo_height = min(self.max_logo_height, computed_logo_h)
-        # Determine cycle interval (seconds per page)
-        ci = cfg.get("cycle_interval", cycle_interval)
+    ``APP_DIR`` cannot be used under PyInstaller because it is the temporary
+    extraction directory, which is deleted on exit.  The configured
+    ``data_dir`` is tried first, then the folder containing the script or
+    executable, then a per-user folder.
+    """
+    candidates: list[Path] = []
+    configured = CFG.get("data_dir", "")
+    if configured:
+        candidate = Path(os.path.expanduser(os.path.expandvars(configured)))
+        if not candidate.is_absolute():
+            candidate = APP_DIR / candidate
+        candidates.append(candidate)
+    if getattr(sys, "frozen", False):
+        candidates.append(Path(sys.executable).resolve().parent)
+    else:
+        candidates.append(APP_DIR)
+    user_base = os.environ.get("LOCALAPPDATA") or str(Path.home() / ".local" / "share")
+    candidates.append(Path(user_base) / "DigiBoard")
+    for candidate in candidates:
         try:
-            ci = int(ci)
+            candidate.mkdir(parents=True, exist_ok=True)
+            if os.access(candidate, os.W_OK):
+                return candidate
         except Exception:
-            ci = cycle_interval
-        self.cycle_interval = max(3, ci)
-        # Whether to animate carousel scrolling.  This is set in
-        # configuration and allows the user to disable scrolling animations
-        # entirely to prevent bounce/stutter effects.
-        self.scroll_animation = bool(cfg.get("scroll_animation", False))
+            continue
+    return Path(tempfile.gettempdir()) / "DigiBoard"
 
-        # Clock font size: read from configuration.  If not provided or
-        # invalid, default to 24 points.  This influences the size of the
-        # clock text in the top bar and therefore the width of the left
-        # column.
+
+DATA_DIR = _data_dir()
+CACHE_DIR = DATA_DIR / "cache"
+LOG_PATH = DATA_DIR / "noticeboard.log"
+
+
+class RepeatFilter(logging.Filter):
+    """Suppress identical log messages repeated within ``window`` seconds.
+
+    The first occurrence is logged; repeats inside the window are only
+    counted, and the next occurrence logged after the window notes how many
+    were suppressed.
+    """
+
+    def __init__(self, window: float = 300.0, max_keys: int = 1000) -> None:
+        super().__init__()
+        self.window = window
+        self.max_keys = max_keys
+        self._seen: dict[tuple[int, str], list] = {}
+        # Records arrive from the Tk thread and every background thread
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.window <= 0:
+            return True
+        message = record.getMessage()
+        key = (record.levelno, message)
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is not None and record.created - entry[0] < self.window:
+                entry[1] += 1
+                return False
+            if entry is not None and entry[1]:
+                record.msg = f"{message} (repeated {entry[1]} more times in the previous {self.window:g} s)"
+                record.args = None
+            if len(self._seen) >= self.max_keys:
+                cutoff = record.created - self.window
+                self._seen = {k: v for k, v in self._seen.items() if v[0] >= cutoff}
+            self._seen[key] = [record.created, 0]
+        return True
+
+
+# True inside a multiprocessing child (such as the render worker), which
+# re-imports this script but must not open the log file or start threads.
+_IN_WORKER = "--multiprocessing-fork" in sys.argv
+
+
+def _setup_logging():
+    """Send log records through a queue to a rotating file on a background thread.
+
+    Logging calls made on the Tk thread only format the message and put it
+    on a queue; a ``QueueListener`` thread does the (possibly slow) disk
+    writes.  Returns the listener, which is stopped at exit.
+    """
+    if _IN_WORKER:
+        return None
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+    try:
+        max_bytes = int(float(CFG.get("log_max_kb", 1024)) * 1024)
+        backups = int(CFG.get("log_backups", 3))
+        window = float(CFG.get("log_repeat_window", 300))
+    except Exception:
+        max_bytes, backups, window = 1024 * 1024, 3, 300.0
+    try:
+        file_handler = RotatingFileHandler(
+            LOG_PATH,
+            maxBytes=max(0, max_bytes),
+            backupCount=max(0, backups),
+            encoding="utf-8",
+            delay=True,
+        )
+    except Exception as exc:
+        print(f"Warning: could not open log file {LOG_PATH}: {exc}")
+        file_handler = logging.StreamHandler()
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RepeatFilter(window))
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(queue_handler)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+
+    def _flush_log() -> None:
+        # QueueListener.stop() may only be called once
+        if listener._thread is not None:
+            listener.stop()
+
+    atexit.register(_flush_log)
+    return listener
+
+
+# Initialise logging.  Messages about PDF loading and errors are written to
+# noticeboard.log in the data directory.
+with PROFILER.phase("logging setup"):
+    LOG_LISTENER = _setup_logging()
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Write ``data`` as JSON to ``path`` without leaving a partial file behind."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into lower-case search terms."""
+    return _WORD_RE.findall(text.lower())
+
+
+class SearchIndex:
+    """Persistent inverted index over the text of the notices.
+
+    The extracted text of each notice is stored together with the file's
+    modification time in ``search_index.json``; on :meth:`update` only new
+    or changed notices are extracted again and removed ones are dropped.
+    The in-memory index maps every term to the ``(path, page)`` pairs that
+    contain it, plus a sorted term list so that partially typed words can
+    be matched as prefixes with a binary search.
+
+    :meth:`update` is meant to run on a background thread; :meth:`search`
+    can be called from the Tk thread at any time.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        # path -> {"mtime": float, "pages": [text, ...]}
+        self.docs: dict[str, dict] = {}
+        self._postings: dict[str, set[tuple[str, int]]] = {}
+        self._terms: list[str] = []
+        self._load()
+
+    def _load(self) -> None:
         try:
-            self.clock_font_size = int(cfg.get("clock_font_size", 24))
-        except Exception:
-            self.clock_font_size = 24
-        # Internal state
-        # List of file dictionaries with keys 'pages', 'thumbnail', 'path', 'modified_time'
-        self.files: list[dict] = []
-        # Index of currently displayed file and page
-        self.current_file_index = 0
-        self.current_page_index = 0
-        # Timer ID for rotation
-        self.cycle_id = None
-        # Pause state
-        self.paused = False
-        # Offsets used for panning when zoomed (>1).  Offset values are in
-        # pixels of the resized image; they represent the top-left corner
-        # of the cropping region when the image is larger than the display area.
-        self.offset_x = 0
-        self.offset_y = 0
-        # Track last user interaction time for idle detection
-        self.last_interaction_time = time.time()
-        # Load PDF files and build UI
-        self._load_files()
-        self._build_ui()
-        self._update_clock()
-        # Begin automatic rotation by scheduling the next page.  When the
-        # last page of a file has been displayed, the next invocation will
-        # advance to the next file.
-        self._schedule_next_page()
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("version") == self.VERSION:
+                self.docs = dict(data.get("docs", {}))
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logging.warning("Ignoring unreadable search index %s: %s", self.path, exc)
+            return
+        self._rebuild()
 
-        # Start idle check if idle_timeout is enabled
-        if self.idle_timeout and self.idle_timeout > 0:
-            self._check_idle()
+    def _rebuild(self) -> None:
+        postings: dict[str, set[tuple[str, int]]] = {}
+        for key, doc in self.docs.items():
+            for page_num, text in enumerate(doc.get("pages", [])):
+                for term in set(_tokenize(text)):
+                    postings.setdefault(term, set()).add((key, page_num))
+        terms = sorted(postings)
+        with self._lock:
+            self._postings = postings
+            self._terms = terms
 
-    def _load_pages(self) -> None:
-        """Load every page from each PDF into the pages list as PIL images.
+    @staticmethod
+    def _extract(path) -> list[str]:
+        if _is_image_notice(path):
+            return [""]
+        if _is_frame_set(path):
+            try:
+                with open(Path(path) / "text.json", "r", encoding="utf-8") as f:
+                    return list(json.load(f))
+            except FileNotFoundError:
+                return [""] * len(_frame_set_pages(path))
+        # A private handle is used because PyMuPDF documents must not be
+        # shared between threads.
+        with fitz.open(str(path)) as doc:
+            return [page.get_text() for page in doc]
 
-        Errors encountered while opening documents or rendering pages are logged
-        and the offending files/pages are skipped.
-        """
-        for pdf_path in self.pdf_paths:
+    def update(self, paths) -> bool:
+        """Bring the index in line with ``paths``; returns True if it changed."""
+        changed = False
+        wanted = {str(p): p for p in paths}
+        # Work on a copy: search() reads self.docs from the Tk thread, so
+        # it is only ever replaced, under the lock.
+        docs = dict(self.docs)
+        for key in [k for k in docs if k not in wanted]:
+            del docs[key]
+            changed = True
+        for key, path in wanted.items():
             try:
-                doc = fitz.open(pdf_path)
-            except Exception as exc:
-                logging.error("Failed to open PDF %s: %s", pdf_path, exc)
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            known = docs.get(key)
+            if known is not None and known.get("mtime") == mtime:
                 continue
-            for page_num in range(len(doc)):
-                try:
-                    page = doc[page_num]
-                    pix = page.get_pixmap()
-                    # Convert PyMuPDF pixmap to PIL Image
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    self.pages.append(img)
-                except Exception as exc:
-                    logging.error(
-                        "Failed to render page %d of %s: %s",
-                        page_num + 1,
-                        pdf_path,
-                        exc,
-                    )
-        if not self.pages:
-            raise RuntimeError(
-                "No pages loaded from PDFs; please place PDFs in the configured directory."
-            )
-        # Shuffle pages if configured.  This occurs after all pages are loaded
-        # from all documents so that the order is fully randomised across
-        # documents.  We shuffle a copy of the list in place.
-        if getattr(self, "shuffle_pages", False):
             try:
-                random.shuffle(self.pages)
-            except Exception:
-                pass
+                pages = self._extract(path)
+            except Exception as exc:
+                logging.error("Failed to extract text from %s: %s", path, exc)
+                pages = []
+            docs[key] = {"mtime": mtime, "pages": pages}
+            changed = True
+        if changed:
+            with self._lock:
+                self.docs = docs
+            self._rebuild()
+            try:
+                _write_json_atomic(self.path, {"version": self.VERSION, "docs": docs})
+            except Exception as exc:
+                logging.warning("Could not save search index %s: %s", self.path, exc)
+        return changed
+
+    def _matches(self, term: str, prefix: bool) -> set[tuple[str, int]]:
+        if not prefix:
+            return set(self._postings.get(term, ()))
+        found: set[tuple[str, int]] = set()
+        i = bisect_left(self._terms, term)
+        while i < len(self._terms) and self._terms[i].startswith(term):
+            found |= self._postings[self._terms[i]]
+            i += 1
+        return found
+
+    def search(self, query: str, limit: int = 100) -> list[tuple[str, int, str]]:
+        """Return ``(path, page, snippet)`` for pages containing every query word.
+
+        The last word is matched as a prefix so results appear while typing.
+        """
+        terms = _tokenize(query)
+        if not terms:
+            return []
+        with self._lock:
+            hits: set[tuple[str, int]] | None = None
+            for n, term in enumerate(terms):
+                matches = self._matches(term, prefix=(n == len(terms) - 1))
+                hits = matches if hits is None else hits & matches
+                if not hits:
+                    return []
+            results = []
+            for key, page_num in sorted(hits)[:limit]:
+                pages = self.docs.get(key, {}).get("pages", [])
+                text = pages[page_num] if page_num < len(pages) else ""
+                results.append((key, page_num, self._snippet(text, terms[0])))
+        return results
+
+    @staticmethod
+    def _snippet(text: str, term: str, width: int = 60) -> str:
+        flat = " ".join(text.split())
+        pos = flat.lower().find(term)
+        if pos < 0:
+            return flat[:width]
+        start = max(0, pos - width // 3)
+        return ("…" if start else "") + flat[start:start + width]
+
+# Number of resized display frames kept for reuse (within the memory budget)
+_FITTED_CACHE_SIZE = 8
+
+# Keys of the thumbnail variants stored in each file_info dictionary
+_THUMBNAIL_KEYS = (
+    "thumbnail",
+    "thumbnail_selected",
+    "thumbnail_enlarged",
+    "thumbnail_selected_enlarged",
+)
+
+
+# path -> (mtime_ns, size, digest), so a reload only hashes changed files
+_FILE_DIGESTS: dict[str, tuple[int, int, bytes]] = {}
+_FILE_DIGESTS_LOCK = threading.Lock()
+
+
+def _file_digest(path, chunk_size: int = 1 << 20) -> bytes:
+    """Return a content hash of the file at ``path``.
+
+    The hash is remembered until the file's modification time or size
+    changes.
+    """
+    st = os.stat(path)
+    with _FILE_DIGESTS_LOCK:
+        known = _FILE_DIGESTS.get(str(path))
+    if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+        return known[2]
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            h.update(chunk)
+    digest = h.digest()
+    with _FILE_DIGESTS_LOCK:
+        _FILE_DIGESTS[str(path)] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def _image_digest(img) -> bytes:
+    """Return a hash identifying the pixels of a PIL image."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{img.mode}:{img.width}x{img.height}".encode())
+    h.update(img.tobytes())
+    return h.digest()
+
+
+# Bytes Pillow uses per pixel for each image mode (RGB is stored padded to
+# four bytes).
+_MODE_PIXEL_BYTES = {"1": 1, "L": 1, "P": 1, "LA": 4, "RGB": 4, "RGBA": 4, "RGBX": 4, "CMYK": 4}
+
+
+def _image_nbytes(img) -> int:
+    """Approximate memory held by a PIL image's pixel data."""
+    try:
+        return img.width * img.height * _MODE_PIXEL_BYTES.get(img.mode, 4)
+    except Exception:
+        return 0
+
+
+class DocumentPool:
+    """Bounded LRU pool of open ``fitz.Document`` handles.
+
+    Opening a PDF means parsing its trailer and cross-reference table, which
+    for large notices costs far more than rendering a single page.  The pool
+    keeps up to ``max_open`` documents open (each holds a file descriptor)
+    and closes the least recently used one when the cap is reached.
+
+    Every lookup compares the file's modification time and size with the
+    values recorded when it was opened; if the file was replaced or
+    rewritten on disk the stale handle is closed and the file reopened.
+    """
+
+    def __init__(self, max_open: int = 16) -> None:
+        self.max_open = max(1, int(max_open))
+        self._docs: "OrderedDict[str, tuple[object, tuple[int, int]]]" = OrderedDict()
+        self._lock = threading.RLock()
+        # Simple counters, useful when tuning max_open
+        self.hits = 0
+        self.misses = 0
+        self.reopens = 0
+
+    @staticmethod
+    def _signature(path) -> tuple[int, int]:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def get(self, path):
+        """Return an open document for ``path``, opening it if necessary.
+
+        Raises the underlying ``OSError``/PyMuPDF error if the file cannot be
+        read.
+        """
+        key = str(path)
+        signature = self._signature(path)
+        with self._lock:
+            entry = self._docs.get(key)
+            if entry is not None:
+                doc, known = entry
+                if known == signature and not doc.is_closed:
+                    self._docs.move_to_end(key)
+                    self.hits += 1
+                    METRICS.incr("doc_pool_hits")
+                    return doc
+                # The file changed underneath the open handle
+                logging.info("Reopening %s: file changed on disk", key)
+                self._close(key)
+                self.reopens += 1
+            self.misses += 1
+            METRICS.incr("doc_pool_misses")
+            doc = fitz.open(key)
+            self._docs[key] = (doc, signature)
+            while len(self._docs) > self.max_open:
+                oldest = next(iter(self._docs))
+                self._close(oldest)
+            return doc
+
+    def _close(self, key: str) -> None:
+        entry = self._docs.pop(key, None)
+        if entry is None:
+            return
+        try:
+            entry[0].close()
+        except Exception:
+            pass
+
+    def invalidate(self, path) -> None:
+        """Close the handle for ``path`` (if open)."""
+        with self._lock:
+            self._close(str(path))
+
+    def retain(self, paths) -> None:
+        """Close every handle whose path is not in ``paths``."""
+        keep = {str(p) for p in paths}
+        with self._lock:
+            for key in [k for k in self._docs if k not in keep]:
+                self._close(key)
+
+    def close_all(self) -> None:
+        """Close every open handle."""
+        with self._lock:
+            for key in list(self._docs):
+                self._close(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._docs)
+
+
+class Metrics:
+    """Process-wide counters and latency histograms used for instrumentation.
+
+    Counters are plain integers keyed by name; histograms count
+    observations (in milliseconds) into the fixed ``BUCKETS_MS``.  Both may
+    be updated from any thread.
+    """
+
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counters: dict[str, int] = defaultdict(int)
+        self.histograms: dict[str, dict] = {}
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def observe(self, name: str, value_ms: float) -> None:
+        """Add one observation to histogram ``name``."""
+        with self._lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = {"buckets": [0] * (len(self.BUCKETS_MS) + 1), "count": 0, "sum": 0.0}
+                self.histograms[name] = hist
+            hist["buckets"][bisect_left(self.BUCKETS_MS, value_ms)] += 1
+            hist["count"] += 1
+            hist["sum"] += value_ms
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+    def histogram_snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                name: {"buckets": list(h["buckets"]), "count": h["count"], "sum": h["sum"]}
+                for name, h in self.histograms.items()
+            }
+
+
+METRICS = Metrics()
+
+
+def _new_photo(*args, **kwargs):
+    """Create an ``ImageTk.PhotoImage``, counting the allocation."""
+    METRICS.incr("tk_images_allocated")
+    return ImageTk.PhotoImage(*args, **kwargs)
+
+
+class DisplaySurface:
+    """Double-buffered output for the main notice area.
+
+    Two ``PhotoImage`` buffers the size of the display area are allocated
+    once (and again only when that size changes).  Each frame is composed
+    into a reusable PIL canvas (background colour with the page centred on
+    it), pasted into the back buffer and the label is switched to it, after
+    which the buffers swap roles.  Steady-state rotation therefore creates
+    no new Tk images.
+    """
+
+    def __init__(self, label, background: str) -> None:
+        self.label = label
+        self.background = background
+        self.size: tuple[int, int] = (0, 0)
+        self._canvas = None
+        self._buffers: list = []
+        self._back = 0
+
+    def _allocate(self, size: tuple[int, int]) -> None:
+        self.size = size
+        self._canvas = Image.new("RGB", size, self.background)
+        self._buffers = [_new_photo("RGB", size), _new_photo("RGB", size)]
+        self._back = 0
+        METRICS.incr("display_buffer_allocations")
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the canvas and both Tk buffers."""
+        w, h = self.size
+        return 3 * w * h * 4 if self._buffers else 0
+
+    def present(self, frame, size: tuple[int, int]) -> None:
+        """Show ``frame`` centred in a display area of ``size`` pixels."""
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        if size != self.size or not self._buffers:
+            self._allocate(size)
+        w, h = size
+        canvas = self._canvas
+        canvas.paste(self.background, (0, 0, w, h))
+        x = max(0, (w - frame.width) // 2)
+        y = max(0, (h - frame.height) // 2)
+        if frame.width > w or frame.height > h:
+            frame = frame.crop((0, 0, min(w, frame.width), min(h, frame.height)))
+        canvas.paste(frame, (x, y))
+        back = self._buffers[self._back]
+        back.paste(canvas)
+        self.label.config(image=back)
+        self._back ^= 1
+        METRICS.incr("frames_presented")
+
+    def reset(self) -> None:
+        """Release the buffers; they are reallocated on the next frame."""
+        self._buffers = []
+        self._canvas = None
+        self.size = (0, 0)
+
+
+class MemoryAccountant:
+    """Track the bytes held by the board's image caches and enforce a budget.
+
+    Every cached object is registered under a category (``pages``,
+    ``thumbnails``, ``fitted``, ``tk_images``) and a key, with its size and
+    an optional eviction callback.  Entries without a callback are only
+    counted.  When the total exceeds the budget, :meth:`enforce` asks
+    ``priority(category, key)`` for every evictable entry and evicts the
+    highest values first; a priority of None means the entry must stay.
+    """
+
+    def __init__(self, budget_bytes: int = 0) -> None:
+        self.budget = max(0, int(budget_bytes))
+        self.priority = lambda category, key: 0
+        self._entries: dict[tuple[str, object], tuple[int, object]] = {}
+        self._totals: dict[str, int] = defaultdict(int)
+        self._counts: dict[str, int] = defaultdict(int)
+        self.evictions: dict[str, int] = defaultdict(int)
+
+    def add(self, category: str, key, nbytes: int, evict=None) -> None:
+        """Register (or replace) an entry of ``nbytes`` bytes."""
+        self.discard(category, key)
+        self._entries[(category, key)] = (int(nbytes), evict)
+        self._totals[category] += int(nbytes)
+        self._counts[category] += 1
+
+    def discard(self, category: str, key) -> None:
+        """Forget an entry without calling its eviction callback."""
+        entry = self._entries.pop((category, key), None)
+        if entry is not None:
+            self._totals[category] -= entry[0]
+            self._counts[category] -= 1
+
+    def clear(self, category: str) -> None:
+        """Forget every entry in ``category``."""
+        for cat, key in [k for k in self._entries if k[0] == category]:
+            self.discard(cat, key)
+
+    @property
+    def total(self) -> int:
+        return sum(self._totals.values())
+
+    def totals(self) -> dict[str, int]:
+        """Bytes held per category."""
+        return {cat: n for cat, n in self._totals.items() if self._counts[cat]}
+
+    def has_room(self, fraction: float = 0.9) -> bool:
+        """True if usage is below ``fraction`` of the budget (or there is no budget)."""
+        return not self.budget or self.total < self.budget * fraction
+
+    def enforce(self) -> int:
+        """Evict entries until the total is within budget; returns bytes freed."""
+        if not self.budget or self.total <= self.budget:
+            return 0
+        candidates = []
+        for (category, key), (nbytes, evict) in self._entries.items():
+            if evict is None:
+                continue
+            try:
+                rank = self.priority(category, key)
+            except Exception:
+                rank = 0
+            if rank is not None:
+                candidates.append((rank, category, key))
+        candidates.sort(key=lambda c: c[0], reverse=True)
+        freed = 0
+        for _rank, category, key in candidates:
+            if self.total <= self.budget:
+                break
+            nbytes, evict = self._entries.get((category, key), (0, None))
+            self.discard(category, key)
+            try:
+                evict()
+            except Exception as exc:
+                logging.warning("Evicting %s %r failed: %s", category, key, exc)
+            self.evictions[category] += 1
+            freed += nbytes
+        return freed
+
+    def breakdown(self) -> str:
+        """One-line summary of usage per category."""
+        mb = 1024 * 1024
+        budget = f"{self.budget / mb:.0f} MB" if self.budget else "unlimited"
+        parts = [
+            f"{cat} {self._totals[cat] / mb:.1f} MB/{self._counts[cat]}"
+            for cat in sorted(self._totals)
+            if self._counts[cat]
+        ]
+        evicted = ", ".join(f"{cat} {n}" for cat, n in sorted(self.evictions.items()) if n)
+        return (
+            f"Memory: {self.total / mb:.1f} MB of {budget} ("
+            + ", ".join(parts)
+            + ")"
+            + (f"; evicted {evicted}" if evicted else "")
+        )
+
+
+class NoticePages:
+    """The pages of one notice, rendered on demand.
+
+    This stands in for the list of PIL images that ``file_info["pages"]``
+    used to hold: ``len()`` gives the page count and indexing returns the
+    page image, obtained through ``loader(path, page_number)`` which serves
+    it from (and stores it in) the board's page cache.  ``page_numbers``
+    maps positions to PDF page numbers so unrenderable pages can be left
+    out.
+    """
+
+    def __init__(self, path, page_numbers, loader) -> None:
+        self.path = path
+        self.page_numbers = list(page_numbers)
+        self._loader = loader
+
+    def __len__(self) -> int:
+        return len(self.page_numbers)
+
+    def __getitem__(self, index: int):
+        return self._loader(self.path, self.page_numbers[index])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class HealthServer:
+    """Minimal HTTP endpoint reporting the board's health and metrics.
+
+    The server runs on a daemon thread and never touches Tk: ``status`` is
+    a callable returning the latest status dictionary published by the Tk
+    thread, which is combined with the global METRICS and the process RSS.
+
+    * ``GET /health`` returns JSON, with status 503 once the Tk loop has not
+      published a heartbeat for ``stale_after`` seconds.  The age of the
+      last frame is reported too, but a paused board or a single-page
+      rotation that draws nothing new is still healthy.
+    * ``GET /metrics`` returns the same data in Prometheus text format.
+
+    Pass ``port=0`` to bind an ephemeral port (see :attr:`port`).
+    """
+
+    def __init__(self, host: str, port: int, status, stale_after: float = 60.0) -> None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path in ("/", "/health"):
+                    report = server.report()
+                    body = json.dumps(report, indent=2).encode("utf-8")
+                    code = 200 if report["status"] == "ok" else 503
+                    ctype = "application/json"
+                elif path == "/metrics":
+                    body = server.prometheus().encode("utf-8")
+                    code = 200
+                    ctype = "text/plain; version=0.0.4"
+                else:
+                    body = b"not found\n"
+                    code = 404
+                    ctype = "text/plain"
+                self.send_response(code)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                logging.debug("health: " + fmt, *args)
+
+        self.status = status
+        self.stale_after = stale_after
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.host, self.port = self.httpd.server_address[:2]
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="health-http", daemon=True)
+        self._thread.start()
+        logging.info("Health endpoint listening on http://%s:%d/health", self.host, self.port)
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def report(self) -> dict:
+        """Assemble the health report (called on the server thread)."""
+        status = dict(self.status() or {})
+        counters = METRICS.snapshot()
+        last_frame = status.pop("last_frame", None)
+        heartbeat = status.pop("heartbeat", None)
+        since = (time.time() - last_frame) if last_frame else None
+        alive = heartbeat is not None and time.time() - heartbeat <= self.stale_after
+        hit_rates = {}
+        for cache in ("page_cache", "fitted_cache", "doc_pool"):
+            hits = counters.get(f"{cache}_hits", 0)
+            misses = counters.get(f"{cache}_misses", 0)
+            hit_rates[cache] = round(hits / (hits + misses), 4) if hits + misses else None
+        return {
+            "status": "ok" if alive else "stale",
+            "seconds_since_last_frame": None if since is None else round(since, 3),
+            **status,
+            "rss_bytes": _rss_bytes(),
+            "cache_hit_rates": hit_rates,
+            "counters": counters,
+            "histograms_ms": {
+                name: {
+                    "buckets": dict(zip([str(b) for b in Metrics.BUCKETS_MS] + ["+Inf"], h["buckets"])),
+                    "count": h["count"],
+                    "sum": round(h["sum"], 3),
+                }
+                for name, h in METRICS.histogram_snapshot().items()
+            },
+        }
+
+    def prometheus(self) -> str:
+        """Render :meth:`report` in the Prometheus text exposition format."""
+        report = self.report()
+        lines = [f"digiboard_up {1 if report['status'] == 'ok' else 0}"]
+        if report["seconds_since_last_frame"] is not None:
+            lines.append(f"digiboard_seconds_since_last_frame {report['seconds_since_last_frame']}")
+        for key in (
+            "file_index",
+            "page",
+            "notices",
+            "rss_bytes",
+            "open_documents",
+            "memory_budget_bytes",
+            "cache_warm_percent",
+        ):
+            if isinstance(report.get(key), (int, float)):
+                lines.append(f"digiboard_{key} {report[key]}")
+        for cache, nbytes in report.get("cache_bytes", {}).items():
+            lines.append(f'digiboard_cache_bytes{{cache="{cache}"}} {nbytes}')
+        for cache, rate in report["cache_hit_rates"].items():
+            if rate is not None:
+                lines.append(f'digiboard_cache_hit_ratio{{cache="{cache}"}} {rate}')
+        for name, value in sorted(report["counters"].items()):
+            lines.append(f"digiboard_{name}_total {value}")
+        for name, h in METRICS.histogram_snapshot().items():
+            cumulative = 0
+            for bound, count in zip([str(b) for b in Metrics.BUCKETS_MS] + ["+Inf"], h["buckets"]):
+                cumulative += count
+                lines.append(f'digiboard_{name}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f"digiboard_{name}_count {h['count']}")
+            lines.append(f"digiboard_{name}_sum {h['sum']:.3f}")
+        return "\n".join(lines) + "\n"
+
+
+def _stall_site(frame) -> str:
+    """Describe where a stalled main thread is executing.
+
+    The innermost frame belonging to this script is reported together with
+    the innermost frame overall (typically the library call that blocks,
+    such as ``Image.resize`` or a PyMuPDF render).
+    """
+    inner = frame
+    own = None
+    this_file = os.path.normcase(os.path.abspath(__file__))
+    f = frame
+    while f is not None:
+        if os.path.normcase(os.path.abspath(f.f_code.co_filename)) == this_file:
+            own = f
+            break
+        f = f.f_back
+    inner_desc = f"{Path(inner.f_code.co_filename).name}:{inner.f_code.co_name}"
+    if own is None:
+        return inner_desc
+    own_desc = f"{own.f_code.co_name} (line {own.f_lineno})"
+    return own_desc if own is inner else f"{own_desc} -> {inner_desc}"
+
+
+class StallWatchdog:
+    """Detect stalls of the Tk main loop and find out what caused them.
+
+    A heartbeat callback reschedules itself every ``heartbeat_ms`` on the
+    Tk loop and records when it last ran, along with how late it was.  A
+    background thread checks the heartbeat; once it is more than
+    ``threshold_ms`` overdue, the thread samples the main thread's stack
+    every ``sample_ms`` until the loop recovers.  The stall is then logged
+    with its duration and the most frequently sampled call site.  Stalls
+    are aggregated per site and a ranking is logged every
+    ``summary_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        root,
+        threshold_ms: float = 1000,
+        heartbeat_ms: int = 100,
+        sample_ms: int = 50,
+        summary_interval: float = 3600,
+    ) -> None:
+        self.root = root
+        self.threshold = threshold_ms / 1000.0
+        self.heartbeat_ms = heartbeat_ms
+        self.sample_interval = sample_ms / 1000.0
+        self.summary_interval = summary_interval
+        self.main_ident = threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._after_id = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        # site -> [count, total seconds, longest seconds]
+        self.stats: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        self._last_beat = time.monotonic()
+        self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+        self._thread = threading.Thread(target=self._monitor, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _beat(self) -> None:
+        now = time.monotonic()
+        lag = now - self._last_beat - self.heartbeat_ms / 1000.0
+        METRICS.observe("loop_lag_ms", max(0.0, lag) * 1000)
+        self._last_beat = now
+        if not self._stop.is_set():
+            self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+
+    def _sample(self) -> str | None:
+        frame = sys._current_frames().get(self.main_ident)
+        if frame is None:
+            return None
+        try:
+            return _stall_site(frame)
+        finally:
+            del frame
+
+    def _monitor(self) -> None:
+        next_summary = time.monotonic() + self.summary_interval
+        while not self._stop.wait(self.sample_interval):
+            beat = self._last_beat
+            if time.monotonic() - beat > self.threshold:
+                self._record_stall(beat)
+            if self.summary_interval > 0 and time.monotonic() >= next_summary:
+                next_summary = time.monotonic() + self.summary_interval
+                summary = self.summary()
+                if summary:
+                    logging.info("%s", summary)
+
+    def _record_stall(self, beat: float) -> None:
+        samples: dict[str, int] = defaultdict(int)
+        # Keep sampling until the heartbeat runs again
+        while self._last_beat == beat and not self._stop.is_set():
+            site = self._sample()
+            if site is not None:
+                samples[site] += 1
+            time.sleep(self.sample_interval)
+        end = self._last_beat if self._last_beat != beat else time.monotonic()
+        duration = max(0.0, end - beat - self.heartbeat_ms / 1000.0)
+        if not samples:
+            return
+        site = max(samples, key=samples.get)
+        with self._lock:
+            entry = self.stats.setdefault(site, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+        METRICS.incr("stalls")
+        METRICS.observe("stall_ms", duration * 1000)
+        others = ", ".join(f"{s} ({n})" for s, n in sorted(samples.items(), key=lambda kv: -kv[1])[1:4])
+        logging.warning(
+            "UI stalled for %.2f s in %s%s",
+            duration,
+            site,
+            f"; also sampled: {others}" if others else "",
+        )
+
+    def summary(self) -> str:
+        """Ranking of stall sites by total time lost."""
+        with self._lock:
+            ranked = sorted(self.stats.items(), key=lambda kv: -kv[1][1])
+        if not ranked:
+            return ""
+        lines = [
+            "Stall summary: %d stalls, %.1f s in total"
+            % (sum(v[0] for _, v in ranked), sum(v[1] for _, v in ranked))
+        ]
+        for site, (count, total, longest) in ranked[:10]:
+            lines.append(f"  {total:7.2f} s  {count:4d}x  max {longest:5.2f} s  {site}")
+        return "\n".join(lines)
+
+
+class RenderTimeout(RuntimeError):
+    """A page took longer than the render time limit."""
+
+
+class RenderCrash(RuntimeError):
+    """The render worker process died while rendering a page."""
+
+
+class RenderWorkerUnavailable(RuntimeError):
+    """The render worker process could not be started.
+
+    Unlike :class:`RenderCrash` this says nothing about the page, so it is
+    never quarantined; callers render in-process instead.
+    """
+
+
+# PIL modes for PyMuPDF pixmaps, by (colour components, alpha)
+_PIXMAP_MODES = {(1, 0): "L", (1, 1): "LA", (3, 0): "RGB", (3, 1): "RGBA", (4, 0): "CMYK", (4, 1): "CMYKA"}
+
+
+def _pixmap_mode(pix) -> str:
+    mode = _PIXMAP_MODES.get((pix.n - pix.alpha, int(bool(pix.alpha))))
+    if mode is None:
+        raise ValueError(f"unsupported pixmap with {pix.n} components")
+    return mode
+
+
+def _samples_to_image(mode: str, width: int, height: int, stride: int, samples):
+    """Turn raw pixmap samples into a displayable PIL image.
+
+    ``frombuffer`` uses the samples in place when PIL's memory layout
+    matches (``L`` and ``RGBA``); ``RGB`` is unpacked straight from the
+    buffer without an intermediate ``bytes`` copy.  Alpha is flattened
+    onto white and CMYK converted to RGB, so callers always get ``L`` or
+    ``RGB``.
+    """
+    raw_mode = mode
+    if mode == "CMYKA":
+        # PIL has no CMYK-with-alpha mode; drop the alpha channel
+        mode, raw_mode = "CMYK", "CMYKX"
+    img = Image.frombuffer(mode, (width, height), samples, "raw", raw_mode, stride, 1)
+    if mode in ("LA", "RGBA"):
+        flat = Image.new(mode[:-1] if mode == "LA" else "RGB", img.size, "white")
+        flat.paste(img, mask=img.getchannel("A"))
+        img = flat
+    elif mode == "CMYK":
+        img = img.convert("RGB")
+    return img
+
+
+def _pixmap_to_image(pix):
+    """Wrap a PyMuPDF pixmap as a PIL image, without copying where possible."""
+    img = _samples_to_image(_pixmap_mode(pix), pix.width, pix.height, pix.stride, pix.samples_mv)
+    if img.readonly:
+        # The image maps the pixmap's memory, which is freed with the
+        # pixmap; keep it alive for as long as the image.
+        img.pixmap = pix
+    return img
+
+
+def _render_pixmap(page, scale: float = 1.0, gray: bool = False):
+    """Rasterise a page as opaque RGB, or as 8-bit grayscale if ``gray``."""
+    colorspace = fitz.csGRAY if gray else fitz.csRGB
+    matrix = fitz.Matrix(scale, scale) if scale != 1.0 else fitz.Identity
+    return page.get_pixmap(matrix=matrix, colorspace=colorspace, alpha=False)
+
+
+def _is_grayscale(img) -> bool:
+    """True if every pixel of an RGB image has equal channels."""
+    if img.mode == "L":
+        return True
+    if img.mode != "RGB":
+        return False
+    from PIL import ImageChops
+
+    r, g, b = img.split()
+    return ImageChops.difference(r, g).getbbox() is None and ImageChops.difference(g, b).getbbox() is None
+
+
+# Image files shown as single-page notices next to the PDFs
+_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tif", ".tiff"}
+
+
+def _is_image_notice(path) -> bool:
+    return Path(path).suffix.lower() in _IMAGE_SUFFIXES
+
+
+# A directory of pages pre-rendered by a frame server (p0001.png, ...,
+# thumbnails t0001.png, ... and the page text in text.json), mirrored by
+# FrameClient.  It is shown as one multi-page notice.
+_FRAME_SET_SUFFIX = ".frames"
+
+
+def _is_frame_set(path) -> bool:
+    return Path(path).suffix.lower() == _FRAME_SET_SUFFIX
+
+
+def _frame_set_pages(path) -> list[Path]:
+    return sorted(Path(path).glob("p[0-9][0-9][0-9][0-9].png"))
+
+
+def _load_image_notice(path, max_size: tuple[int, int]):
+    """Decode an image notice to at most ``max_size``, as ``L`` or ``RGB``.
+
+    JPEGs are decoded in draft mode, which lets libjpeg produce a 1/2, 1/4
+    or 1/8 scale image directly instead of the full-resolution bitmap.
+    Anything still larger than ``max_size`` is downsampled before the EXIF
+    orientation is applied, so large posters never stay in memory at full
+    size.  Transparency is flattened onto white.
+    """
+    from PIL import ImageOps
+
+    with Image.open(path) as img:
+        # Quarter turns swap width and height
+        if img.getexif().get(0x0112) in (5, 6, 7, 8):
+            max_size = (max_size[1], max_size[0])
+        if img.format == "JPEG":
+            img.draft("L" if img.mode == "L" else "RGB", max_size)
+        img.thumbnail(max_size, Image.LANCZOS)
+        img = ImageOps.exif_transpose(img)
+    if img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        rgba = img.convert("RGBA")
+        img = Image.new("RGB", rgba.size, "white")
+        img.paste(rgba, mask=rgba.getchannel("A"))
+    elif img.mode == "1":
+        img = img.convert("L")
+    elif img.mode not in ("L", "RGB"):
+        img = img.convert("RGB")
+    return img
+
+
+def _render_worker_main(conn) -> None:
+    """Entry point of the render worker process.
+
+    Receives ``(path, page_number, scale, gray)`` requests and answers with
+    ``("ok", mode, width, height, stride)`` followed by the samples as a
+    separate message (sent straight from the pixmap's memory), or with an
+    error description.  A negative ``scale`` asks for a page ``-scale``
+    pixels high.  ``None`` asks it to exit.
+    """
+    _require_heavy()
+    pool = DocumentPool(4)
+    conn.send(("ready",))
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+        path, page_num, scale, gray = request
+        try:
+            page = pool.get(path)[page_num]
+            if scale < 0:
+                scale = -scale / max(1.0, page.rect.height)
+            pix = _render_pixmap(page, scale, gray)
+            header = ("ok", _pixmap_mode(pix), pix.width, pix.height, pix.stride)
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+            continue
+        conn.send(header)
+        conn.send_bytes(pix.samples_mv)
+
+
+class RenderWorker:
+    """Supervised child process that renders pages with a time limit.
+
+    MuPDF can hang on pathological vector content or crash outright on a
+    malformed file.  Running it in a separate process means such a page
+    costs at most ``timeout`` seconds on the Tk thread: a worker that does
+    not answer in time is killed (:class:`RenderTimeout`), one that dies
+    is detected (:class:`RenderCrash`), and in both cases a fresh worker
+    is started for the next request.  A worker that cannot be started
+    raises :class:`RenderWorkerUnavailable`.  Ordinary rendering errors are
+    raised as ``RuntimeError``.
+    """
+
+    def __init__(self, timeout: float = 20.0, startup_timeout: float = 60.0) -> None:
+        import multiprocessing
+
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self._ctx = multiprocessing.get_context("spawn")
+        self._proc = None
+        self._conn = None
+        self._ready = False
+        self._started = False
+
+    def start(self) -> None:
+        """Launch the worker without waiting for it to finish starting up."""
+        parent_conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(
+            target=_render_worker_main,
+            args=(child_conn,),
+            name="render-worker",
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        self._proc, self._conn, self._ready = proc, parent_conn, False
+
+    def _ensure_ready(self) -> None:
+        if self._proc is None or not self._proc.is_alive():
+            if self._started:
+                # Counted here only, whether the worker was killed or died
+                METRICS.incr("render_worker_restarts")
+                if self._proc is not None:
+                    logging.warning("Restarting render worker (exit code %s)", self._proc.exitcode)
+            self.start()
+            self._started = True
+        if self._ready:
+            return
+        if not self._conn.poll(self.startup_timeout):
+            self._kill()
+            raise RenderWorkerUnavailable("render worker did not start")
+        try:
+            self._conn.recv()
+        except (EOFError, OSError) as exc:
+            self._kill()
+            raise RenderWorkerUnavailable(f"render worker failed to start: {exc}") from exc
+        self._ready = True
+
+    def render(self, path, page_num: int, scale: float = 1.0, gray: bool = False):
+        """Render a page in the worker and return it as a PIL image."""
+        self._ensure_ready()
+        try:
+            self._conn.send((str(path), page_num, scale, gray))
+            if not self._conn.poll(self.timeout):
+                self._kill()
+                raise RenderTimeout(f"no result after {self.timeout:g} s")
+            reply = self._conn.recv()
+            if reply[0] == "error":
+                raise RuntimeError(reply[1])
+            samples = self._conn.recv_bytes()
+        except (EOFError, OSError) as exc:
+            exitcode = self._proc.exitcode if self._proc is not None else None
+            self._kill()
+            raise RenderCrash(f"render worker died (exit code {exitcode})") from exc
+        _status, mode, width, height, stride = reply
+        return _samples_to_image(mode, width, height, stride, samples)
+
+    def _kill(self) -> None:
+        proc, self._proc, self._ready = self._proc, None, False
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+        if proc is not None and proc.is_alive():
+            proc.kill()
+            proc.join(5)
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except Exception:
+                pass
+        if self._proc is not None:
+            self._proc.join(2)
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.is_alive():
+            proc.kill()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class Quarantine:
+    """Persisted record of pages that hung or crashed the renderer.
+
+    Entries are keyed by path, modification time and page number, so a
+    notice that is replaced with a fixed version is tried again.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        # The overview thumbnailer adds entries from its own thread
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.entries = data
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            logging.warning("Ignoring unreadable quarantine list %s: %s", path, exc)
+        # Forget entries for files that were removed or changed since
+        stale = [k for k, v in self.entries.items() if not self._current(v)]
+        for key in stale:
+            del self.entries[key]
+
+    @staticmethod
+    def _current(entry: dict) -> bool:
+        try:
+            return os.stat(entry["path"]).st_mtime_ns == entry["mtime_ns"]
+        except Exception:
+            return False
+
+    @staticmethod
+    def _key(path, page_num: int) -> str | None:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return f"{path}|{mtime}|{page_num}"
+
+    def contains(self, path, page_num: int) -> bool:
+        key = self._key(path, page_num)
+        return key is not None and key in self.entries
+
+    def add(self, path, page_num: int, reason: str) -> None:
+        key = self._key(path, page_num)
+        if key is None:
+            return
+        with self._lock:
+            self.entries[key] = {
+                "path": str(path),
+                "mtime_ns": os.stat(path).st_mtime_ns,
+                "page": page_num,
+                "reason": reason,
+                "when": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            METRICS.incr("pages_quarantined")
+            try:
+                _write_json_atomic(self.path, dict(self.entries))
+            except Exception as exc:
+                logging.warning("Could not save quarantine list %s: %s", self.path, exc)
+
+
+def _placeholder_page(size: tuple[int, int] = (842, 595), text: str = "This page could not be displayed"):
+    """Return a plain page with a short message, shown instead of a broken page."""
+    from PIL import ImageDraw
+
+    img = Image.new("RGB", size, "#F0F0F0")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((0, 0, size[0] - 1, size[1] - 1), outline="#C0C0C0", width=3)
+    left, top, right, bottom = draw.textbbox((0, 0), text)
+    draw.text(((size[0] - (right - left)) // 2, (size[1] - (bottom - top)) // 2), text, fill="#606060")
+    return img
+
+
+class RenderCostStats:
+    """Measured render time and size of every page, persisted between runs.
+
+    Render times are smoothed with an exponential moving average.  Entries
+    remember the file's modification time and are reset when it changes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.pages: dict[str, dict] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.pages = data
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            logging.warning("Ignoring unreadable render cost file %s: %s", path, exc)
+
+    @staticmethod
+    def _key(path, page_num: int) -> str:
+        return f"{path}|{page_num}"
+
+    def record(self, path, page_num: int, ms: float, nbytes: int, gray: bool | None = None) -> None:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        key = self._key(path, page_num)
+        with self._lock:
+            entry = self.pages.get(key)
+            if entry is None or entry.get("mtime_ns") != mtime:
+                entry = {"path": str(path), "page": page_num, "mtime_ns": mtime, "ms": ms, "renders": 0}
+                self.pages[key] = entry
+            else:
+                entry["ms"] = 0.7 * entry["ms"] + 0.3 * ms
+            entry["bytes"] = int(nbytes)
+            entry["renders"] += 1
+            if gray is not None:
+                entry["gray"] = gray
+            self._dirty = True
+
+    def _current(self, path, page_num: int) -> dict | None:
+        """Return the entry for a page, unless the file changed since."""
+        entry = self.pages.get(self._key(path, page_num))
+        if entry is None:
+            return None
+        try:
+            if os.stat(path).st_mtime_ns != entry.get("mtime_ns"):
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def is_gray(self, path, page_num: int) -> bool | None:
+        """Whether the page rendered without colour last time (None if unknown)."""
+        entry = self._current(path, page_num)
+        return entry.get("gray") if entry else None
+
+    def cost_ms(self, path, page_num: int) -> float | None:
+        entry = self._current(path, page_num)
+        return entry["ms"] if entry else None
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self.pages)
+            self._dirty = False
+        try:
+            _write_json_atomic(self.path, data)
+        except Exception as exc:
+            logging.warning("Could not save render costs %s: %s", self.path, exc)
+
+    def report(self, top: int = 10) -> str:
+        """List the ``top`` notices with the highest total render time."""
+        per_file: dict[str, list] = {}
+        for entry in self.pages.values():
+            if not os.path.exists(entry["path"]):
+                continue
+            agg = per_file.setdefault(entry["path"], [0.0, 0.0, 0, 0])
+            agg[0] += entry["ms"]
+            agg[1] = max(agg[1], entry["ms"])
+            agg[2] += 1
+            agg[3] += entry.get("bytes", 0)
+        ranked = sorted(per_file.items(), key=lambda kv: -kv[1][0])[:top]
+        if not ranked:
+            return "Render costs: nothing recorded yet"
+        lines = [f"Top {len(ranked)} most expensive notices to render:"]
+        for path, (total, worst, pages, nbytes) in ranked:
+            lines.append(
+                f"  {total:9.0f} ms total  {worst:8.0f} ms worst page  {pages:4d} pages  "
+                f"{nbytes / (1024 * 1024):6.1f} MB  {Path(path).name}"
+            )
+        return "\n".join(lines)
+
+
+class DiskCache:
+    """Directory of rendered images keyed by source file, mtime and variant.
+
+    The key includes the source's modification time, so entries for a
+    changed notice are simply never looked up again and age out when the
+    cache is pruned down to ``max_bytes`` (oldest files first).  Writes
+    happen on a background thread.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.directory = directory
+        self.max_bytes = max(0, int(max_bytes))
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def _file(self, path, variant: str) -> Path | None:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        name = hashlib.blake2b(f"{path}|{mtime}|{variant}".encode("utf-8"), digest_size=16).hexdigest()
+        return self.directory / name[:2] / f"{name}.png"
+
+    def contains(self, path, variant: str) -> bool:
+        target = self._file(path, variant)
+        return target is not None and target.exists()
+
+    def get(self, path, variant: str):
+        """Return the cached image, or None."""
+        target = self._file(path, variant)
+        if target is None or not target.exists():
+            return None
+        try:
+            with Image.open(target) as img:
+                img.load()
+                return img.copy() if img.mode != "P" else img.convert("RGB")
+        except Exception as exc:
+            logging.warning("Discarding unreadable cache file %s: %s", target, exc)
+            try:
+                target.unlink()
+            except OSError:
+                pass
+            return None
+
+    def put(self, path, variant: str, img) -> None:
+        """Store ``img`` in the background."""
+        target = self._file(path, variant)
+        if target is None or not self.max_bytes:
+            return
+        self._writer.submit(self._write, target, img)
+
+    def _write(self, target: Path, img) -> None:
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(".tmp")
+            img.save(tmp, "PNG", compress_level=1)
+            os.replace(tmp, target)
+            self.adopt(target)
+        except Exception as exc:
+            logging.warning("Could not write cache file %s: %s", target, exc)
+
+    def discard(self, path, variant: str) -> None:
+        """Delete an entry, if present."""
+        target = self._file(path, variant)
+        if target is None:
+            return
+        try:
+            size = target.stat().st_size
+            target.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size -= size
+
+    def target(self, path, variant: str) -> Path | None:
+        """Return the file an entry is stored in, for writers in other processes."""
+        return self._file(path, variant)
+
+    def adopt(self, target: Path) -> None:
+        """Account for a file written to ``target``, pruning if over budget."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(f.stat().st_size for f in self.directory.rglob("*.png"))
+            else:
+                self._size += target.stat().st_size
+            over = self._size > self.max_bytes
+        if over:
+            self._prune()
+
+    def _prune(self) -> None:
+        files = []
+        for f in self.directory.rglob("*.png"):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, f))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_bytes * 0.8)
+        for _mtime, size, f in files:
+            if total <= target:
+                break
+            try:
+                f.unlink()
+                total -= size
+            except OSError:
+                pass
+        with self._lock:
+            self._size = total
+
+    def close(self) -> None:
+        self._writer.shutdown(wait=True)
+
+
+def _ease_out_cubic(t: float) -> float:
+    return 1.0 - (1.0 - t) ** 3
+
+
+def _ease_pulse(t: float) -> float:
+    """Rise to 1 at the midpoint and fall back to 0."""
+    return math.sin(math.pi * t)
+
+
+class Animator:
+    """Run named, time-based animations from a single Tk timer.
+
+    Each animation interpolates a value over a duration using an easing
+    function and hands it to an ``apply`` callback.  Progress is computed
+    from the elapsed time, not from a count of steps, so a busy event loop
+    simply skips intermediate frames (counted as ``animation_frames_dropped``)
+    and the animation still ends on time.  Starting an animation under a
+    name that is already running retargets it: the new animation starts
+    from the value the old one had reached.
+    """
+
+    def __init__(self, root, clock=time.perf_counter, frame_ms: int = 16) -> None:
+        self.root = root
+        self.clock = clock
+        self.frame_ms = max(1, int(frame_ms))
+        self._running: dict[str, dict] = {}
+        self._timer = None
+        self._last_tick = 0.0
+
+    def animate(self, name, start, end, duration_ms, apply, easing=_ease_out_cubic, on_done=None) -> None:
+        """Animate ``name`` from ``start`` to ``end``.
+
+        ``start=None`` continues from the current value of a running
+        animation of the same name (or jumps to ``end`` if there is none).
+        """
+        current = self.value(name)
+        if start is None:
+            start = end if current is None else current
+        if duration_ms <= 0:
+            self.cancel(name)
+            apply(end)
+            if on_done is not None:
+                on_done()
+            return
+        self._running[name] = {
+            "start": float(start),
+            "end": float(end),
+            "t0": self.clock(),
+            "duration": duration_ms / 1000.0,
+            "apply": apply,
+            "easing": easing,
+            "on_done": on_done,
+            "value": float(start),
+        }
+        if self._timer is None:
+            self._last_tick = self.clock()
+            self._timer = self.root.after(self.frame_ms, self._tick)
+
+    def value(self, name):
+        anim = self._running.get(name)
+        return anim["value"] if anim else None
+
+    def cancel(self, name) -> None:
+        self._running.pop(name, None)
+
+    def cancel_all(self) -> None:
+        self._running.clear()
+        if self._timer is not None:
+            try:
+                self.root.after_cancel(self._timer)
+            except Exception:
+                pass
+            self._timer = None
+
+    def _tick(self) -> None:
+        self._timer = None
+        now = self.clock()
+        late = (now - self._last_tick) * 1000.0 / self.frame_ms
+        if late >= 2:
+            METRICS.incr("animation_frames_dropped", int(late) - 1)
+        self._last_tick = now
+        for name, anim in list(self._running.items()):
+            t = min(1.0, (now - anim["t0"]) / anim["duration"])
+            eased = anim["easing"](t)
+            anim["value"] = anim["start"] + (anim["end"] - anim["start"]) * eased
+            try:
+                anim["apply"](anim["value"])
+            except Exception as exc:
+                logging.debug("Animation %s failed: %s", name, exc)
+                t = 1.0
+            if t >= 1.0 and self._running.get(name) is anim:
+                del self._running[name]
+                if anim["on_done"] is not None:
+                    try:
+                        anim["on_done"]()
+                    except Exception as exc:
+                        logging.debug("Animation %s completion failed: %s", name, exc)
+        METRICS.incr("animation_frames")
+        if self._running:
+            self._timer = self.root.after(self.frame_ms, self._tick)
+
+
+class Playlist:
+    """The order in which pages are shown, as (file index, page index) pairs.
+
+    Pages are referenced, never copied, so a playlist over thousands of
+    pages is just a list of small tuples plus a reverse index for O(1)
+    seeking.  In sequential mode the pages run file by file.  With
+    ``shuffle`` all pages of all files are interleaved in random order and
+    reshuffled at the start of every cycle; the next cycle's order is drawn
+    as soon as anyone looks past the end (see :meth:`upcoming`), so a
+    prefetcher sees the same pages that will actually be shown.  The order
+    is only built when first used.
+    """
+
+    def __init__(self, page_counts: list[int], shuffle: bool = False, rng=None) -> None:
+        self.page_counts = list(page_counts)
+        self.shuffle = shuffle
+        self.rng = rng or random.Random()
+        self.position = 0
+        # Number of completed cycles; changes whenever the order changes
+        self.cycle = 0
+        self._entries: list[tuple[int, int]] | None = None
+        self._index: dict[tuple[int, int], int] = {}
+        self._next_entries: list[tuple[int, int]] | None = None
+
+    def _draw(self) -> list[tuple[int, int]]:
+        entries = [(f, p) for f, count in enumerate(self.page_counts) for p in range(count)]
+        if self.shuffle:
+            self.rng.shuffle(entries)
+        return entries
+
+    def _set_entries(self, entries: list[tuple[int, int]]) -> None:
+        self._entries = entries
+        self._index = {entry: i for i, entry in enumerate(entries)}
+
+    @property
+    def entries(self) -> list[tuple[int, int]]:
+        if self._entries is None:
+            self._set_entries(self._draw())
+        return self._entries
+
+    def __len__(self) -> int:
+        return sum(self.page_counts)
+
+    def current(self) -> tuple[int, int] | None:
+        entries = self.entries
+        return entries[self.position] if entries else None
+
+    def index_of(self, file_index: int, page_index: int) -> int | None:
+        self.entries
+        return self._index.get((file_index, page_index))
+
+    def seek(self, file_index: int, page_index: int) -> None:
+        """Make (file_index, page_index) the current entry, if it exists."""
+        pos = self.index_of(file_index, page_index)
+        if pos is not None:
+            self.position = pos
+
+    def restore(self, entries: list[tuple[int, int]], position: int = 0) -> None:
+        """Adopt a saved order, provided it covers exactly the same pages."""
+        entries = [tuple(e) for e in entries]
+        if sorted(entries) != sorted(self._draw()):
+            raise ValueError("saved playlist does not match the notices")
+        self._set_entries(entries)
+        self._next_entries = None
+        self.position = min(max(0, position), len(entries) - 1)
+
+    def _draw_next(self) -> list[tuple[int, int]]:
+        entries = self._draw()
+        # Avoid showing the same page twice in a row across cycles
+        if len(entries) > 1 and entries[0] == self.entries[-1]:
+            entries[0], entries[-1] = entries[-1], entries[0]
+        return entries
+
+    def _new_cycle(self) -> None:
+        if self.shuffle:
+            self._set_entries(self._next_entries or self._draw_next())
+        self._next_entries = None
+        self.cycle += 1
+
+    def next(self) -> tuple[int, int] | None:
+        entries = self.entries
+        if not entries:
+            return None
+        self.position += 1
+        if self.position >= len(entries):
+            self.position = 0
+            self._new_cycle()
+        return self.current()
+
+    def previous(self) -> tuple[int, int] | None:
+        entries = self.entries
+        if not entries:
+            return None
+        self.position = (self.position - 1) % len(entries)
+        return self.current()
+
+    def upcoming(self, count: int) -> list[tuple[int, int]]:
+        """Return the next ``count`` entries without moving."""
+        entries = self.entries
+        result = []
+        for i in range(self.position + 1, self.position + 1 + min(count, len(entries))):
+            if i < len(entries):
+                result.append(entries[i])
+            else:
+                if self.shuffle and self._next_entries is None:
+                    self._next_entries = self._draw_next()
+                following = self._next_entries if self.shuffle else entries
+                result.append(following[i - len(entries)])
+        return result
+
+
+def _find_logo_file() -> Path | None:
+    """Return the image named by ``LOGO_PATH`` (or the first one in it)."""
+    if LOGO_PATH is None:
+        return None
+    try:
+        if not LOGO_PATH.exists():
+            return None
+        if not LOGO_PATH.is_dir():
+            return LOGO_PATH
+        for pattern in ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.bmp"):
+            files = list(LOGO_PATH.glob(pattern))
+            if files:
+                return files[0]
+    except Exception as exc:
+        logging.warning("Could not look up logo in %s: %s", LOGO_PATH, exc)
+    return None
+
+
+def _clock_text(show_date: bool) -> str:
+    """The clock text of the top bar, in 12-hour format."""
+    # 12-hour time string, stripping any leading zero from the hour
+    time_str = time.strftime("%I:%M:%S %p").lstrip("0")
+    if not show_date:
+        return time_str
+    # Day of week and date (e.g., "Wednesday, Aug 21 2025")
+    return f"{time_str}\n{time.strftime('%A, %b %d %Y')}"
+
+
+def _fit_scale(fit_mode: str, img_w: int, img_h: int, area_w: int, area_h: int) -> float:
+    """Scale factor that fits an ``img_w`` x ``img_h`` page to the area."""
+    if fit_mode == "fit_width":
+        return area_w / img_w if img_w else 1.0
+    if fit_mode == "fit_height":
+        return area_h / img_h if img_h else 1.0
+    if fit_mode == "fit_page" and img_w and img_h:
+        return min(area_w / img_w, area_h / img_h)
+    return 1.0
+
+
+class PageThumbnailer:
+    """Render small images of individual pages on a background thread.
+
+    The overview grid says which pages it currently shows with
+    :meth:`want`; only those are rendered, most recently requested first,
+    at ``height`` pixels.  Results are kept in memory and in the disk cache,
+    so reopening the overview or restarting is cheap.  The thread only
+    touches PyMuPDF and PIL; the Tk side collects results with
+    :meth:`take_finished`.  With ``render_timeout`` set, PDF pages are
+    rendered by a RenderWorker of its own, and pages that hang or crash it
+    are quarantined like those of the main display.
+    """
+
+    def __init__(
+        self,
+        disk_cache: DiskCache,
+        height: int,
+        quarantine: Quarantine,
+        render_timeout: float | None = None,
+    ) -> None:
+        self.disk_cache = disk_cache
+        self.height = max(16, int(height))
+        self.quarantine = quarantine
+        self.render_timeout = render_timeout
+        self._worker: RenderWorker | None = None
+        self.images: dict[tuple[str, int], object] = {}
+        self._wanted: list[tuple[str, int]] = []
+        self._finished: list[tuple[str, int]] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread: threading.Thread | None = None
+
+    def get(self, key: tuple[str, int]):
+        with self._lock:
+            return self.images.get(key)
+
+    def discard(self, key: tuple[str, int]) -> None:
+        with self._lock:
+            self.images.pop(key, None)
+
+    def want(self, keys: list[tuple[str, int]]) -> None:
+        """Replace the queue with ``keys`` (those not available yet)."""
+        with self._lock:
+            self._wanted = [k for k in keys if k not in self.images]
+        if self._wanted:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop = False
+                self._thread = threading.Thread(target=self._run, name="page-thumbnails", daemon=True)
+                self._thread.start()
+            self._wake.set()
+
+    def take_finished(self) -> list[tuple[str, int]]:
+        with self._lock:
+            finished, self._finished = self._finished, []
+        return finished
+
+    def stop(self) -> None:
+        self._stop = True
+        self._wake.set()
+
+    def _render(self, doc, page_num: int):
+        page = doc[page_num]
+        scale = self.height / max(1.0, page.rect.height)
+        return _pixmap_to_image(_render_pixmap(page, scale))
+
+    def _render_isolated(self, path, page_num: int):
+        """Render a thumbnail in the worker; None if the worker cannot start."""
+        if self._worker is None:
+            self._worker = RenderWorker(timeout=self.render_timeout)
+        try:
+            return self._worker.render(path, page_num, -float(self.height))
+        except RenderWorkerUnavailable as exc:
+            logging.warning("Rendering thumbnails in-process: %s", exc)
+            self._worker.stop()
+            self._worker, self.render_timeout = None, None
+            return None
+        except (RenderTimeout, RenderCrash) as exc:
+            logging.error("Quarantining page %d of %s: %s", page_num + 1, path, exc)
+            self.quarantine.add(path, page_num, str(exc))
+            img = _placeholder_page()
+            img.thumbnail((self.height * 2, self.height))
+            return img
+
+    def _run(self) -> None:
+        doc, doc_path = None, None
+        try:
+            while not self._stop:
+                with self._lock:
+                    key = self._wanted.pop(0) if self._wanted else None
+                if key is None:
+                    self._wake.wait()
+                    self._wake.clear()
+                    continue
+                path, page_num = key
+                variant = f"t{page_num}h{self.height}"
+                img = self.disk_cache.get(path, variant)
+                if img is None:
+                    try:
+                        if self.quarantine.contains(path, page_num):
+                            img = _placeholder_page()
+                            img.thumbnail((self.height * 2, self.height))
+                        else:
+                            if _is_frame_set(path):
+                                thumb = Path(path) / f"t{page_num + 1:04d}.png"
+                                if not thumb.exists():
+                                    thumb = Path(path) / f"p{page_num + 1:04d}.png"
+                                img = _load_image_notice(thumb, (self.height * 3, self.height))
+                            elif _is_image_notice(path):
+                                img = _load_image_notice(path, (self.height * 3, self.height))
+                            elif self.render_timeout is not None:
+                                img = self._render_isolated(path, page_num)
+                            if img is None:
+                                if doc_path != path:
+                                    if doc is not None:
+                                        doc.close()
+                                    doc, doc_path = fitz.open(path), path
+                                img = self._render(doc, page_num)
+                            self.disk_cache.put(path, variant, img)
+                    except Exception as exc:
+                        logging.warning("Could not render thumbnail of page %d of %s: %s", page_num + 1, path, exc)
+                        continue
+                with self._lock:
+                    self.images[key] = img
+                    self._finished.append(key)
+        finally:
+            if doc is not None:
+                doc.close()
+            if self._worker is not None:
+                self._worker.stop()
+                self._worker = None
+
+
+def _parse_time_windows(spec) -> list[tuple[int, int]]:
+    """Parse ``["22:00-06:30", ...]`` into (start, end) minutes of the day.
+
+    A window whose end is before its start runs past midnight.  Malformed
+    entries are logged and skipped.
+    """
+    if isinstance(spec, str):
+        spec = [spec]
+    windows = []
+    for item in spec or ():
+        try:
+            start, end = (
+                int(h) * 60 + int(m)
+                for h, m in (part.strip().split(":") for part in str(item).split("-"))
+            )
+            if not (0 <= start < 1440 and 0 <= end <= 1440):
+                raise ValueError
+            windows.append((start, end))
+        except ValueError:
+            logging.warning("Ignoring invalid time window %r; expected HH:MM-HH:MM", item)
+    return windows
+
+
+def _in_time_windows(windows, when: float) -> bool:
+    t = time.localtime(when)
+    minute = t.tm_hour * 60 + t.tm_min
+    for start, end in windows:
+        if start <= end:
+            if start <= minute < end:
+                return True
+        elif minute >= start or minute < end:
+            return True
+    return False
+
+
+# Validity in a notice's file name, e.g. "Open day [2026-10-01..2026-10-31].pdf"
+# or "Canteen menu [2026-10-19T06:00..].pdf".  Either end may be omitted.
+_VALIDITY_RE = re.compile(r"\[\s*([0-9T: -]*?)\s*\.\.\s*([0-9T: -]*?)\s*\]")
+
+
+def _parse_when(text, end: bool = False) -> float | None:
+    """Parse ``YYYY-MM-DD`` or ``YYYY-MM-DD[T ]HH:MM`` as local time.
+
+    A bare date used as an ``end`` means the end of that day.  Empty
+    values give None; malformed ones raise ValueError.
+    """
+    from datetime import datetime, timedelta
+
+    text = str(text or "").strip()
+    if not text:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            when = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if end and fmt == "%Y-%m-%d":
+            when += timedelta(days=1)
+        return when.timestamp()
+    raise ValueError(f"invalid date {text!r}")
+
+
+class NoticeSchedule:
+    """When each notice is shown, precomputed as a timeline of events.
+
+    A notice's validity comes from ``<pdf_dir>/schedule.json``, which maps
+    file names (relative to the folder) to ``{"start": ..., "end": ...}``,
+    or else from a ``[start..end]`` tag in its file name (see
+    ``_VALIDITY_RE``).  Notices with neither are always shown.
+
+    The start and end times of all notices are sorted once into a list of
+    ``(time, kind, path)`` events, kind being ``"prepare"`` (``lead``
+    seconds before a start), ``"start"`` or ``"end"``; :meth:`due` hands
+    them out in order as time passes.
+    """
+
+    _KIND_ORDER = {"end": 0, "prepare": 1, "start": 2}
+
+    def __init__(self, paths, directory: Path, manifest: str = "schedule.json", lead: float = 600.0, now: float | None = None) -> None:
+        self.directory = Path(directory)
+        self.lead = max(0.0, float(lead))
+        self._manifest = self._read_manifest(self.directory / manifest) if manifest else {}
+        self.windows: dict[str, tuple[float | None, float | None]] = {}
+        events = []
+        for path in paths:
+            start, end = self.window(path)
+            if start is not None:
+                events.append((start - self.lead, "prepare", str(path)))
+                events.append((start, "start", str(path)))
+            if end is not None:
+                events.append((end, "end", str(path)))
+        events.sort(key=lambda e: (e[0], self._KIND_ORDER[e[1]]))
+        self._events = events
+        self._times = [e[0] for e in events]
+        # Events up to now are reflected in is_active() already
+        self._next = bisect_left(self._times, time.time() if now is None else now)
+
+    @staticmethod
+    def _read_manifest(path: Path) -> dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as exc:
+            logging.warning("Could not read schedule %s: %s", path, exc)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def window(self, path) -> tuple[float | None, float | None]:
+        """Return the (start, end) times of a notice; None means unbounded."""
+        key = str(path)
+        known = self.windows.get(key)
+        if known is not None:
+            return known
+        path = Path(path)
+        try:
+            name = path.relative_to(self.directory).as_posix()
+        except ValueError:
+            name = path.name
+        entry = self._manifest.get(name)
+        try:
+            if isinstance(entry, dict):
+                window = (_parse_when(entry.get("start")), _parse_when(entry.get("end"), end=True))
+            else:
+                match = _VALIDITY_RE.search(path.name)
+                window = (_parse_when(match[1]), _parse_when(match[2], end=True)) if match else (None, None)
+        except ValueError as exc:
+            logging.warning("Ignoring the schedule of %s: %s", path, exc)
+            window = (None, None)
+        self.windows[key] = window
+        return window
+
+    def is_active(self, path, now: float) -> bool:
+        start, end = self.window(path)
+        return (start is None or start <= now) and (end is None or now < end)
+
+    def is_expired(self, path, now: float) -> bool:
+        end = self.window(path)[1]
+        return end is not None and end <= now
+
+    def preparing(self, now: float) -> list[str]:
+        """Notices within ``lead`` seconds of their start (prepare already past)."""
+        return [
+            path
+            for path, (start, _end) in self.windows.items()
+            if start is not None and start - self.lead <= now < start
+        ]
+
+    def next_time(self) -> float | None:
+        """Time of the next pending event, or None if there are none."""
+        return self._times[self._next] if self._next < len(self._times) else None
+
+    def due(self, now: float) -> list[tuple[str, str]]:
+        """Pop the ``(kind, path)`` events that are due at ``now``, in order."""
+        stop = bisect_left(self._times, now, lo=self._next)
+        while stop < len(self._times) and self._times[stop] <= now:
+            stop += 1
+        due = [(kind, path) for _t, kind, path in self._events[self._next:stop]]
+        self._next = stop
+        return due
+
+
+def _lower_process_priority() -> None:
+    """Process pool initializer: run at the lowest CPU priority."""
+    try:
+        if sys.platform.startswith("win"):
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), 0x40)  # IDLE_PRIORITY_CLASS
+        else:
+            os.nice(19)
+    except Exception:
+        pass
+
+
+# Document kept open between pre-warm jobs in a worker process
+_prewarm_doc: tuple | None = None
+
+
+def _prewarm_open(path: str):
+    global _prewarm_doc
+    _require_heavy()
+    if _prewarm_doc is None or _prewarm_doc[0] != path:
+        if _prewarm_doc is not None:
+            _prewarm_doc[1].close()
+        _prewarm_doc = (path, fitz.open(path))
+    return _prewarm_doc[1]
+
+
+def _prewarm_page_count(path: str) -> int:
+    if _is_image_notice(path):
+        return 1
+    return len(_prewarm_open(path))
+
+
+def _prewarm_render(path: str, page_num: int, target: str, max_size: tuple[int, int], grayscale: bool) -> int:
+    """Render one page the way the board does and save it as ``target``.
+
+    Returns the size of the file written, or 0 for image notices small
+    enough to be loaded directly (the board does not cache those).
+    """
+    if _is_image_notice(path):
+        _require_heavy()
+        with Image.open(path) as probe:
+            if probe.width <= max_size[0] and probe.height <= max_size[1]:
+                return 0
+        img = _load_image_notice(path, max_size)
+    else:
+        img = _pixmap_to_image(_render_pixmap(_prewarm_open(path)[page_num], 1.0))
+        if grayscale and _is_grayscale(img):
+            img = img.convert("L")
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(".tmp")
+    img.save(tmp, "PNG", compress_level=1)
+    os.replace(tmp, target)
+    return target.stat().st_size
+
+
+class PrewarmScheduler:
+    """Render notices into the disk cache before they are first shown.
+
+    A background thread rescans ``directory`` every ``scan_interval``
+    seconds and renders every page that is not in ``disk_cache`` yet,
+    notices that are not in the rotation (``in_rotation()``) first.  The
+    rendering happens one page at a time in a separate process at the
+    lowest CPU priority, so it never holds up the Tk thread.  Inside the
+    quiet ``windows`` pages are rendered back to back; outside them the
+    scheduler pauses after each page for as long as it took, or waits for
+    the next window when ``background`` is False.
+
+    :attr:`warm_percent` is the share of the pages in ``directory`` that
+    can be shown without rasterising (None before the first scan).
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        disk_cache: DiskCache,
+        quarantine: Quarantine,
+        screen_size: tuple[int, int],
+        windows=(),
+        background: bool = True,
+        scan_interval: float = 300.0,
+        grayscale: bool = True,
+        in_rotation=lambda: (),
+        is_wanted=lambda path: True,
+    ) -> None:
+        self.directory = Path(directory)
+        self.disk_cache = disk_cache
+        self.quarantine = quarantine
+        self.screen_size = screen_size
+        self.windows = list(windows)
+        self.background = background
+        self.scan_interval = max(10.0, float(scan_interval))
+        self.grayscale = grayscale
+        self.in_rotation = in_rotation
+        self.is_wanted = is_wanted
+        self.warm_percent: float | None = None
+        self.pages_total = 0
+        self.pages_warm = 0
+        self._counts: dict[tuple[str, int], int] = {}
+        # Pages the board never caches (small images) or that failed here
+        self._skip: set[tuple[str, int, int]] = set()
+        self._pool = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="prewarm", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._close_pool()
+
+    def _executor(self):
+        if self._pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_lower_process_priority,
+            )
+        return self._pool
+
+    def _close_pool(self, kill: bool = False) -> None:
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        if kill:
+            for process in list(getattr(pool, "_processes", {}).values()):
+                process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _call(self, fn, *args, timeout: float = 120.0):
+        from concurrent.futures import TimeoutError as FutureTimeout
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            return self._executor().submit(fn, *args).result(timeout=timeout)
+        except (FutureTimeout, BrokenProcessPool):
+            # A page that hangs or crashes the worker takes the pool with it
+            self._close_pool(kill=True)
+            raise
+
+    def _variant(self, path: Path, page_num: int) -> str:
+        if _is_image_notice(path):
+            return f"img{self.screen_size[0]}x{self.screen_size[1]}"
+        return f"p{page_num}@1"
+
+    def _set_warm(self, warm: int, total: int) -> None:
+        was_cold = self.warm_percent is not None and self.warm_percent < 100.0
+        self.pages_warm, self.pages_total = warm, total
+        self.warm_percent = round(100.0 * warm / total, 1) if total else 100.0
+        if was_cold and warm == total:
+            logging.info("Cache fully warm: %d pages", total)
+
+    def _wait_for_turn(self) -> bool:
+        """Block until rendering may run; returns whether it is a quiet window."""
+        while not self._stop.is_set():
+            quiet = _in_time_windows(self.windows, time.time())
+            if quiet or self.background or not self.windows:
+                return quiet
+            self._stop.wait(60)
+        return False
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_pass()
+            except Exception as exc:
+                logging.error("Pre-warm pass failed: %s", exc)
+            # The worker only lives while there is something to render
+            self._close_pool()
+            self._stop.wait(self.scan_interval)
+
+    def run_pass(self) -> int:
+        """Scan once and render the cold pages; returns how many were rendered."""
+        rotation = {str(p) for p in self.in_rotation()}
+        notices = [p for p in find_pdf_files(self.directory) if not _is_frame_set(p) and self.is_wanted(p)]
+        notices.sort(key=lambda p: str(p) in rotation)
+        cold: list[tuple[Path, int, int]] = []
+        total = warm = 0
+        for path in notices:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+                count = self._counts.get((str(path), mtime))
+                if count is None:
+                    count = self._call(_prewarm_page_count, str(path), timeout=60.0)
+                    self._counts[(str(path), mtime)] = count
+            except Exception as exc:
+                logging.warning("Pre-warm could not open %s: %s", path, exc)
+                continue
+            for page_num in range(count):
+                total += 1
+                if (
+                    (str(path), mtime, page_num) in self._skip
+                    or self.quarantine.contains(path, page_num)
+                    or self.disk_cache.contains(path, self._variant(path, page_num))
+                ):
+                    warm += 1
+                else:
+                    cold.append((path, mtime, page_num))
+        self._set_warm(warm, total)
+        if not cold:
+            return 0
+        logging.info("Pre-warming %d of %d pages", len(cold), total)
+        # Leave room in the disk cache so warming cannot evict its own output
+        budget = self.disk_cache.max_bytes // 2
+        written = rendered = 0
+        for path, mtime, page_num in cold:
+            quiet = self._wait_for_turn()
+            if self._stop.is_set():
+                break
+            target = self.disk_cache.target(path, self._variant(path, page_num))
+            if target is None:
+                continue
+            start = time.perf_counter()
+            try:
+                nbytes = self._call(_prewarm_render, str(path), page_num, str(target), self.screen_size, self.grayscale)
+            except Exception as exc:
+                logging.warning("Pre-warm of page %d of %s failed: %s", page_num + 1, path, exc)
+                self._skip.add((str(path), mtime, page_num))
+                continue
+            elapsed = time.perf_counter() - start
+            if nbytes:
+                self.disk_cache.adopt(target)
+                written += nbytes
+            else:
+                self._skip.add((str(path), mtime, page_num))
+            rendered += 1
+            METRICS.incr("prewarm_pages")
+            self._set_warm(self.pages_warm + 1, total)
+            if written > budget:
+                logging.warning("Disk cache too small to pre-warm every notice; raise disk_cache_mb")
+                break
+            if not quiet:
+                self._stop.wait(max(0.2, elapsed))
+        return rendered
+
+
+class DigitalNoticeboard:
+    # Source of wall-clock time for idle detection.  The soak harness
+    # replaces it with a virtual clock.
+    clock = staticmethod(time.time)
+
+    def __init__(self, root: tk.Tk, pdf_paths, cycle_interval: int = 10, restore_state: bool = True) -> None:
+     
+        _require_heavy()
+        self.root = root
+        self.pdf_paths = pdf_paths
+        # Load configuration values
+        cfg = CFG
+        self.fit_mode = cfg.get("fit_mode", "fit_page")
+        self.zoom = 1.0
+        try:
+            self.zoom_step = max(0.01, float(cfg.get("zoom_step", 0.1)))
+        except Exception:
+            self.zoom_step = 0.1
+        self.wheel_mode = cfg.get("wheel_mode", "navigate")
+        self.background_color = cfg.get("background_color", "#FFFFFF")
+        self.page_indicator_pos = cfg.get("page_indicator", "top-right")
+        self.show_toolbar = bool(cfg.get("toolbar", False))
+        # Shuffle pages after loading?  True/False
+        self.shuffle_pages = bool(cfg.get("shuffle_pages", False))
+        # Pan step for panning controls (pixels)
+        try:
+            self.pan_step = int(cfg.get("pan_step", 50))
+        except Exception:
+            self.pan_step = 50
+        # Idle/screen saver settings
+        try:
+            self.idle_timeout = int(cfg.get("idle_timeout", 0))
+        except Exception:
+            self.idle_timeout = 0
+        self.idle_overlay_color = cfg.get("idle_overlay_color", "#000000")
+        self.idle_overlay_text = cfg.get("idle_overlay_text", "Idle")
+
+        # Number of thumbnails to display in bottom row
+        try:
+            self.thumbnails_count = int(cfg.get("thumbnails_count", 4))
+        except Exception:
+            self.thumbnails_count = 4
+        # Height of thumbnails in pixels.  Use the configured value if
+        # provided; otherwise fall back to a sensible default.
+        try:
+            self.thumbnail_height = int(cfg.get("thumbnail_height", 150))
+        except Exception:
+            self.thumbnail_height = 150
+        # Whether to show date with the clock
+        self.show_date = bool(cfg.get("show_date", False))
+        # Shuffle files during rotation
+        self.shuffle_files = bool(cfg.get("shuffle_files", False))
+        try:
+            self.max_logo_height = int(cfg.get("max_logo_height", LOGO_MAX_HEIGHT))
+        except Exception:
+            self.max_logo_height = LOGO_MAX_HEIGHT
+        # Highlight colour for the active thumbnail
+        self.highlight_color = cfg.get("highlight_color", "#FF0000")
+        # Factor for enlarging the selected thumbnail
+        try:
+            self.thumbnail_enlarge_factor = float(cfg.get("thumbnail_enlarge_factor", 1.2))
+            if self.thumbnail_enlarge_factor < 1.0:
+                self.thumbnail_enlarge_factor = 1.0
+        except Exception:
+            self.thumbnail_enlarge_factor = 1.2
+
+        # ------------------------------------------------------------------
+        # Screen‑size adaptive scaling
+        #
+        # When running on displays of varying resolutions (for example when
+        # remoting into the noticeboard on a small monitor), fixed pixel
+        # values for the logo and thumbnail heights can cause the bottom
+        # carousel to overflow off screen.  To make the user interface
+        # responsive, compute reasonable defaults based on the current screen
+        # dimensions.  If a value is already provided in the configuration
+        # file, it will cap the computed size rather than being ignored.
+        # The sizes are recomputed by _relayout when the display changes.
+        self._configured_thumbnail_height = self.thumbnail_height
+        self._configured_logo_height = self.max_logo_height
+        self._apply_screen_metrics()
+        # Resize handling: <Configure> storms are collapsed into a single
+        # re-layout once the window has been still for resize_debounce_ms.
+        try:
+            self.resize_debounce_ms = max(0, int(cfg.get("resize_debounce_ms", 250)))
+            self.relayout_prefetch = max(0, int(cfg.get("relayout_prefetch", 2)))
+        except Exception:
+            self.resize_debounce_ms, self.relayout_prefetch = 250, 2
+        self._relayout_id = None
+        self._layout_key = None
+        self._prefetch_queue: list[tuple[int, int]] = []
+        # Determine cycle interval (seconds per page)
+        ci = cfg.get("cycle_interval", cycle_interval)
+        try:
+            ci = int(ci)
+        except Exception:
+            ci = cycle_interval
+        self.cycle_interval = max(3, ci)
+        # Whether to animate carousel scrolling.  This is set in
+        # configuration and allows the user to disable scrolling animations
+        # entirely to prevent bounce/stutter effects.
+        self.scroll_animation = bool(cfg.get("scroll_animation", False))
+        try:
+            self.scroll_duration_ms = max(0, int(cfg.get("scroll_duration_ms", 350)))
+            self.pulse_duration_ms = max(0, int(cfg.get("pulse_duration_ms", 480)))
+            animation_frame_ms = max(1, int(cfg.get("animation_frame_ms", 16)))
+        except Exception:
+            self.scroll_duration_ms, self.pulse_duration_ms, animation_frame_ms = 350, 480, 16
+        # Carousel scrolling and the selection pulse share one engine that
+        # follows self.clock, so the soak harness can drive it too.
+        self.animator = Animator(self.root, clock=lambda: self.clock(), frame_ms=animation_frame_ms)
+
+        # Clock font size: read from configuration.  If not provided or
+        # invalid, default to 24 points.  This influences the size of the
+        # clock text in the top bar and therefore the width of the left
+        # column.
+        try:
+            self.clock_font_size = int(cfg.get("clock_font_size", 24))
+        except Exception:
+            self.clock_font_size = 24
+        # Internal state
+        # List of file dictionaries with keys 'pages', 'thumbnail', 'path', 'modified_time'
+        self.files: list[dict] = []
+        # Index of currently displayed file and page
+        self.current_file_index = 0
+        self.current_page_index = 0
+        # Timer ID for rotation
+        self.cycle_id = None
+        # Pause state
+        self.paused = False
+        # Offsets used for panning when zoomed (>1).  Offset values are in
+        # pixels of the resized image; they represent the top-left corner
+        # of the cropping region when the image is larger than the display area.
+        self.offset_x = 0
+        self.offset_y = 0
+        # Track last user interaction time for idle detection
+        self.last_interaction_time = self.clock()
+        # Open document handles shared by loading and any later re-render
+        try:
+            max_open = int(cfg.get("max_open_documents", 16))
+        except Exception:
+            max_open = 16
+        self.doc_pool = DocumentPool(max_open)
+        # Pages are rendered in a supervised worker process when isolation is
+        # enabled; pages that hang or crash it are remembered here.
+        self.quarantine = Quarantine(CACHE_DIR / "quarantine.json")
+        # Measured cost of every page, and a disk cache for the expensive ones
+        self.render_costs = RenderCostStats(CACHE_DIR / "render_costs.json")
+        try:
+            self.disk_cache_min_ms = float(cfg.get("disk_cache_min_ms", 150))
+            disk_mb = float(cfg.get("disk_cache_mb", 512))
+            self.pin_budget_fraction = min(1.0, max(0.0, float(cfg.get("pin_budget_fraction", 0.25))))
+        except Exception:
+            self.disk_cache_min_ms, disk_mb, self.pin_budget_fraction = 150.0, 512.0, 0.25
+        self.disk_cache = DiskCache(CACHE_DIR / "pages", int(disk_mb * 1024 * 1024))
+        self._pinned_digests: set[bytes] = set()
+        # Documents with more pages than stream_threshold are streamed
+        # through a window of stream_window pages ahead of (and one behind)
+        # the page on screen.
+        try:
+            self.stream_threshold = max(1, int(cfg.get("stream_threshold", 30)))
+            self.stream_window = max(1, int(cfg.get("stream_window", 4)))
+        except Exception:
+            self.stream_threshold, self.stream_window = 30, 4
+        self._stream_queue: list[tuple] = []
+        self.grayscale_pages = bool(cfg.get("grayscale_pages", True))
+        # Overview grid of every page ("o"), with thumbnails made on demand
+        try:
+            overview_height = int(cfg.get("overview_thumb_height", 160))
+        except Exception:
+            overview_height = 160
+        self.prewarmer: PrewarmScheduler | None = None
+        self.overview_frame = None
+        self._overview_poll_id = None
+        self.render_worker: RenderWorker | None = None
+        timeout = None
+        if bool(cfg.get("render_isolation", True)):
+            try:
+                timeout = max(1.0, float(cfg.get("render_timeout", 20)))
+            except Exception:
+                timeout = 20.0
+            try:
+                self.render_worker = RenderWorker(timeout=timeout)
+                # Start now so the worker boots while the notices are scanned
+                self.render_worker.start()
+            except Exception as exc:
+                logging.error("Could not start render worker, rendering in-process: %s", exc)
+                self.render_worker = None
+                timeout = None
+        # The overview's thumbnails are rendered with the same isolation
+        self.page_thumbnailer = PageThumbnailer(
+            self.disk_cache,
+            overview_height,
+            self.quarantine,
+            render_timeout=timeout,
+        )
+        # Rendered pages, keyed by (path, page number).  Identical pages share
+        # one image, registered once with the memory accountant under its
+        # bitmap digest.
+        try:
+            budget_mb = float(cfg.get("memory_budget_mb", 512))
+        except Exception:
+            budget_mb = 512
+        self.memory = MemoryAccountant(int(budget_mb * 1024 * 1024))
+        self.memory.priority = self._eviction_priority
+        self._page_images: dict[tuple[str, int], Image.Image] = {}
+        self._page_digest: dict[tuple[str, int], bytes] = {}
+        self._digest_images: dict[bytes, Image.Image] = {}
+        self._digest_refs: dict[bytes, set[tuple[str, int]]] = {}
+        self._rotation_pos: dict[tuple[str, int], list[int]] = {}
+        self._rotation_len = 0
+        self._rotation_cycle = 0
+        # Order of pages in the rotation; rebuilt by _load_files
+        self.playlist = Playlist([])
+        # Pages resized for display, so that panning and re-showing a page
+        # does not resize it again
+        self._fitted: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._current_fitted_key = None
+        self._thumb_owners: dict[bytes, list[dict]] = {}
+        # Full-text search index, created and updated on a background thread
+        self.search_enabled = bool(cfg.get("search_index", True))
+        self.search_index: SearchIndex | None = None
+        self._index_thread: threading.Thread | None = None
+        # Both guarded by _index_lock, so a request made while a pass is
+        # finishing is never lost
+        self._index_lock = threading.Lock()
+        self._index_running = False
+        self._index_pending = False
+        # Latest state published for the health endpoint (see _publish_status)
+        self.status: dict = {}
+        self.health_server: HealthServer | None = None
+        self.watchdog: StallWatchdog | None = None
+        # Mirror of a central frame server (see start_frame_sync)
+        self.frame_client: FrameClient | None = None
+        self._frames_changed = threading.Event()
+        self._frame_sync_stop = threading.Event()
+        # Playback state saved by the previous run (see _save_state)
+        self.state_path = CACHE_DIR / "state.json"
+        self.warm_restart = restore_state and bool(cfg.get("warm_restart", True))
+        try:
+            self.state_save_interval = max(5, int(cfg.get("state_save_interval", 60)))
+        except Exception:
+            self.state_save_interval = 60
+        self._saved_state = self._read_state() if self.warm_restart else None
+        # Validity windows of the notices (see _load_files and _on_timeline)
+        self.schedule_manifest = str(cfg.get("schedule_manifest", "schedule.json") or "")
+        try:
+            self.schedule_lead = max(0.0, float(cfg.get("schedule_prerender_minutes", 10)) * 60)
+        except Exception:
+            self.schedule_lead = 600.0
+        self.schedule: NoticeSchedule | None = None
+        self._prepared: dict[str, dict] = {}
+        self._timeline_id = None
+        # Load PDF files and build UI
+        with PROFILER.phase("load notices"):
+            self._load_files()
+        if self._saved_state is not None:
+            self._restore_state(self._saved_state)
+        with PROFILER.phase("build UI"):
+            self._build_ui()
+        self._update_clock()
+        # Begin automatic rotation by scheduling the next page.  When the
+        # last page of a file has been displayed, the next invocation will
+        # advance to the next file.
+        self._schedule_next_page()
+
+        # Start idle check if idle_timeout is enabled
+        if self.idle_timeout and self.idle_timeout > 0:
+            self._check_idle()
+
+        # Index the notice text in the background for the search overlay
+        self._start_indexing()
+        self._start_health_server()
+        self._start_stall_watchdog()
+        self._start_prewarm()
+        if self.warm_restart:
+            self.root.after(self.state_save_interval * 1000, self._save_state_periodically)
+
+    def _apply_screen_metrics(self) -> None:
+        """Derive the thumbnail and logo heights from the current screen."""
+        self.thumbnail_height = self._configured_thumbnail_height
+        self.max_logo_height = self._configured_logo_height
+        try:
+            # Retrieve the height of the display in pixels.  This allows
+            # the program to adapt to monitors of different sizes.
+            screen_h = self.root.winfo_screenheight()
+        except Exception:
+            screen_h = 0
+        if screen_h:
+            # Target the thumbnail row height at roughly 12 percent of the
+            # screen height.  If the configured value is smaller it will be
+            # kept, otherwise it is limited to this computed size to
+            # prevent overflow on short displays.
+            computed_thumb_h = int(screen_h * 0.12)
+            if computed_thumb_h > 0:
+                self.thumbnail_height = min(self.thumbnail_height, computed_thumb_h)
+            # Set the maximum height for the logo images to approximately
+            # 8 percent of the screen height.  The existing configuration
+            # value will prevail if it is smaller.
+            computed_logo_h = int(screen_h * 0.08)
+            if computed_logo_h > 0:
+                self.max_logo_height = min(self.max_logo_height, computed_logo_h)
+
+    def _load_files(self) -> None:
+      
+        self.files.clear()
+        # Drop handles for notices that are no longer part of the rotation
+        self.doc_pool.retain(self.pdf_paths)
+        self._reset_page_cache()
+        # Byte-identical notices share one NoticePages and one set of
+        # thumbnails.  The map is rebuilt on every load so that data of
+        # removed notices can be released.
+        files_by_digest: dict[bytes, dict] = {}
+        now = self.clock()
+        self.schedule = NoticeSchedule(
+            self.pdf_paths,
+            PDF_DIR,
+            manifest=self.schedule_manifest,
+            lead=self.schedule_lead,
+            now=now,
+        )
+        self._prepared.clear()
+        for pdf_path in self.pdf_paths:
+            # Notices outside their validity window join and leave the
+            # rotation through the schedule timeline
+            if not self.schedule.is_active(pdf_path, now):
+                continue
+            info = self._load_notice(pdf_path, files_by_digest)
+            if info is None:
+                continue
+            self.files.append(info)
+            if info["file_digest"]:
+                files_by_digest[info["file_digest"]] = info
+        # If no files loaded, raise an error, unless notices are merely
+        # scheduled for later
+        if not self.files:
+            if not any(self.schedule.window(p) != (None, None) for p in self.pdf_paths):
+                raise RuntimeError(
+                    "No PDF files loaded; please place PDFs in the configured directory."
+                )
+            logging.warning("No notice is valid at the moment; waiting for the next one to start")
+        # Shuffle files if configured
+        if getattr(self, "shuffle_files", False):
+            try:
+                random.shuffle(self.files)
+            except Exception:
+                pass
+        self.playlist = Playlist(
+            [len(info["pages"]) for info in self.files],
+            shuffle=getattr(self, "shuffle_pages", False),
+        )
+        self._update_rotation_positions()
+        self._update_pins()
+        self.render_costs.save()
+        logging.info("%s", self._dedup_report())
+        logging.info("%s", self.memory.breakdown())
+        for path in self.schedule.preparing(now):
+            self._prepare_notice(path)
+        self._arm_timeline()
+
+    def _load_notice(self, pdf_path, files_by_digest: dict) -> dict | None:
+        """Open one notice, render its first pages and build its file info.
+
+        Returns None if the notice has no renderable pages.  A notice that is
+        byte-identical to one in ``files_by_digest`` shares its pages.
+        """
+        # Record file info
+        try:
+            modified_time = pdf_path.stat().st_mtime
+        except Exception:
+            modified_time = 0
+        try:
+            file_digest = _file_digest(pdf_path)
+        except Exception:
+            file_digest = None
+        twin = files_by_digest.get(file_digest) if file_digest else None
+        if twin is not None:
+            info = dict(twin, path=pdf_path, modified_time=modified_time)
+            self._thumb_owners.setdefault(info["thumb_digest"], []).append(info)
+            return info
+        if _is_image_notice(pdf_path):
+            page_count = 1
+        elif _is_frame_set(pdf_path):
+            page_count = len(_frame_set_pages(pdf_path))
+        else:
+            try:
+                page_count = len(self.doc_pool.get(pdf_path))
+            except Exception as exc:
+                logging.error("Failed to open PDF %s: %s", pdf_path, exc)
+                return None
+        page_numbers: list[int] = []
+        # Long documents are streamed: the page count comes from the
+        # document, only the first page (for the thumbnail) is rendered
+        # now, and a window of pages around the one on screen later.
+        streamed = page_count > self.stream_threshold
+        # Render pages up front while there is room in the memory
+        # budget so the rotation starts warm; beyond that they are
+        # rendered when first shown.
+        for page_num in range(page_count):
+            # On a warm restart the pages come from the disk cache as
+            # they are shown, so only the first page is needed now.
+            lazy = streamed or self._saved_state is not None
+            if page_numbers and (lazy or not self.memory.has_room()):
+                page_numbers.extend(range(page_num, page_count))
+                break
+            try:
+                self._get_page(pdf_path, page_num)
+            except Exception as exc:
+                logging.error(
+                    "Failed to render page %d of %s: %s",
+                    page_num + 1,
+                    pdf_path,
+                    exc,
+                )
+                continue
+            page_numbers.append(page_num)
+        # Skip files with no renderable pages
+        if not page_numbers:
+            return None
+        pages = NoticePages(pdf_path, page_numbers, self._get_page)
+        info = {
+            "pages": pages,
+            "path": pdf_path,
+            "modified_time": modified_time,
+            "thumb_digest": self._page_digest[(str(pdf_path), page_numbers[0])],
+            "streamed": streamed,
+            "file_digest": file_digest,
+        }
+        self._ensure_thumbnails(info)
+        return info
+
+    # ------------------------------------------------------------------
+    # Schedule timeline
+    def _arm_timeline(self) -> None:
+        """Wake up for the next event of the schedule timeline."""
+        if self._timeline_id is not None:
+            try:
+                self.root.after_cancel(self._timeline_id)
+            except Exception:
+                pass
+            self._timeline_id = None
+        when = self.schedule.next_time() if self.schedule is not None else None
+        if when is None:
+            return
+        # Check at least once a minute so a changed wall clock (or a
+        # suspended machine) cannot delay an event for long
+        delay = min(60.0, max(0.0, when - self.clock()))
+        self._timeline_id = self.root.after(int(delay * 1000) + 1, self._on_timeline)
+
+    def _on_timeline(self) -> None:
+        """Apply the schedule events that are due."""
+        self._timeline_id = None
+        added, removed = [], set()
+        for kind, path in self.schedule.due(self.clock()):
+            in_rotation = any(str(info["path"]) == path for info in self.files)
+            if kind == "prepare" and not in_rotation:
+                self._prepare_notice(path)
+            elif kind == "start" and not in_rotation:
+                info = self._prepared.pop(path, None) or self._prepare_notice(path, keep=False)
+                if info is not None:
+                    logging.info("Notice %s is now valid", path)
+                    removed.discard(path)
+                    added.append(info)
+            elif kind == "end":
+                prepared = self._prepared.pop(path, None)
+                if prepared is not None:
+                    self._release_notice(prepared)
+                if in_rotation or any(str(info["path"]) == path for info in added):
+                    logging.info("Notice %s has expired", path)
+                    added = [info for info in added if str(info["path"]) != path]
+                    removed.add(path)
+        if added or removed:
+            try:
+                self._change_rotation(added, removed)
+            except Exception as exc:
+                logging.error("Could not update the rotation: %s", exc)
+        self._arm_timeline()
+
+    def _prepare_notice(self, path: str, keep: bool = True) -> dict | None:
+        """Render a notice ahead of its start; kept in ``_prepared`` if ``keep``."""
+        files_by_digest = {info["file_digest"]: info for info in self.files if info.get("file_digest")}
+        try:
+            info = self._load_notice(Path(path), files_by_digest)
+        except Exception as exc:
+            logging.error("Failed to prepare %s: %s", path, exc)
+            return None
+        if info is not None and keep:
+            self._prepared[path] = info
+        return info
+
+    def _change_rotation(self, added: list[dict], removed: set) -> None:
+        """Add and remove notices without reloading the others.
+
+        The notice on screen stays on screen unless it was removed, in
+        which case the rotation moves on to the notice that took its place.
+        """
+        current = None
+        if 0 <= self.current_file_index < len(self.files):
+            current = self.files[self.current_file_index]
+        gone = [info for info in self.files if str(info["path"]) in removed]
+        self.files[:] = [info for info in self.files if str(info["path"]) not in removed] + added
+        for info in gone:
+            self._release_notice(info)
+        self.doc_pool.retain([info["pages"].path for info in self.files])
+        self.playlist = Playlist(
+            [len(info["pages"]) for info in self.files],
+            shuffle=getattr(self, "shuffle_pages", False),
+        )
+        if getattr(self, "overview_frame", None) is not None and self.overview_frame.winfo_ismapped():
+            self._close_overview()
+        if current is not None and any(info is current for info in self.files):
+            self.current_file_index = next(i for i, info in enumerate(self.files) if info is current)
+        else:
+            self.current_file_index = min(self.current_file_index, max(0, len(self.files) - 1))
+            self.current_page_index = 0
+            self.offset_x = self.offset_y = 0
+            current = None
+        self._update_rotation_positions()
+        self._update_pins()
+        self._update_thumbnails()
+        self._start_indexing()
+        if not self.files:
+            # Nothing is valid: blank the display until the next start
+            if self.cycle_id:
+                self.root.after_cancel(self.cycle_id)
+                self.cycle_id = None
+            win_w, available_h = self._display_area()
+            self.display.present(Image.new("RGB", (win_w, available_h), self.background_color), (win_w, available_h))
+            self.page_label.config(text="")
+            return
+        if current is None:
+            # Also restarts the rotation if it had stopped for lack of notices
+            self._show_page(self.current_page_index, interactive=False)
+            if self.cycle_id:
+                self.root.after_cancel(self.cycle_id)
+            self._schedule_next_page()
+        else:
+            self.page_label.config(text=f"{self.current_file_index + 1} / {len(self.files)}")
+
+    def _release_notice(self, info: dict) -> None:
+        """Free the cached images of a notice that left the rotation."""
+        pages = info["pages"]
+        path = str(pages.path)
+        digest = info["thumb_digest"]
+        owners = [o for o in self._thumb_owners.get(digest, ()) if o is not info]
+        if owners:
+            self._thumb_owners[digest] = owners
+        else:
+            self._thumb_owners.pop(digest, None)
+            self.memory.discard("thumbnails", digest)
+        # A byte-identical notice still in the rotation uses the same pages
+        if any(other["pages"] is pages for other in self.files):
+            return
+        for key in [k for k in self._page_images if k[0] == path]:
+            self._drop_page(key)
+        for key in [k for k in self._fitted if k[0] == path]:
+            self._fitted.pop(key, None)
+            self.memory.discard("fitted", key)
+        self._stream_queue = [entry for entry in self._stream_queue if str(entry[0]) != path]
+        # Release the file handle so the file can be replaced or deleted
+        self.doc_pool.invalidate(pages.path)
+        if _is_image_notice(pages.path):
+            # Cached by _load_image at the screen size
+            try:
+                screen = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+            except Exception:
+                screen = (1920, 1080)
+            self.disk_cache.discard(pages.path, f"img{screen[0]}x{screen[1]}")
+        for page_num in pages.page_numbers:
+            key = (path, page_num)
+            self.page_thumbnailer.discard(key)
+            self.memory.discard("page_thumbnails", key)
+            self.disk_cache.discard(pages.path, f"p{page_num}@1")
+            self.disk_cache.discard(pages.path, f"t{page_num}h{self.page_thumbnailer.height}")
+
+    # ------------------------------------------------------------------
+    # Page cache and memory budget
+    def _reset_page_cache(self) -> None:
+        """Forget every cached page, thumbnail and fitted frame."""
+        self._page_images.clear()
+        self._page_digest.clear()
+        self._digest_images.clear()
+        self._digest_refs.clear()
+        self._fitted.clear()
+        self._current_fitted_key = None
+        self._thumb_owners.clear()
+        self._pinned_digests = set()
+        self._stream_queue = []
+        for category in ("pages", "thumbnails", "fitted"):
+            self.memory.clear(category)
+
+    def _get_page(self, pdf_path, page_num: int):
+        """Return the image of a page, rendering and caching it if needed."""
+        key = (str(pdf_path), page_num)
+        img = self._page_images.get(key)
+        if img is not None:
+            METRICS.incr("page_cache_hits")
+            return img
+        METRICS.incr("page_cache_misses")
+        img = self._render_page(pdf_path, page_num)
+        # Pages that rasterise to the same bitmap (a shared cover or
+        # letterhead page, say) keep a single image.
+        digest = _image_digest(img)
+        shared = self._digest_images.get(digest)
+        if shared is not None:
+            img = shared
+        else:
+            self._digest_images[digest] = img
+            self.memory.add(
+                "pages",
+                digest,
+                _image_nbytes(img),
+                evict=lambda d=digest: self._evict_page(d),
+            )
+        self._page_images[key] = img
+        self._page_digest[key] = digest
+        self._digest_refs.setdefault(digest, set()).add(key)
+        if shared is None:
+            self._update_pins()
+        self.memory.enforce()
+        return img
+
+    def _advance_stream_window(self, pages: NoticePages, page_index: int) -> None:
+        """Slide a streamed document's window to ``page_index``.
+
+        Pages of the document outside the window are dropped; the missing
+        pages ahead are rendered one per idle callback.
+        """
+        count = len(pages)
+        wanted = [
+            pages.page_numbers[(page_index + offset) % count]
+            for offset in range(-1, self.stream_window + 1)
+        ]
+        path = str(pages.path)
+        keep = set(wanted)
+        for key in [k for k in self._page_images if k[0] == path and k[1] not in keep]:
+            self._drop_page(key)
+        for fitted_key in [k for k in self._fitted if k[0] == path and k[1] not in keep]:
+            self._fitted.pop(fitted_key, None)
+            self.memory.discard("fitted", fitted_key)
+        queue_was_empty = not self._stream_queue
+        self._stream_queue = [(pages.path, n) for n in wanted if (path, n) not in self._page_images]
+        if queue_was_empty and self._stream_queue:
+            self.root.after_idle(self._stream_step)
+
+    def _queue_next_page(self) -> None:
+        """Render the next page of the rotation in idle time if it is missing."""
+        for file_idx, page_idx in self._upcoming_pages(1):
+            pages = self.files[file_idx]["pages"]
+            entry = (pages.path, pages.page_numbers[page_idx])
+            if (str(entry[0]), entry[1]) in self._page_images or entry in self._stream_queue:
+                continue
+            self._stream_queue.append(entry)
+            if len(self._stream_queue) == 1:
+                self.root.after_idle(self._stream_step)
+
+    def _stream_step(self) -> None:
+        """Render the next queued page of a streamed document."""
+        if not self._stream_queue:
+            return
+        pdf_path, page_num = self._stream_queue.pop(0)
+        try:
+            self._get_page(pdf_path, page_num)
+        except Exception as exc:
+            logging.error("Failed to render page %d of %s: %s", page_num + 1, pdf_path, exc)
+        if self._stream_queue:
+            self.root.after_idle(self._stream_step)
+
+    def _drop_page(self, key: tuple[str, int]) -> None:
+        """Forget one page; its image goes once no other page shares it."""
+        self._page_images.pop(key, None)
+        digest = self._page_digest.pop(key, None)
+        refs = self._digest_refs.get(digest)
+        if refs is None:
+            return
+        refs.discard(key)
+        if not refs:
+            del self._digest_refs[digest]
+            self._digest_images.pop(digest, None)
+            self.memory.discard("pages", digest)
+            self._pinned_digests.discard(digest)
+
+    def _evict_page(self, digest: bytes) -> None:
+        """Drop a page image (and every page sharing it) from the cache."""
+        self._digest_images.pop(digest, None)
+        refs = self._digest_refs.pop(digest, set())
+        for key in refs:
+            self._page_images.pop(key, None)
+        for key in [k for k in self._fitted if (k[0], k[1]) in refs]:
+            self._fitted.pop(key, None)
+            self.memory.discard("fitted", key)
+
+    def _update_rotation_positions(self) -> None:
+        """Record where every page sits in the playlist, for eviction order."""
+        positions: dict[tuple[str, int], list[int]] = {}
+        for n, (file_idx, page_idx) in enumerate(self.playlist.entries):
+            pages = self.files[file_idx]["pages"]
+            positions.setdefault((str(pages.path), pages.page_numbers[page_idx]), []).append(n)
+        self._rotation_pos = positions
+        self._rotation_len = len(self.playlist.entries)
+        self._rotation_cycle = self.playlist.cycle
+
+    def _current_rotation_pos(self) -> int:
+        if not self.files or self.current_file_index >= len(self.files):
+            return 0
+        pos = self.playlist.index_of(self.current_file_index, self.current_page_index)
+        return pos or 0
+
+    def _eviction_priority(self, category: str, key):
+        """Order in which cached data is given up when over budget.
+
+        Fitted frames other than the one on screen go first, then the
+        thumbnail sources (their Tk copies stay), then pages by distance
+        from the current position in the rotation, so that the current
+        page's neighbours are the last to go.  The current page and the
+        frame on screen are never evicted.
+        """
+        if category == "fitted":
+            return None if key == self._current_fitted_key else float("inf")
+        if category == "page_thumbnails":
+            # Overview thumbnails are cheap to reload from the disk cache
+            return float("inf")
+        if category == "thumbnails":
+            return float(self._rotation_len + 1)
+        if category == "pages":
+            if key in self._pinned_digests:
+                return None
+            total = max(1, self._rotation_len)
+            here = self._current_rotation_pos()
+            distance = total
+            cost = 0.0
+            for ref in self._digest_refs.get(key, ()):
+                cost = max(cost, self.render_costs.cost_ms(*ref) or 0.0)
+                for pos in self._rotation_pos.get(ref, ()):
+                    d = abs(pos - here)
+                    distance = min(distance, d, total - d)
+            if distance == 0:
+                return None
+            # Between pages at the same distance, those that hold the most
+            # bytes per millisecond of rendering go first.  The weight stays
+            # below 1, so distance decides and pages (at most ``total``)
+            # always rank below the thumbnails (``total + 1``).
+            megabytes = _image_nbytes(self._digest_images.get(key)) / (1024 * 1024)
+            bytes_per_ms = max(megabytes, 0.01) / max(cost, 1.0)
+            return distance + bytes_per_ms / (1.0 + bytes_per_ms)
+        return 0
+
+    def _update_pins(self) -> None:
+        """Pin the most expensive cached pages within the pin budget."""
+        budget = self.memory.budget * self.pin_budget_fraction
+        if not budget:
+            self._pinned_digests = set()
+            return
+        ranked = []
+        for digest, refs in self._digest_refs.items():
+            cost = max((self.render_costs.cost_ms(*ref) or 0.0) for ref in refs) if refs else 0.0
+            if cost >= self.disk_cache_min_ms:
+                ranked.append((cost, digest))
+        ranked.sort(reverse=True)
+        pinned: set[bytes] = set()
+        used = 0
+        for _cost, digest in ranked:
+            nbytes = _image_nbytes(self._digest_images.get(digest))
+            if used + nbytes > budget:
+                break
+            pinned.add(digest)
+            used += nbytes
+        self._pinned_digests = pinned
+
+    def _ensure_thumbnails(self, info: dict) -> None:
+        """Make sure the thumbnail variants of a notice are available.
+
+        Notices starting with the same page share one set of variants.
+        Under memory pressure the variants can be evicted once their Tk
+        copies exist; they are rebuilt here when needed again.
+        """
+        digest = info["thumb_digest"]
+        owners = self._thumb_owners.setdefault(digest, [])
+        if not any(o is info for o in owners):
+            owners.append(info)
+        if info.get("thumbnail") is not None:
+            return
+        for other in owners:
+            if other.get("thumbnail") is not None:
+                info.update({k: other[k] for k in _THUMBNAIL_KEYS})
+                return
+        thumbs = self._make_thumbnails(info["pages"][0])
+        for owner in owners:
+            owner.update(thumbs)
+        self.memory.add(
+            "thumbnails",
+            digest,
+            sum(_image_nbytes(t) for t in thumbs.values()),
+            evict=lambda d=digest: self._evict_thumbnails(d),
+        )
+
+    def _evict_thumbnails(self, digest: bytes) -> None:
+        for owner in self._thumb_owners.get(digest, ()):
+            for k in _THUMBNAIL_KEYS:
+                owner[k] = None
+
+    def _log_memory_usage(self, event=None) -> None:
+        """Log the current memory breakdown; bound to the "m" key."""
+        counters = METRICS.snapshot()
+        report = (
+            f"{self.memory.breakdown()}\n{self._dedup_report()}\n"
+            f"Tk images allocated: {counters.get('tk_images_allocated', 0)} "
+            f"(display buffers {counters.get('display_buffer_allocations', 0)}), "
+            f"frames presented: {counters.get('frames_presented', 0)}"
+        )
+        if self.prewarmer is not None and self.prewarmer.warm_percent is not None:
+            report += (
+                f"\nCache warm: {self.prewarmer.warm_percent:g}% "
+                f"({self.prewarmer.pages_warm} of {self.prewarmer.pages_total} pages)"
+            )
+        logging.info("%s", report)
+
+    def _dedup_report(self) -> str:
+        """Describe how much memory page deduplication currently saves."""
+        shared_pages = 0
+        bytes_saved = 0
+        for digest, refs in self._digest_refs.items():
+            if len(refs) > 1:
+                shared_pages += len(refs) - 1
+                bytes_saved += (len(refs) - 1) * _image_nbytes(self._digest_images.get(digest))
+        seen: set[int] = set()
+        shared_files = 0
+        for info in self.files:
+            pages = info["pages"]
+            if id(pages) in seen:
+                shared_files += 1
+                for page_num in pages.page_numbers:
+                    img = self._page_images.get((str(pages.path), page_num))
+                    if img is not None:
+                        bytes_saved += _image_nbytes(img)
+            seen.add(id(pages))
+        for owners in self._thumb_owners.values():
+            if len(owners) > 1 and owners[0].get("thumbnail") is not None:
+                bytes_saved += (len(owners) - 1) * sum(_image_nbytes(owners[0][k]) for k in _THUMBNAIL_KEYS)
+        return (
+            f"Deduplication: {shared_pages} pages and {shared_files} identical files shared, "
+            f"{bytes_saved / (1024 * 1024):.1f} MB saved"
+        )
+
+    def _make_thumbnails(self, first_page) -> dict:
+        """Build the base thumbnail for a notice from its first page.
+
+        The tinted and enlarged variants are left empty; they are made by
+        ``_thumbnail_variant`` when the notice becomes the selection or one
+        of its neighbours.
+        """
+        # Determine target thumbnail height.  Use the instance's
+        # configured value if available, otherwise fall back to a
+        # reasonable default.  This allows thumbnails to be larger
+        # and more visible when configured by the user.
+        try:
+            thumb_height = int(getattr(self, "thumbnail_height", CFG.get("thumbnail_height", 100)))
+        except Exception:
+            thumb_height = 100
+        try:
+            ratio = thumb_height / float(first_page.height)
+            thumb_size = (int(first_page.width * ratio), thumb_height)
+            # reducing_gap lets Pillow shrink by whole factors first, which
+            # is most of the work for a full page
+            thumbnail = first_page.resize(thumb_size, Image.LANCZOS, reducing_gap=3.0)
+        except Exception:
+            # Fallback to original size if resizing fails
+            thumbnail = first_page
+        thumbs = dict.fromkeys(_THUMBNAIL_KEYS)
+        thumbs["thumbnail"] = thumbnail
+        return thumbs
+
+    def _thumbnail_enlarge_size(self, size: tuple[int, int]) -> tuple[int, int]:
+        """Size of the enlarged (parallax) variant of a thumbnail."""
+        try:
+            factor = max(1.0, float(getattr(self, "thumbnail_enlarge_factor", 1.2)))
+        except Exception:
+            factor = 1.2
+        return int(size[0] * factor), int(size[1] * factor)
+
+    def _thumbnail_tint(self):
+        """Return the lookup table that tints a thumbnail for the selection.
+
+        Blending with the highlight colour is a per-channel affine map, so
+        one 768-entry table applied with ``Image.point`` replaces building
+        a solid overlay image and blending it for every thumbnail.
+        """
+        lut = getattr(self, "_tint_lut", None)
+        if lut is None:
+            hl_hex = CFG.get("highlight_color", "#0077CC")
+            # Ensure the string is in the form #RRGGBB
+            if isinstance(hl_hex, str) and hl_hex.startswith("#") and len(hl_hex) == 7:
+                colour = (int(hl_hex[1:3], 16), int(hl_hex[3:5], 16), int(hl_hex[5:7], 16))
+            else:
+                colour = (0, 119, 204)  # fallback to blue
+            # Intensity of the tint (0.0 = original, 1.0 = full colour)
+            tint_alpha = 0.3
+            lut = [round(v + (c - v) * tint_alpha) for c in colour for v in range(256)]
+            self._tint_lut = lut
+        return lut
+
+    def _thumbnail_variant(self, info: dict, key: str):
+        """Return one thumbnail variant of a notice, building it on demand.
+
+        The variant is shared by every notice with the same first page and
+        dropped again by ``_release_thumbnail_variants`` once none of them
+        is selected or next to the selection.
+        """
+        img = info.get(key)
+        if img is not None:
+            return img
+        self._ensure_thumbnails(info)
+        base = info["thumbnail"]
+        if key == "thumbnail_enlarged":
+            img = base.resize(self._thumbnail_enlarge_size(base.size), Image.LANCZOS)
+        elif key == "thumbnail_selected":
+            img = base.convert("RGB").point(self._thumbnail_tint())
+        elif key == "thumbnail_selected_enlarged":
+            # Tinting commutes with resizing, so reuse the enlarged variant
+            img = self._thumbnail_variant(info, "thumbnail_enlarged").convert("RGB").point(self._thumbnail_tint())
+        else:
+            return base
+        METRICS.incr("thumbnail_variants_built")
+        digest = info["thumb_digest"]
+        owners = self._thumb_owners.get(digest) or [info]
+        for owner in owners:
+            owner[key] = img
+        self.memory.add(
+            "thumbnails",
+            digest,
+            sum(_image_nbytes(info[k]) for k in _THUMBNAIL_KEYS),
+            evict=lambda d=digest: self._evict_thumbnails(d),
+        )
+        return img
+
+    def _release_thumbnail_variants(self, keep: set) -> None:
+        """Drop the derived thumbnail variants of digests not in ``keep``."""
+        for digest, owners in self._thumb_owners.items():
+            if digest in keep or not owners or owners[0].get("thumbnail") is None:
+                continue
+            if all(owners[0].get(k) is None for k in _THUMBNAIL_KEYS[1:]):
+                continue
+            for owner in owners:
+                for k in _THUMBNAIL_KEYS[1:]:
+                    owner[k] = None
+            self.memory.add(
+                "thumbnails",
+                digest,
+                _image_nbytes(owners[0]["thumbnail"]),
+                evict=lambda d=digest: self._evict_thumbnails(d),
+            )
+
+    def _render_page(self, pdf_path, page_num: int, scale: float = 1.0):
+        """Render one page of ``pdf_path`` to a PIL image.
+
+        The document handle comes from ``self.doc_pool`` so repeated renders
+        of the same notice (re-layout, zoom, prefetch) do not re-parse the
+        PDF.  ``scale`` is applied to PyMuPDF's default 72 dpi resolution.
+        With ``render_isolation`` the page is rendered by ``render_worker``
+        instead (which keeps its own pool); quarantined pages, and pages
+        that time out or crash the worker, come back as a placeholder.
+        """
+        if self.quarantine.contains(pdf_path, page_num):
+            return _placeholder_page()
+        if _is_image_notice(pdf_path):
+            return self._load_image(pdf_path, scale)
+        if _is_frame_set(pdf_path):
+            # Already rendered for this resolution by the frame server
+            with Image.open(Path(pdf_path) / f"p{page_num + 1:04d}.png") as frame:
+                frame.load()
+                return frame if frame.mode in ("L", "RGB") else frame.convert("RGB")
+        variant = f"p{page_num}@{scale:g}"
+        cached = self.disk_cache.get(pdf_path, variant)
+        if cached is not None:
+            METRICS.incr("disk_cache_hits")
+            return cached
+        # Pages found to be colourless on an earlier render are requested
+        # as 8-bit grayscale, a quarter of the memory of an RGB image.
+        gray = self.grayscale_pages and bool(self.render_costs.is_gray(pdf_path, page_num))
+        start = time.perf_counter()
+        img = None
+        if self.render_worker is not None:
+            try:
+                img = self.render_worker.render(pdf_path, page_num, scale, gray)
+            except RenderWorkerUnavailable as exc:
+                # Not the page's fault: render without isolation from now on
+                logging.warning("Rendering in-process: %s", exc)
+                self.render_worker.stop()
+                self.render_worker = None
+            except (RenderTimeout, RenderCrash) as exc:
+                logging.error(
+                    "Quarantining page %d of %s: %s",
+                    page_num + 1,
+                    pdf_path,
+                    exc,
+                )
+                self.quarantine.add(pdf_path, page_num, str(exc))
+                return _placeholder_page()
+        if img is None:
+            doc = self.doc_pool.get(pdf_path)
+            img = _pixmap_to_image(_render_pixmap(doc[page_num], scale, gray))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        METRICS.observe("render_ms", elapsed_ms)
+        is_gray = None
+        if self.grayscale_pages and not gray and self.render_costs.is_gray(pdf_path, page_num) is None:
+            is_gray = _is_grayscale(img)
+            if is_gray:
+                img = img.convert("L")
+        self.render_costs.record(pdf_path, page_num, elapsed_ms, _image_nbytes(img), is_gray)
+        # Expensive pages are kept on disk so they never have to be
+        # rasterised again while the file is unchanged.
+        if elapsed_ms >= self.disk_cache_min_ms:
+            self.disk_cache.put(pdf_path, variant, img)
+        return img
+
+    def _load_image(self, path, scale: float = 1.0):
+        """Load an image notice no larger than the screen (times ``scale``).
+
+        Images that had to be reduced are saved to the disk cache at their
+        reduced size, so a large poster is only decoded in full once.
+        """
+        try:
+            screen = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        except Exception:
+            screen = (1920, 1080)
+        max_size = (max(1, int(screen[0] * scale)), max(1, int(screen[1] * scale)))
+        variant = f"img{max_size[0]}x{max_size[1]}"
+        cached = self.disk_cache.get(path, variant)
+        if cached is not None:
+            METRICS.incr("disk_cache_hits")
+            return cached
+        start = time.perf_counter()
+        try:
+            with Image.open(path) as probe:
+                reduced = probe.width > max_size[0] or probe.height > max_size[1]
+            img = _load_image_notice(path, max_size)
+        except Exception as exc:
+            # Not decoded again on every showing until the file changes
+            logging.error("Quarantining image notice %s: %s", path, exc)
+            self.quarantine.add(path, 0, str(exc))
+            return _placeholder_page()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        METRICS.observe("render_ms", elapsed_ms)
+        self.render_costs.record(path, 0, elapsed_ms, _image_nbytes(img))
+        if reduced:
+            self.disk_cache.put(path, variant, img)
+        return img
+
+    def _publish_status(self) -> None:
+        """Publish the board's state for the health endpoint.
+
+        The dictionary is replaced rather than mutated, so the server thread
+        always sees a consistent snapshot without touching Tk.
+        """
+        info = self.files[self.current_file_index] if self.files else {}
+        self.status = {
+            "file": str(info.get("path", "")),
+            "file_index": self.current_file_index + 1,
+            "page": self.current_page_index + 1,
+            "pages": len(info.get("pages", ())),
+            "notices": len(self.files),
+            "paused": self.paused,
+            "last_frame": time.time(),
+            "heartbeat": time.time(),
+            "cache_bytes": self.memory.totals(),
+            "memory_budget_bytes": self.memory.budget,
+            "open_documents": len(self.doc_pool),
+            "cache_warm_percent": self.prewarmer.warm_percent if self.prewarmer is not None else None,
+        }
+
+    def _start_health_server(self) -> None:
+        """Start the health endpoint if ``health_port`` is configured."""
+        try:
+            port = int(CFG.get("health_port", 0))
+        except Exception:
+            port = 0
+        if port <= 0:
+            return
+        host = str(CFG.get("health_host", "127.0.0.1"))
+        try:
+            self.health_server = HealthServer(
+                host,
+                port,
+                lambda: self.status,
+                stale_after=max(60.0, 3.0 * self.cycle_interval),
+            )
+            self.health_server.start()
+        except Exception as exc:
+            logging.error("Could not start health endpoint on %s:%s: %s", host, port, exc)
+            self.health_server = None
+
+    def _start_prewarm(self) -> None:
+        """Start pre-warming the disk cache unless ``prewarm`` is disabled."""
+        if not bool(CFG.get("prewarm", True)):
+            return
+        try:
+            scan_interval = float(CFG.get("prewarm_scan_interval", 300))
+        except Exception:
+            scan_interval = 300.0
+        try:
+            screen = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        except Exception:
+            screen = (1920, 1080)
+        self.prewarmer = PrewarmScheduler(
+            PDF_DIR,
+            self.disk_cache,
+            self.quarantine,
+            screen,
+            windows=_parse_time_windows(CFG.get("prewarm_windows", [])),
+            background=bool(CFG.get("prewarm_background", True)),
+            scan_interval=scan_interval,
+            grayscale=self.grayscale_pages,
+            in_rotation=lambda: list(self.pdf_paths),
+            # Expired notices are never shown again
+            is_wanted=lambda path: self.schedule is None or not self.schedule.is_expired(path, time.time()),
+        )
+        self.prewarmer.start()
+
+    def start_frame_sync(self, client: "FrameClient", interval: float = 60.0) -> None:
+        """Keep the notices mirrored from a frame server up to date.
+
+        Syncing runs on a background thread; when it reports a change the
+        Tk loop reloads the notices, which are plain frame sets on disk, and
+        only then deletes the versions they replaced.  Frames are fetched
+        for the display area unless ``frame_resolution`` is configured.
+        """
+        self.frame_client = client
+        resync = False
+        if not CFG.get("frame_resolution"):
+            self.root.update_idletasks()
+            area = self._display_area()
+            if min(area) > 1:
+                resync = client.set_resolution(area)
 
-    def _load_files(self) -> None:
-      
-        self.files.clear()
-        for pdf_path in self.pdf_paths:
-            try:
-                doc = fitz.open(pdf_path)
-            except Exception as exc:
-                logging.error("Failed to open PDF %s: %s", pdf_path, exc)
-                continue
-            pages: list[Image.Image] = []
-            # Convert every page to a PIL Image
-            for page_num in range(len(doc)):
+        def loop():
+            wait = 0 if resync else interval
+            while not self._frame_sync_stop.wait(wait):
+                wait = interval
                 try:
-                    page = doc[page_num]
-                    pix = page.get_pixmap()
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    pages.append(img)
+                    if client.sync():
+                        self._frames_changed.set()
                 except Exception as exc:
-                    logging.error(
-                        "Failed to render page %d of %s: %s",
-                        page_num + 1,
-                        pdf_path,
-                        exc,
-                    )
-            # Skip files with no renderable pages
-            if not pages:
-                continue
-            # Create a thumbnail from the first page
-            first_page = pages[0]
-            # Determine target thumbnail height.  Use the instance's
-            # configured value if available, otherwise fall back to a
-            # reasonable default.  This allows thumbnails to be larger
-            # and more visible when configured by the user.
-            try:
-                thumb_height = int(getattr(self, "thumbnail_height", CFG.get("thumbnail_height", 100)))
-            except Exception:
-                thumb_height = 100
-            try:
-                ratio = thumb_height / float(first_page.height)
-                thumb_size = (int(first_page.width * ratio), thumb_height)
-                thumbnail = first_page.resize(thumb_size, Image.LANCZOS)
-            except Exception:
-                # Fallback to original size if resizing fails
-                thumbnail = first_page
-            # Create a tinted version of the thumbnail to use when the
-            # corresponding file is selected.  Blend the original
-            # thumbnail with the highlight colour from the configuration.
-            try:
-                hl_hex = CFG.get("highlight_color", "#0077CC")
-                # Ensure the string is in the form #RRGGBB
-                if isinstance(hl_hex, str) and hl_hex.startswith("#") and len(hl_hex) == 7:
-                    hr = int(hl_hex[1:3], 16)
-                    hg = int(hl_hex[3:5], 16)
-                    hb = int(hl_hex[5:7], 16)
-                else:
-                    hr, hg, hb = (0, 119, 204)  # fallback to blue
-                overlay = Image.new("RGB", thumbnail.size, (hr, hg, hb))
-                # Blend original thumbnail with overlay.  Adjust alpha to tune
-                # the intensity of the tint (0.0 = original, 1.0 = full colour).
-                tint_alpha = 0.3
-                try:
-                    # Ensure thumbnail is in RGB mode
-                    base_img = thumbnail.convert("RGB")
-                except Exception:
-                    base_img = thumbnail
-                try:
-                    thumbnail_selected = Image.blend(base_img, overlay, tint_alpha)
-                except Exception:
-                    thumbnail_selected = base_img
-            except Exception:
-                thumbnail_selected = thumbnail
-            # Create enlarged versions of the thumbnails for parallax effect
-            try:
-                factor = float(getattr(self, "thumbnail_enlarge_factor", 1.2))
-                if factor < 1.0:
-                    factor = 1.0
-            except Exception:
-                factor = 1.2
-            try:
-                width_enlarged = int(thumbnail.width * factor)
-                height_enlarged = int(thumbnail.height * factor)
-                thumbnail_enlarged = thumbnail.resize((width_enlarged, height_enlarged), Image.LANCZOS)
-                thumbnail_selected_enlarged = thumbnail_selected.resize((width_enlarged, height_enlarged), Image.LANCZOS)
-            except Exception:
-                thumbnail_enlarged = thumbnail
-                thumbnail_selected_enlarged = thumbnail_selected
-            # Record file info
-            try:
-                modified_time = pdf_path.stat().st_mtime
-            except Exception:
-                modified_time = 0
-            self.files.append({
-                "pages": pages,
-                "thumbnail": thumbnail,
-                "thumbnail_selected": thumbnail_selected,
-                "thumbnail_enlarged": thumbnail_enlarged,
-                "thumbnail_selected_enlarged": thumbnail_selected_enlarged,
-                "path": pdf_path,
-                "modified_time": modified_time,
-            })
-        # If no files loaded, raise an error
-        if not self.files:
-            raise RuntimeError(
-                "No PDF files loaded; please place PDFs in the configured directory."
-            )
-        # Shuffle files if configured
-        if getattr(self, "shuffle_files", False):
-            try:
-                random.shuffle(self.files)
-            except Exception:
-                pass
+                    logging.warning("Frame sync with %s:%s failed: %s", client.host, client.port, exc)
+
+        threading.Thread(target=loop, name="frame-sync", daemon=True).start()
+        self.root.after(1000, self._poll_frame_sync)
+
+    def _poll_frame_sync(self) -> None:
+        if self._frame_sync_stop.is_set():
+            return
+        if self._frames_changed.is_set():
+            self._frames_changed.clear()
+            logging.info("Frame server published new notices")
+            self._reload_pdfs()
+            if self.frame_client is not None:
+                self.frame_client.collect_garbage()
+        self.root.after(1000, self._poll_frame_sync)
+
+    def _start_stall_watchdog(self) -> None:
+        """Start the main-loop stall detector unless it is disabled."""
+        try:
+            threshold = float(CFG.get("stall_threshold_ms", 1000))
+            summary_minutes = float(CFG.get("stall_summary_minutes", 60))
+        except Exception:
+            threshold, summary_minutes = 1000.0, 60.0
+        if threshold <= 0:
+            return
+        self.watchdog = StallWatchdog(
+            self.root,
+            threshold_ms=threshold,
+            summary_interval=summary_minutes * 60,
+        )
+        self.watchdog.start()
+
     def _exit_app(self, event=None) -> None:
         """Exit the application cleanly when Escape is pressed."""
+        self.animator.cancel_all()
+        if self.warm_restart:
+            self._save_state()
+        self.page_thumbnailer.stop()
+        if self.prewarmer is not None:
+            self.prewarmer.stop()
+        self._frame_sync_stop.set()
+        if self.frame_client is not None:
+            self.frame_client.close()
+        if self.watchdog is not None:
+            self.watchdog.stop()
+            summary = self.watchdog.summary()
+            if summary:
+                logging.info("%s", summary)
+        if self.health_server is not None:
+            self.health_server.stop()
+        self.doc_pool.close_all()
+        if self.render_worker is not None:
+            self.render_worker.stop()
+        self.render_costs.save()
+        logging.info("%s", self.render_costs.report())
+        self.disk_cache.close()
         try:
             self.root.destroy()
         except Exception:
@@ -533,30 +4003,10 @@ class DigitalNoticeboard:
         )
         self.top_logo_label.grid(row=0, column=1, sticky="nsew", pady=(10, 5))
         # Load the logo for the top bar
-        top_logo_image = None
-        if LOGO_PATH is not None:
-            logo_source = None
-            try:
-                if LOGO_PATH.exists():
-                    if LOGO_PATH.is_dir():
-                        for pattern in ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.bmp"):
-                            files = list(LOGO_PATH.glob(pattern))
-                            if files:
-                                logo_source = files[0]
-                                break
-                    else:
-                        logo_source = LOGO_PATH
-                if logo_source is not None:
-                    pil_logo = Image.open(logo_source)
-                    # Scale the logo to max_logo_height
-                    ratio = self.max_logo_height / float(pil_logo.height)
-                    new_size = (int(pil_logo.width * ratio), self.max_logo_height)
-                    pil_logo = pil_logo.resize(new_size, Image.LANCZOS)
-                    top_logo_image = ImageTk.PhotoImage(pil_logo)
-                    self.top_logo_label.config(image=top_logo_image)
-                    self.top_logo_label.image = top_logo_image
-            except Exception:
-                pass
+        top_logo_image = self._load_logo_image(self.max_logo_height)
+        if top_logo_image is not None:
+            self.top_logo_label.config(image=top_logo_image)
+            self.top_logo_label.image = top_logo_image
 
         # After laying out the clock, logo and page indicator, adjust the
         # widths of the left and right columns to be equal.  Without this
@@ -589,8 +4039,18 @@ class DigitalNoticeboard:
         self.page_label.grid(row=0, column=2, sticky="e", padx=10, pady=(10, 5))
 
         # Main display area for the current notice
-        self.image_label = tk.Label(self.root, bg=self.background_color)
+        # No border or padding, so a frame the size of the display area fits
+        # the label exactly.
+        self.image_label = tk.Label(
+            self.root,
+            bg=self.background_color,
+            borderwidth=0,
+            highlightthickness=0,
+            padx=0,
+            pady=0,
+        )
         self.image_label.pack(expand=True, fill=tk.BOTH)
+        self.display = DisplaySurface(self.image_label, self.background_color)
 
         # Bottom frame containing the carousel of thumbnails and centre logo
         self.bottom_frame = tk.Frame(self.root, bg=self.background_color)
@@ -610,45 +4070,10 @@ class DigitalNoticeboard:
         self.thumbnails_canvas_window = self.thumbnails_canvas.create_window(
             (0, 0), window=self.thumbnails_container, anchor="nw"
         )
-        # Centre logo frame.  This will remain on the right side of the bottom
-        # row and does not scroll with the carousel.
-        self.center_logo_frame = tk.Frame(self.bottom_frame, bg=self.background_color)
-        self.center_logo_frame.pack(side="right", padx=(10, 10))
-
-        # Load and display the centre logo in the bottom row
-        self.center_logo_label = tk.Label(self.center_logo_frame, bg=self.background_color)
-        # Load the logo image for the centre if LOGO_PATH is provided
-        centre_logo_image = None
-        if LOGO_PATH is not None:
-            logo_source = None
-            try:
-                if LOGO_PATH.exists():
-                    if LOGO_PATH.is_dir():
-                        for pattern in ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.bmp"):
-                            files = list(LOGO_PATH.glob(pattern))
-                            if files:
-                                logo_source = files[0]
-                                break
-                    else:
-                        logo_source = LOGO_PATH
-                if logo_source is not None:
-                    pil_logo = Image.open(logo_source)
-                    # Scale logo to fit bottom row height (use self.max_logo_height)
-                    ratio = self.max_logo_height / float(pil_logo.height)
-                    new_size = (int(pil_logo.width * ratio), self.max_logo_height)
-                    pil_logo = pil_logo.resize(new_size, Image.LANCZOS)
-                    centre_logo_image = ImageTk.PhotoImage(pil_logo)
-                    self.center_logo_label.config(image=centre_logo_image)
-                    self.center_logo_label.image = centre_logo_image
-            except Exception as exc:
-                print(f"Warning: could not load logo from {LOGO_PATH}: {exc}")
-        self.center_logo_label.pack(expand=True)
-        # Hide the bottom logo frame since the logo is now displayed in the
-        # top bar.  This prevents duplication of the logo in the bottom row.
-        try:
-            self.center_logo_frame.pack_forget()
-        except Exception:
-            pass
+        # The bottom row used to carry a second copy of the logo that was
+        # immediately hidden again (the logo lives in the top bar).  It is
+        # no longer built at all, which saves a glob, a decode and a resize
+        # on every start.
 
         # Prepare thumbnail labels list (will be populated in _update_thumbnails)
         self.thumbnail_labels: list[tk.Label] = []
@@ -688,6 +4113,13 @@ class DigitalNoticeboard:
         self.root.bind("<Button-4>", self._on_scroll)
         self.root.bind("<Button-5>", self._on_scroll)
         self.root.bind("<Escape>", self._exit_app)
+        self.root.bind("/", self._open_search)
+        self.root.bind("m", self._log_memory_usage)
+        self.root.bind("M", self._log_memory_usage)
+        self.root.bind("<Control-f>", self._open_search)
+        self.root.bind("o", self._open_overview)
+        self.root.bind("O", self._open_overview)
+        self.root.bind("<Configure>", self._on_configure, add="+")
 
         # Bind panning keys (inherited from earlier code)
         self.root.bind("w", self._pan_up)
@@ -704,6 +4136,35 @@ class DigitalNoticeboard:
 
         # The panning keys and idle overlay have already been bound and created above
 
+    def _find_logo_source(self) -> Path | None:
+        """Return the logo image file configured by ``LOGO_PATH``, if any.
+
+        When ``LOGO_PATH`` is a directory the first image found in it is
+        used.  The lookup is cached so the directory is globbed only once.
+        """
+        if not hasattr(self, "_logo_source"):
+            self._logo_source = _find_logo_file()
+        return self._logo_source
+
+    def _load_logo_image(self, max_height: int):
+        """Load the logo scaled to ``max_height`` pixels as a Tk image.
+
+        Returns None when no logo is configured or it cannot be read.
+        """
+        logo_source = self._find_logo_source()
+        if logo_source is None:
+            return None
+        try:
+            pil_logo = Image.open(logo_source)
+            # Scale the logo to max_height while keeping its aspect ratio
+            ratio = max_height / float(pil_logo.height)
+            new_size = (int(pil_logo.width * ratio), max_height)
+            pil_logo = pil_logo.resize(new_size, Image.LANCZOS)
+            return _new_photo(pil_logo)
+        except Exception as exc:
+            print(f"Warning: could not load logo from {logo_source}: {exc}")
+            return None
+
     def _update_clock(self) -> None:
         """Update the clock on the top bar.
 
@@ -712,19 +4173,14 @@ class DigitalNoticeboard:
         day and year are appended on a second line.  Leading zeros
         are removed from the hour for a cleaner appearance.
         """
-        if self.show_date:
-            # 12‑hour time string, stripping any leading zero from the hour
-            time_str = time.strftime("%I:%M:%S %p").lstrip("0")
-            # Day of week and date (e.g., "Wednesday, Aug 21 2025")
-            date_str = time.strftime("%A, %b %d %Y")
-            now_text = f"{time_str}\n{date_str}"
-        else:
-            # 12‑hour time only
-            now_text = time.strftime("%I:%M:%S %p").lstrip("0")
+        now_text = _clock_text(self.show_date)
         try:
             self.clock_label.config(text=now_text)
         except Exception:
             pass
+        # Doubles as the health endpoint's heartbeat: it proves the Tk loop
+        # is running even while no new frame is drawn
+        self.status = dict(self.status, heartbeat=time.time())
         # Schedule next update
         self.root.after(1000, self._update_clock)
 
@@ -801,7 +4257,7 @@ class DigitalNoticeboard:
         self.offset_y = 0
         self._show_page(0)
 
-    def _show_page(self, page_index: int) -> None:
+    def _show_page(self, page_index: int, interactive: bool = True) -> None:
         """Display a specific page within the current file.
 
         The ``page_index`` parameter refers to the page number within the
@@ -809,10 +4265,13 @@ class DigitalNoticeboard:
         and cropping similarly to the original implementation, but now
         operates on ``self.files[self.current_file_index]['pages']``.
         It also updates the page/notice indicator and schedules the next
-        file to display.
+        file to display.  With ``interactive=False`` (a redraw after a
+        resize) the idle timer and the rotation schedule are left alone.
         """
         # Any call to show a page counts as user interaction
-        self._mark_interaction()
+        if interactive:
+            self._mark_interaction()
+        frame_start = time.perf_counter()
         # Ensure there are files loaded
         if not self.files:
             return
@@ -826,37 +4285,28 @@ class DigitalNoticeboard:
         # Wrap page index around the number of pages in the current file
         page_index = page_index % len(pages)
         self.current_page_index = page_index
-        img = pages[page_index]
-
-        # Determine window dimensions
-        win_w = self.root.winfo_width()
-        # available height excludes the top bar and bottom row
-        # Top frame height includes clock and page indicator; bottom frame holds thumbnails
-        available_h = self.root.winfo_height() - self.top_frame.winfo_height() - self.bottom_frame.winfo_height() - 20
-        if available_h <= 0:
-            available_h = self.root.winfo_height()
-
-        # Compute scaling factor based on fit mode
-        img_w, img_h = img.width, img.height
-        scale = 1.0
-        if self.fit_mode == "fit_width":
-            scale = win_w / img_w if img_w else 1.0
-        elif self.fit_mode == "fit_height":
-            scale = available_h / img_h if img_h else 1.0
-        elif self.fit_mode == "fit_page":
-            if img_w and img_h:
-                scale = min(win_w / img_w, available_h / img_h)
-        elif self.fit_mode == "actual_size":
-            scale = 1.0
-        # Apply zoom factor
-        scale *= self.zoom
-        # Ensure dimensions are at least 1 pixel
-        new_w = max(1, int(img_w * scale))
-        new_h = max(1, int(img_h * scale))
+        failed = False
         try:
-            resized = img.resize((new_w, new_h), Image.LANCZOS)
-        except Exception:
-            resized = img
+            img = pages[page_index]
+        except Exception as exc:
+            # Pages are rendered on first showing; a failure must not stop
+            # the rotation, so a placeholder is shown for this turn.
+            logging.error(
+                "Failed to render page %d of %s: %s",
+                page_index + 1,
+                self.files[self.current_file_index].get("path"),
+                exc,
+            )
+            img, failed = _placeholder_page(), True
+
+        win_w, available_h = self._display_area()
+        frame_key, resized = self._fitted_frame(pages, page_index, img, win_w, available_h)
+        if failed:
+            # Try the real page again next time it comes round
+            self._fitted.pop(frame_key, None)
+            self.memory.discard("fitted", frame_key)
+        new_w, new_h = resized.width, resized.height
+        self._current_fitted_key = frame_key
         # Determine display area dimensions
         display_w = win_w
         display_h = available_h
@@ -889,15 +4339,24 @@ class DigitalNoticeboard:
         else:
             cropped = resized
         # Convert to PhotoImage and update label
-        photo = ImageTk.PhotoImage(cropped)
-        self.image_label.config(image=photo)
-        self.image_label.image = photo
+        # Compose into the back buffer and flip it onto the label
+        self.display.present(cropped, (display_w, display_h))
+        if self.files[self.current_file_index].get("streamed"):
+            self._advance_stream_window(pages, page_index)
+        else:
+            self._queue_next_page()
+        self.memory.add("tk_images", "display", self.display.nbytes)
+        self.memory.enforce()
+        METRICS.observe("frame_ms", (time.perf_counter() - frame_start) * 1000)
+        self._publish_status()
         # Update notice indicator: display current file position (1-based)
         total_files = len(self.files)
         try:
             self.page_label.config(text=f"{self.current_file_index + 1} / {total_files}")
         except Exception:
             pass
+        if not interactive:
+            return
         # We intentionally avoid updating the thumbnail highlight when
         # merely changing pages within the same file.  Updating
         # highlights (and thus enlarged thumbnails) on every page
@@ -915,6 +4374,145 @@ class DigitalNoticeboard:
         self._schedule_next_page()
 
 
+    def _display_area(self) -> tuple[int, int]:
+        """Return the width and height available for the notice."""
+        win_w = self.root.winfo_width()
+        # available height excludes the top bar and bottom row
+        # Top frame height includes clock and page indicator; bottom frame holds thumbnails
+        available_h = self.root.winfo_height() - self.top_frame.winfo_height() - self.bottom_frame.winfo_height() - 20
+        if available_h <= 0:
+            available_h = self.root.winfo_height()
+        return win_w, available_h
+
+    def _fitted_frame(self, pages, page_index: int, img, win_w: int, available_h: int):
+        """Return ``(key, image)`` of a page scaled for the display area."""
+        # Compute scaling factor based on fit mode, then apply zoom
+        img_w, img_h = img.width, img.height
+        scale = _fit_scale(self.fit_mode, img_w, img_h, win_w, available_h) * self.zoom
+        # Ensure dimensions are at least 1 pixel
+        new_w = max(1, int(img_w * scale))
+        new_h = max(1, int(img_h * scale))
+        # Resized frames are cached, so panning or returning to a page
+        # does not resize it again.  Keyed by page number, like the page
+        # cache, so evicting a page also drops its frames.
+        page_num = pages.page_numbers[page_index] if hasattr(pages, "page_numbers") else page_index
+        frame_key = (str(getattr(pages, "path", "")), page_num, new_w, new_h)
+        if abs(new_w - img_w) <= 1 and abs(new_h - img_h) <= 1:
+            # Already rendered for this display area (e.g. a mirrored frame)
+            return frame_key, img
+        resized = self._fitted.get(frame_key)
+        if resized is not None:
+            self._fitted.move_to_end(frame_key)
+            METRICS.incr("fitted_cache_hits")
+            return frame_key, resized
+        METRICS.incr("fitted_cache_misses")
+        try:
+            resized = img.resize((new_w, new_h), Image.LANCZOS)
+        except Exception:
+            resized = img
+        self._fitted[frame_key] = resized
+        self.memory.add(
+            "fitted",
+            frame_key,
+            _image_nbytes(resized),
+            evict=lambda k=frame_key: self._fitted.pop(k, None),
+        )
+        while len(self._fitted) > _FITTED_CACHE_SIZE:
+            old_key, _old = self._fitted.popitem(last=False)
+            self.memory.discard("fitted", old_key)
+        return frame_key, resized
+
+    # ------------------------------------------------------------------
+    # Window resize and display changes
+    def _layout_signature(self) -> tuple[int, int, int, int]:
+        return (
+            self.root.winfo_width(),
+            self.root.winfo_height(),
+            self.root.winfo_screenwidth(),
+            self.root.winfo_screenheight(),
+        )
+
+    def _on_configure(self, event) -> None:
+        """Debounce ``<Configure>`` events of the main window."""
+        if event.widget is not self.root:
+            return
+        if self._relayout_id is not None:
+            try:
+                self.root.after_cancel(self._relayout_id)
+            except Exception:
+                pass
+        self._relayout_id = self.root.after(self.resize_debounce_ms, self._relayout)
+
+    def _relayout(self) -> None:
+        """Recompute the layout once after the window size or display changed.
+
+        Only the size-dependent state is rebuilt: the screen-derived
+        thumbnail and logo heights (and the thumbnails and logo if those
+        changed), the fitted frames and the display buffers.  Page images
+        are kept.  The visible page is redrawn straight away and a few
+        upcoming pages are re-fitted one per idle callback.
+        """
+        self._relayout_id = None
+        try:
+            signature = self._layout_signature()
+        except Exception:
+            return
+        if signature == self._layout_key:
+            return
+        first = self._layout_key is None
+        self._layout_key = signature
+        if not first:
+            logging.info("Display changed to %dx%d (screen %dx%d); re-laying out", *signature)
+        METRICS.incr("relayouts")
+        old_thumb_h, old_logo_h = self.thumbnail_height, self.max_logo_height
+        self._apply_screen_metrics()
+        if self.max_logo_height != old_logo_h:
+            logo = self._load_logo_image(self.max_logo_height)
+            if logo is not None:
+                self.top_logo_label.config(image=logo)
+                self.top_logo_label.image = logo
+        if self.thumbnail_height != old_thumb_h:
+            for digest in list(self._thumb_owners):
+                self._evict_thumbnails(digest)
+                self.memory.discard("thumbnails", digest)
+            self._update_thumbnails()
+        for key in list(self._fitted):
+            self.memory.discard("fitted", key)
+        self._fitted.clear()
+        self._current_fitted_key = None
+        self.display.reset()
+        try:
+            self.root.update_idletasks()
+            self._show_page(self.current_page_index, interactive=False)
+        except Exception as exc:
+            logging.error("Re-layout failed: %s", exc)
+            return
+        self._prefetch_queue = self._upcoming_pages(self.relayout_prefetch)
+        if self._prefetch_queue:
+            self.root.after_idle(self._prefetch_step)
+
+    def _upcoming_pages(self, count: int) -> list[tuple[int, int]]:
+        """Return the next ``count`` (file index, page index) pairs in rotation."""
+        if not self.files:
+            return []
+        self.playlist.seek(self.current_file_index, self.current_page_index)
+        return self.playlist.upcoming(count)
+
+    def _prefetch_step(self) -> None:
+        """Fit one queued page for the current display area."""
+        if not self._prefetch_queue or self._relayout_id is not None:
+            return
+        file_idx, page_idx = self._prefetch_queue.pop(0)
+        try:
+            pages = self.files[file_idx]["pages"]
+            win_w, available_h = self._display_area()
+            self._fitted_frame(pages, page_idx, pages[page_idx], win_w, available_h)
+            self.memory.enforce()
+        except Exception as exc:
+            logging.debug("Prefetch of page %d of file %d failed: %s", page_idx + 1, file_idx + 1, exc)
+        if self._prefetch_queue:
+            self.root.after_idle(self._prefetch_step)
+
     def _show_next_page(self, event=None) -> None:
         """
         Advance to the next page within the current file.
@@ -931,23 +4529,35 @@ class DigitalNoticeboard:
         # Ensure there are files
         if not self.files:
             return
-        # Get pages in current file
-        if 0 <= self.current_file_index < len(self.files):
-            pages = self.files[self.current_file_index].get("pages", [])
-        else:
-            pages = []
-        # If there are pages in current file and we are not on last page
-        if pages and (self.current_page_index + 1) < len(pages):
-            self.current_page_index += 1
-            self._show_page(self.current_page_index)
+        # Continue from wherever the user navigated to
+        self.playlist.seek(self.current_file_index, self.current_page_index)
+        entry = self.playlist.next()
+        if entry is None:
+            return
+        self._go_to_page(*entry)
+
+    def _go_to_page(self, file_index: int, page_index: int) -> None:
+        """Show a playlist entry, switching notice (and thumbnail) if needed."""
+        if self.playlist.cycle != self._rotation_cycle:
+            # A reshuffle moved every page; refresh the eviction order
+            self._update_rotation_positions()
+        if file_index != self.current_file_index:
+            self._select_file(file_index, page_index)
         else:
-            # We are at the last page or no pages at all; move to next file
-            self._show_next_file()
+            self.current_page_index = page_index
+            self._show_page(page_index)
 
     def _show_previous_page(self, event=None) -> None:
         """Go back to the previous page."""
         # Mark user interaction
         self._mark_interaction()
+        if self.playlist.shuffle and self.files:
+            # Step back through the shuffled order
+            self.playlist.seek(self.current_file_index, self.current_page_index)
+            entry = self.playlist.previous()
+            if entry is not None:
+                self._go_to_page(*entry)
+            return
         # Within the current file, move to the previous page (if any)
         pages = []
         if self.files and 0 <= self.current_file_index < len(self.files):
@@ -1033,6 +4643,8 @@ class DigitalNoticeboard:
         logging.info("Reloading PDFs from %s", PDF_DIR)
         try:
             new_pdf_files = find_pdf_files(PDF_DIR)
+            if self.frame_client is not None:
+                new_pdf_files = [p for p in new_pdf_files if self.frame_client.is_live(p)]
             if not new_pdf_files:
                 logging.warning("No PDFs found during reload in %s", PDF_DIR)
             self.pdf_paths = new_pdf_files
@@ -1046,6 +4658,8 @@ class DigitalNoticeboard:
             self.offset_y = 0
             # Refresh thumbnails
             self._update_thumbnails()
+            # Re-index only the notices that changed
+            self._start_indexing()
             # Display the first notice
             self._show_page(0)
             # Schedule rotation if not paused.  Use page-based scheduling
@@ -1098,6 +4712,23 @@ class DigitalNoticeboard:
 
     # ------------------------------------------------------------------
     # Thumbnail highlighting and animation
+    def _label_variant(self, lbl, key: str):
+        """Return the Tk image of a thumbnail variant for ``lbl``, making it if needed."""
+        photo = lbl.variant_images.get(key)
+        if photo is None:
+            photo = _new_photo(self._thumbnail_variant(self.files[lbl.file_index], key))
+            lbl.variant_images[key] = photo
+        return photo
+
+    def _account_thumbnail_photos(self) -> None:
+        """Record the memory held by the Tk copies of the thumbnails."""
+        tk_variants = {}
+        for lbl in getattr(self, "thumbnail_labels", []):
+            for variant in (lbl.normal_image, *lbl.variant_images.values()):
+                tk_variants[id(variant)] = variant
+        tk_bytes = sum(v.width() * v.height() * 4 for v in tk_variants.values())
+        self.memory.add("tk_images", "thumbnails", tk_bytes)
+
     def _update_thumbnail_highlight(self) -> None:
         """
         Update the border highlighting of thumbnails based on the currently
@@ -1105,6 +4736,9 @@ class DigitalNoticeboard:
         defined by ``self.highlight_color`` while all others have no
         border.  This should be called whenever ``self.current_file_index``
         changes or when the thumbnail list is rebuilt.
+
+        Tinted and enlarged variants exist only for the selected thumbnail
+        and its neighbours; the others are released as the selection moves.
         """
         # Determine total number of files to calculate neighbours.  We use
         # modulo arithmetic so that the first and last thumbnails can be
@@ -1116,6 +4750,10 @@ class DigitalNoticeboard:
             right_idx = (self.current_file_index + 1) % total_files
         else:
             left_idx = right_idx = -1
+        keep_digests = set()
+        for idx in {self.current_file_index, left_idx, right_idx}:
+            if 0 <= idx < total_files:
+                keep_digests.add(self.files[idx].get("thumb_digest"))
         for lbl in getattr(self, "thumbnail_labels", []):
             try:
                 idx = getattr(lbl, "file_index", None)
@@ -1124,43 +4762,33 @@ class DigitalNoticeboard:
             # Selected thumbnail: enlarge and apply tinted overlay
             if idx is not None and idx == self.current_file_index:
                 try:
+                    image = self._label_variant(lbl, "thumbnail_selected_enlarged")
                     lbl.config(
-                        image=lbl.selected_enlarged_image,
+                        image=image,
                         highlightthickness=3,
                         highlightbackground=self.highlight_color,
                     )
-                    lbl.image = lbl.selected_enlarged_image
+                    lbl.image = image
                 except Exception:
-                    # Fallback to using the non‑enlarged tinted image
-                    try:
-                        lbl.config(
-                            image=lbl.selected_image,
-                            highlightthickness=3,
-                            highlightbackground=self.highlight_color,
-                        )
-                        lbl.image = lbl.selected_image
-                    except Exception:
-                        lbl.config(highlightthickness=3, highlightbackground=self.highlight_color)
+                    # Fallback to keeping the current image
+                    lbl.config(highlightthickness=3, highlightbackground=self.highlight_color)
             # Immediate neighbours: slightly enlarge to create a subtle parallax
             elif idx is not None and (idx == left_idx or idx == right_idx):
+                lbl.variant_images.pop("thumbnail_selected_enlarged", None)
+                try:
+                    image = self._label_variant(lbl, "thumbnail_enlarged")
+                except Exception:
+                    # Fallback to normal image
+                    image = lbl.normal_image
                 try:
                     lbl.config(
-                        image=lbl.enlarged_image,
+                        image=image,
                         highlightthickness=1,
                         highlightbackground=self.background_color,
                     )
-                    lbl.image = lbl.enlarged_image
+                    lbl.image = image
                 except Exception:
-                    # Fallback to normal image
-                    try:
-                        lbl.config(
-                            image=lbl.normal_image,
-                            highlightthickness=1,
-                            highlightbackground=self.background_color,
-                        )
-                        lbl.image = lbl.normal_image
-                    except Exception:
-                        lbl.config(highlightthickness=1, highlightbackground=self.background_color)
+                    lbl.config(highlightthickness=1, highlightbackground=self.background_color)
             else:
                 # Other thumbnails: normal size, no highlight
                 try:
@@ -1172,61 +4800,39 @@ class DigitalNoticeboard:
                     lbl.image = lbl.normal_image
                 except Exception:
                     lbl.config(highlightthickness=0, highlightbackground=self.background_color)
+                lbl.variant_images.clear()
+        self._release_thumbnail_variants(keep_digests)
+        self._account_thumbnail_photos()
 
-    def _animate_thumbnail_selection(self, new_idx: int, step: int = 0) -> None:
+    def _animate_thumbnail_selection(self, new_idx: int) -> None:
+        """Apply a new selection and pulse the border of the selected thumbnail.
 
-        # We pulse the border thickness of the selected thumbnail while
-        # leaving images unchanged.  On the first animation step, ensure
-        # that the correct images (enlarged and tinted) are applied
-        # according to the new selection.
-        if step == 0:
-            try:
-                self._update_thumbnail_highlight()
-            except Exception:
-                pass
-        # Define pulse steps only once
-        if not hasattr(self, "_highlight_pulse_steps"):
-            self._highlight_pulse_steps = [0, 1, 2, 3, 2, 1]
-        steps = self._highlight_pulse_steps
-        if step >= len(steps):
-            # Finalize highlight state and exit
-            try:
-                self._update_thumbnail_highlight()
-            except Exception:
-                pass
-            return
-        thickness = steps[step]
-        # Determine neighbours for consistent border handling
-        total_files = len(self.files)
-        if total_files > 0:
-            left_idx = (new_idx - 1) % total_files
-            right_idx = (new_idx + 1) % total_files
-        else:
-            left_idx = right_idx = -1
+        Selecting again while a pulse is running restarts it on the new
+        thumbnail, so quick navigation never leaves an old pulse running.
+        """
+        self._update_thumbnail_highlight()
+        label = None
         for lbl in getattr(self, "thumbnail_labels", []):
-            idx = getattr(lbl, "file_index", None)
-            if idx is None:
-                continue
-            if idx == new_idx:
-                # Pulse border on the selected thumbnail
-                try:
-                    lbl.config(highlightthickness=thickness, highlightbackground=self.highlight_color)
-                except Exception:
-                    pass
-            elif idx == left_idx or idx == right_idx:
-                # Neighbour thumbnails have a thin border to subtly separate
-                try:
-                    lbl.config(highlightthickness=1, highlightbackground=self.background_color)
-                except Exception:
-                    pass
-            else:
-                # All other thumbnails have no border
-                try:
-                    lbl.config(highlightthickness=0, highlightbackground=self.background_color)
-                except Exception:
-                    pass
-        # Schedule the next pulse step
-        self.root.after(80, lambda: self._animate_thumbnail_selection(new_idx, step + 1))
+            if getattr(lbl, "file_index", None) == new_idx:
+                label = lbl
+                break
+        if label is None:
+            self.animator.cancel("thumbnail_pulse")
+            return
+
+        def _apply(value: float, lbl=label) -> None:
+            lbl.config(highlightthickness=max(0, round(value)), highlightbackground=self.highlight_color)
+
+        # Pulse the border 0 -> 3 -> 0, then settle on the selected style
+        self.animator.animate(
+            "thumbnail_pulse",
+            0,
+            3,
+            self.pulse_duration_ms,
+            _apply,
+            easing=_ease_pulse,
+            on_done=self._update_thumbnail_highlight,
+        )
 
     # ------------------------------------------------------------------
     # Carousel scrolling
@@ -1304,56 +4910,34 @@ class DigitalNoticeboard:
         except Exception:
             fraction = 0.0
         if not animate:
+            self.animator.cancel("carousel_scroll")
             try:
                 self.thumbnails_canvas.xview_moveto(fraction)
                 self.current_scroll_fraction = fraction
             except Exception:
                 pass
             return
-        # Animate from current position to target fraction
-        try:
+
+        def _apply(value: float) -> None:
+            self.thumbnails_canvas.xview_moveto(value)
+            self.current_scroll_fraction = value
+
+        # Animate from wherever the carousel is now, including part-way
+        # through an earlier scroll, to the target fraction
+        current = self.animator.value("carousel_scroll")
+        if current is None:
             current = getattr(self, "current_scroll_fraction", None)
-            if current is None:
-                try:
-                    # Query current fraction from canvas xview
-                    current = self.thumbnails_canvas.xview()[0]
-                except Exception:
-                    current = 0.0
-            # Clamp values between 0 and 1
-            current = max(0.0, min(current, 1.0))
-            target = max(0.0, min(fraction, 1.0))
-            # If difference is small, jump directly
-            if abs(target - current) < 0.001:
-                try:
-                    self.thumbnails_canvas.xview_moveto(target)
-                    self.current_scroll_fraction = target
-                except Exception:
-                    pass
-                return
-            # Determine number of steps for smooth animation
-            steps = 10
-            delta = (target - current) / float(steps)
-            # Closure for incremental updates
-            def _animate_step(step_count: int, current_val: float) -> None:
-                new_val = current_val + delta
-                # Move canvas to new position
-                try:
-                    self.thumbnails_canvas.xview_moveto(new_val)
-                    self.current_scroll_fraction = new_val
-                except Exception:
-                    pass
-                # Schedule next step or finish
-                if step_count < steps - 1:
-                    self.root.after(40, lambda: _animate_step(step_count + 1, new_val))
-                else:
-                    # Final position
-                    try:
-                        self.thumbnails_canvas.xview_moveto(target)
-                        self.current_scroll_fraction = target
-                    except Exception:
-                        pass
-            # Start animation
-            _animate_step(0, current)
+        if current is None:
+            try:
+                current = self.thumbnails_canvas.xview()[0]
+            except Exception:
+                current = 0.0
+        current = max(0.0, min(current, 1.0))
+        target = max(0.0, min(fraction, 1.0))
+        # If difference is small, jump directly
+        duration = self.scroll_duration_ms if abs(target - current) >= 0.001 else 0
+        try:
+            self.animator.animate("carousel_scroll", current, target, duration, _apply)
         except Exception:
             # Fallback: jump to final
             try:
@@ -1362,13 +4946,14 @@ class DigitalNoticeboard:
             except Exception:
                 pass
 
-    def _select_file(self, index: int) -> None:
+    def _select_file(self, index: int, page_index: int = 0) -> None:
         """
         Display the specified file by index.
 
         When a thumbnail in the bottom row is clicked, this method is
         invoked to switch the main display to that PDF's first page.
-        It resets the page index, panning offsets and schedules the
+        ``page_index`` selects a different starting page (used by the
+        search overlay).  It resets the panning offsets and schedules the
         rotation as usual.  Indexes that are out of range are ignored.
         """
         # Mark user interaction for idle timeout handling
@@ -1379,38 +4964,483 @@ class DigitalNoticeboard:
             index = int(index)
         except Exception:
             return
-        if index < 0 or index >= len(self.files):
+        if index < 0 or index >= len(self.files):
+            return
+        self.current_file_index = index
+        self.current_page_index = page_index
+        self.offset_x = 0
+        self.offset_y = 0
+        # Scroll the carousel to bring the selected file into view
+        try:
+            self._scroll_to_index(self.current_file_index, animate=self.scroll_animation)
+        except Exception:
+            pass
+        # Trigger an animation on the thumbnails
+        try:
+            self._animate_thumbnail_selection(self.current_file_index)
+        except Exception:
+            try:
+                self._update_thumbnail_highlight()
+            except Exception:
+                pass
+        # Show the requested page of the selected file
+        self._show_page(page_index)
+
+    # ------------------------------------------------------------------
+    # Warm restart
+    def _read_state(self) -> dict | None:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logging.warning("Ignoring unreadable state file %s: %s", self.state_path, exc)
+            return None
+        if not isinstance(state, dict) or state.get("version") != 1:
+            return None
+        # Only resume when the notice that was showing still exists
+        if state.get("file") not in {str(p) for p in self.pdf_paths}:
+            return None
+        # The frames saved for a warm start live in that run's disk cache
+        if state.get("disk_cache") != str(self.disk_cache.directory):
+            logging.info("Disk cache moved since the state was saved; starting cold")
+            return None
+        return state
+
+    def _state(self) -> dict:
+        info = self.files[self.current_file_index]
+        return {
+            "version": 1,
+            "saved_at": time.time(),
+            "file": str(info["path"]),
+            "page": self.current_page_index,
+            "zoom": self.zoom,
+            "fit_mode": self.fit_mode,
+            "disk_cache": str(self.disk_cache.directory),
+            "playlist": {
+                "shuffle": self.playlist.shuffle,
+                "position": self.playlist.position,
+                "order": [[str(self.files[f]["path"]), p] for f, p in self.playlist.entries],
+            },
+        }
+
+    def _save_state(self) -> None:
+        """Write the playback state and make sure the next frames are on disk.
+
+        The page on screen, the next few in the playlist and the first page
+        of every notice (for the thumbnails) are added to the disk cache if
+        missing, so a restart can show them without rendering.
+        """
+        if not self.files:
+            return
+        try:
+            _write_json_atomic(self.state_path, self._state())
+        except Exception as exc:
+            logging.warning("Could not save state %s: %s", self.state_path, exc)
+            return
+        self.render_costs.save()
+        warm = [(self.current_file_index, self.current_page_index)]
+        warm += self._upcoming_pages(self.stream_window)
+        warm += [(f, 0) for f in range(len(self.files))]
+        for file_idx, page_idx in warm:
+            pages = self.files[file_idx]["pages"]
+            page_num = pages.page_numbers[page_idx % len(pages)]
+            img = self._page_images.get((str(pages.path), page_num))
+            variant = f"p{page_num}@1"
+            if img is not None and not self.disk_cache.contains(pages.path, variant):
+                self.disk_cache.put(pages.path, variant, img)
+
+    def _save_state_periodically(self) -> None:
+        self._save_state()
+        self.root.after(self.state_save_interval * 1000, self._save_state_periodically)
+
+    def _restore_state(self, state: dict) -> None:
+        """Resume the rotation where the previous run left off."""
+        index_by_path = {str(info["path"]): i for i, info in enumerate(self.files)}
+        file_idx = index_by_path.get(state.get("file"))
+        if file_idx is None:
+            return
+        self.current_file_index = file_idx
+        pages = self.files[file_idx]["pages"]
+        try:
+            self.current_page_index = min(max(0, int(state.get("page", 0))), len(pages) - 1)
+            self.zoom = min(8.0, max(0.1, float(state.get("zoom", 1.0))))
+        except (TypeError, ValueError):
+            self.current_page_index, self.zoom = 0, 1.0
+        if state.get("fit_mode") in ("fit_page", "fit_width", "fit_height", "actual_size"):
+            self.fit_mode = state["fit_mode"]
+        # Keep the shuffled order if it still describes the same notices
+        saved = state.get("playlist") or {}
+        if saved.get("shuffle") == self.playlist.shuffle:
+            try:
+                order = [(index_by_path[path], page) for path, page in saved["order"]]
+                self.playlist.restore(order, int(saved.get("position", 0)))
+            except (KeyError, TypeError, ValueError):
+                pass
+        self.playlist.seek(self.current_file_index, self.current_page_index)
+        self._update_rotation_positions()
+        logging.info(
+            "Resuming at page %d of %s",
+            self.current_page_index + 1,
+            self.files[file_idx]["path"],
+        )
+
+    # ------------------------------------------------------------------
+    # Page overview grid
+    def _open_overview(self, event=None) -> None:
+        """Show a scrollable grid of every page; clicking a tile jumps to it.
+
+        The grid is virtualised: only the rows in view (plus one above and
+        below) have canvas items and Tk images, so it stays responsive with
+        thousands of pages.
+        """
+        self._mark_interaction()
+        if not self.files:
+            return
+        if self.overview_frame is None:
+            self.overview_frame = tk.Frame(self.root, bg=self.background_color)
+            self.overview_canvas = tk.Canvas(self.overview_frame, bg=self.background_color, highlightthickness=0)
+            scrollbar = tk.Scrollbar(self.overview_frame, orient="vertical", command=self._overview_yview)
+            self.overview_canvas.configure(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            self.overview_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            canvas = self.overview_canvas
+            # Keep the board's single-key shortcuts (Escape exits!) away
+            # from the grid while it has focus.
+            canvas.bindtags((str(canvas), "Canvas", "all"))
+            canvas.bind("<Escape>", self._close_overview)
+            canvas.bind("o", self._close_overview)
+            canvas.bind("O", self._close_overview)
+            canvas.bind("<Configure>", self._layout_overview)
+            canvas.bind("<MouseWheel>", lambda e: self._overview_yview("scroll", -1 if e.delta > 0 else 1, "units"))
+            canvas.bind("<Button-4>", lambda e: self._overview_yview("scroll", -1, "units"))
+            canvas.bind("<Button-5>", lambda e: self._overview_yview("scroll", 1, "units"))
+            canvas.bind("<Prior>", lambda e: self._overview_yview("scroll", -1, "pages"))
+            canvas.bind("<Next>", lambda e: self._overview_yview("scroll", 1, "pages"))
+            canvas.bind("<Button-1>", self._overview_click)
+        self._overview_entries = [
+            (f, p, str(info["pages"].path), info["pages"].page_numbers[p])
+            for f, info in enumerate(self.files)
+            for p in range(len(info["pages"]))
+        ]
+        self._overview_tiles: dict[int, tuple] = {}
+        self._overview_cols = 0
+        self.overview_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.overview_frame.lift()
+        self.overview_canvas.focus_set()
+        self.root.update_idletasks()
+        self._layout_overview()
+        # Start with the current page in view
+        current = next(
+            (i for i, e in enumerate(self._overview_entries) if e[:2] == (self.current_file_index, self.current_page_index)),
+            0,
+        )
+        rows = -(-len(self._overview_entries) // self._overview_cols)
+        row = current // self._overview_cols
+        self._overview_yview("moveto", max(0.0, (row - 1) / max(1, rows)))
+        # Opening it again while shown must not start a second loop
+        if self._overview_poll_id is not None:
+            self.root.after_cancel(self._overview_poll_id)
+        self._poll_overview()
+
+    def _overview_tile_size(self) -> tuple[int, int]:
+        height = self.page_thumbnailer.height
+        return int(height * 1.5) + 16, height + 36
+
+    def _layout_overview(self, event=None) -> None:
+        """Recompute the number of columns and redraw the visible rows."""
+        canvas = self.overview_canvas
+        tile_w, tile_h = self._overview_tile_size()
+        cols = max(1, canvas.winfo_width() // tile_w)
+        rows = -(-len(self._overview_entries) // cols)
+        if cols != self._overview_cols:
+            canvas.delete("all")
+            self._overview_tiles = {}
+            self._overview_cols = cols
+        canvas.configure(scrollregion=(0, 0, cols * tile_w, rows * tile_h))
+        self._render_overview_tiles()
+
+    def _overview_yview(self, *args) -> None:
+        self.overview_canvas.yview(*args)
+        self._render_overview_tiles()
+
+    def _render_overview_tiles(self) -> None:
+        """Create the tiles that scrolled into view and drop the rest."""
+        canvas = self.overview_canvas
+        tile_w, tile_h = self._overview_tile_size()
+        cols = self._overview_cols
+        top = canvas.canvasy(0)
+        first_row = max(0, int(top // tile_h) - 1)
+        last_row = int((top + canvas.winfo_height()) // tile_h) + 1
+        visible = range(first_row * cols, min(len(self._overview_entries), (last_row + 1) * cols))
+        for index in [i for i in self._overview_tiles if i not in visible]:
+            for item in self._overview_tiles.pop(index)[0]:
+                canvas.delete(item)
+        wanted = []
+        for index in visible:
+            if index not in self._overview_tiles:
+                file_idx, page_idx, path, page_num = self._overview_entries[index]
+                x = (index % cols) * tile_w
+                y = (index // cols) * tile_h
+                current = (file_idx, page_idx) == (self.current_file_index, self.current_page_index)
+                items = [
+                    canvas.create_rectangle(
+                        x + 4, y + 4, x + tile_w - 4, y + tile_h - 4,
+                        outline=self.highlight_color if current else "#CCCCCC",
+                        width=3 if current else 1,
+                    ),
+                    canvas.create_text(
+                        x + tile_w // 2, y + tile_h - 16,
+                        text=f"{Path(path).stem[:24]}  p.{page_idx + 1}",
+                        font=("Helvetica", 10),
+                    ),
+                ]
+                self._overview_tiles[index] = (items, None)
+            if self._overview_tiles[index][1] is None:
+                key = self._overview_entries[index][2:]
+                if not self._place_overview_image(index):
+                    wanted.append(key)
+        self.page_thumbnailer.want(wanted)
+
+    def _place_overview_image(self, index: int) -> bool:
+        """Put the thumbnail on tile ``index`` if it is available."""
+        key = self._overview_entries[index][2:]
+        img = self.page_thumbnailer.get(key)
+        if img is None:
+            return False
+        tile_w, tile_h = self._overview_tile_size()
+        cols = self._overview_cols
+        x = (index % cols) * tile_w + tile_w // 2
+        y = (index // cols) * tile_h + 8
+        if img.width > tile_w - 16:
+            img = img.resize((tile_w - 16, max(1, img.height * (tile_w - 16) // img.width)), Image.LANCZOS)
+        photo = _new_photo(img)
+        items, _old = self._overview_tiles[index]
+        items = items + [self.overview_canvas.create_image(x, y, image=photo, anchor="n")]
+        self._overview_tiles[index] = (items, photo)
+        return True
+
+    def _poll_overview(self) -> None:
+        """Show thumbnails finished by the background thread."""
+        self._overview_poll_id = None
+        if self.overview_frame is None or not self.overview_frame.winfo_ismapped():
+            return
+        finished = set(self.page_thumbnailer.take_finished())
+        for key in finished:
+            img = self.page_thumbnailer.get(key)
+            if img is not None:
+                self.memory.add(
+                    "page_thumbnails",
+                    key,
+                    _image_nbytes(img),
+                    evict=lambda k=key: self.page_thumbnailer.discard(k),
+                )
+        if finished:
+            for index, (_items, photo) in list(self._overview_tiles.items()):
+                if photo is None and self._overview_entries[index][2:] in finished:
+                    self._place_overview_image(index)
+            self.memory.enforce()
+        self._overview_poll_id = self.root.after(100, self._poll_overview)
+
+    def _overview_click(self, event) -> None:
+        tile_w, tile_h = self._overview_tile_size()
+        x = self.overview_canvas.canvasx(event.x)
+        y = self.overview_canvas.canvasy(event.y)
+        col = int(x // tile_w)
+        if col >= self._overview_cols:
+            return
+        index = int(y // tile_h) * self._overview_cols + col
+        if 0 <= index < len(self._overview_entries):
+            file_idx, page_idx = self._overview_entries[index][:2]
+            self._close_overview()
+            self._select_file(file_idx, page_idx)
+
+    def _close_overview(self, event=None) -> str:
+        """Hide the overview and release its Tk images."""
+        if self.overview_frame is not None:
+            self.overview_canvas.delete("all")
+            self._overview_tiles = {}
+            self._overview_cols = 0
+            self.overview_frame.place_forget()
+            self.page_thumbnailer.want([])
+        if self._overview_poll_id is not None:
+            self.root.after_cancel(self._overview_poll_id)
+            self._overview_poll_id = None
+        self.root.focus_set()
+        return "break"
+
+    # ------------------------------------------------------------------
+    # Full-text search
+    def _start_indexing(self) -> None:
+        """Update the search index for the current notices on a background thread."""
+        if not self.search_enabled:
             return
-        self.current_file_index = index
-        self.current_page_index = 0
-        self.offset_x = 0
-        self.offset_y = 0
-        # Scroll the carousel to bring the selected file into view
-        try:
-            self._scroll_to_index(self.current_file_index, animate=self.scroll_animation)
-        except Exception:
-            pass
-        # Trigger an animation on the thumbnails
+        with self._index_lock:
+            if self._index_running:
+                # The running pass will go round again with the new file list
+                self._index_pending = True
+                return
+            self._index_running = True
+        self._index_thread = threading.Thread(target=self._index_worker, name="search-index", daemon=True)
+        self._index_thread.start()
+
+    def _index_worker(self) -> None:
         try:
-            self._animate_thumbnail_selection(self.current_file_index)
-        except Exception:
+            if self.search_index is None:
+                self.search_index = SearchIndex(CACHE_DIR / "search_index.json")
+            while True:
+                with self._index_lock:
+                    self._index_pending = False
+                paths = [f["path"] for f in list(self.files)]
+                start = time.perf_counter()
+                if self.search_index.update(paths):
+                    logging.info(
+                        "Search index updated for %d notices in %.1f s",
+                        len(paths),
+                        time.perf_counter() - start,
+                    )
+                with self._index_lock:
+                    if not self._index_pending:
+                        self._index_running = False
+                        return
+        except Exception as exc:
+            logging.error("Search indexing failed: %s", exc)
+        with self._index_lock:
+            self._index_running = False
+
+    def _open_search(self, event=None) -> None:
+        """Show the search overlay over the current notice."""
+        self._mark_interaction()
+        if getattr(self, "search_frame", None) is None:
+            self.search_frame = tk.Frame(
+                self.root,
+                bg=self.highlight_color,
+                padx=2,
+                pady=2,
+            )
+            self.search_var = tk.StringVar()
+            self.search_entry = tk.Entry(
+                self.search_frame,
+                textvariable=self.search_var,
+                font=("Helvetica", 18),
+            )
+            self.search_entry.pack(side=tk.TOP, fill=tk.X)
+            self.search_results = tk.Listbox(
+                self.search_frame,
+                font=("Helvetica", 14),
+                height=10,
+                activestyle="dotbox",
+            )
+            self.search_results.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            # Keep typing from triggering the board's single-letter shortcuts,
+            # which are bound on the toplevel window.
+            for widget, cls in ((self.search_entry, "Entry"), (self.search_results, "Listbox")):
+                widget.bindtags((str(widget), cls, "all"))
+                widget.bind("<Escape>", self._close_search)
+                widget.bind("<Return>", self._search_jump)
+            self.search_entry.bind("<KeyRelease>", self._on_search_key)
+            self.search_entry.bind("<Down>", self._focus_search_results)
+            self.search_results.bind("<Double-Button-1>", self._search_jump)
+            self._search_after_id = None
+            self._search_hits: list[tuple[int, int]] = []
+        self.search_frame.place(relx=0.5, rely=0.15, anchor="n", relwidth=0.6)
+        self.search_frame.lift()
+        self.search_entry.focus_set()
+        self.search_entry.select_range(0, tk.END)
+        self._run_search()
+
+    def _close_search(self, event=None) -> str:
+        """Hide the search overlay."""
+        frame = getattr(self, "search_frame", None)
+        if frame is not None:
+            frame.place_forget()
+        self.root.focus_set()
+        return "break"
+
+    def _focus_search_results(self, event=None) -> str:
+        if self.search_results.size():
+            self.search_results.focus_set()
+            self.search_results.selection_clear(0, tk.END)
+            self.search_results.selection_set(0)
+            self.search_results.activate(0)
+        return "break"
+
+    def _on_search_key(self, event=None) -> None:
+        """Re-run the query shortly after the user stops typing."""
+        self._mark_interaction()
+        if self._search_after_id is not None:
             try:
-                self._update_thumbnail_highlight()
+                self.root.after_cancel(self._search_after_id)
             except Exception:
                 pass
-        # Show first page of selected file
-        self._show_page(0)
+        self._search_after_id = self.root.after(120, self._run_search)
+
+    def _run_search(self) -> None:
+        self._search_after_id = None
+        self.search_results.delete(0, tk.END)
+        self._search_hits = []
+        query = self.search_var.get().strip()
+        if not query:
+            return
+        if self.search_index is None:
+            self.search_results.insert(tk.END, "Indexing notices…")
+            return
+        index_by_path = {str(f["path"]): i for i, f in enumerate(self.files)}
+        for key, page_num, snippet in self.search_index.search(query):
+            file_index = index_by_path.get(key)
+            if file_index is None:
+                continue
+            # Pages that failed to load are missing from the notice, so
+            # page numbers and page indices can differ
+            page_numbers = getattr(self.files[file_index]["pages"], "page_numbers", None)
+            if page_numbers is None:
+                page_index = page_num
+            elif page_num in page_numbers:
+                page_index = page_numbers.index(page_num)
+            else:
+                continue
+            self._search_hits.append((file_index, page_index))
+            self.search_results.insert(tk.END, f"{Path(key).stem}  p.{page_num + 1}:  {snippet}")
+        if not self._search_hits:
+            self.search_results.insert(tk.END, "No matching notices")
+
+    def _search_jump(self, event=None) -> str:
+        """Jump to the selected (or first) search result and close the overlay."""
+        if not self._search_hits:
+            return "break"
+        selection = self.search_results.curselection()
+        choice = selection[0] if selection else 0
+        if choice >= len(self._search_hits):
+            return "break"
+        file_index, page_index = self._search_hits[choice]
+        self._close_search()
+        self._select_file(file_index, page_index)
+        return "break"
 
     def run(self) -> None:
         """Display the first page and start Tkinter main loop."""
-        self._show_page(0)
+        with PROFILER.phase("first frame"):
+            self._show_page(self.current_page_index)
+            # Flush pending geometry and redraw work so the frame is really
+            # on screen before the phase ends.
+            self.root.update_idletasks()
+        # Later <Configure> events only trigger a re-layout if they change this
+        try:
+            self._layout_key = self._layout_signature()
+        except Exception:
+            pass
+        if PROFILER.enabled:
+            report = PROFILER.report()
+            print(report)
+            logging.info("%s", report)
         self.root.mainloop()
 
     # ------------------------------------------------------------------
     # User interaction and idle handling
     def _mark_interaction(self) -> None:
         """Record the time of the most recent user interaction and hide idle overlay."""
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = self.clock()
         # Hide the idle overlay if it is currently displayed
         try:
             if hasattr(self, "idle_overlay"):
@@ -1433,7 +5463,7 @@ class DigitalNoticeboard:
         except Exception:
             timeout = 0
         if timeout and timeout > 0:
-            now = time.time()
+            now = self.clock()
             if now - self.last_interaction_time >= timeout:
                 # Trigger idle screensaver if not already active
                 if not getattr(self, "idle_paused", False):
@@ -1473,26 +5503,21 @@ class DigitalNoticeboard:
         if total_files == 0:
             return
 
+        # Rebuild any thumbnail sources evicted under memory pressure
+        for file_info in self.files:
+            try:
+                self._ensure_thumbnails(file_info)
+            except Exception as exc:
+                logging.error("Failed to build thumbnail for %s: %s", file_info.get("path"), exc)
+
         max_w = 0
         max_h = 0
         for file_info in self.files:
-            thumb_enl = file_info.get("thumbnail_enlarged")
-            # Use enlarged version if present, otherwise fall back to normal
-            if thumb_enl is not None:
-                try:
-                    w, h = thumb_enl.size
-                except Exception:
-                    w = thumb_enl.width
-                    h = thumb_enl.height
-            else:
-                thumb_img = file_info.get("thumbnail")
-                if thumb_img is None:
-                    continue
-                try:
-                    w, h = thumb_img.size
-                except Exception:
-                    w = thumb_img.width
-                    h = thumb_img.height
+            thumb_img = file_info.get("thumbnail")
+            if thumb_img is None:
+                continue
+            # Leave room for the enlarged variant, whether or not it exists yet
+            w, h = self._thumbnail_enlarge_size(thumb_img.size)
             if w > max_w:
                 max_w = w
             if h > max_h:
@@ -1505,23 +5530,13 @@ class DigitalNoticeboard:
 
         for idx, file_info in enumerate(self.files):
             thumb_img = file_info.get("thumbnail")
-            thumb_sel_img = file_info.get("thumbnail_selected")
-            thumb_enlarged = file_info.get("thumbnail_enlarged")
-            thumb_sel_enlarged = file_info.get("thumbnail_selected_enlarged")
-            if thumb_img is None or thumb_sel_img is None:
+            if thumb_img is None:
                 continue
             try:
-                tk_img_normal = ImageTk.PhotoImage(thumb_img)
-                tk_img_selected = ImageTk.PhotoImage(thumb_sel_img)
-
-                if thumb_enlarged is not None:
-                    tk_img_enlarged = ImageTk.PhotoImage(thumb_enlarged)
-                else:
-                    tk_img_enlarged = tk_img_normal
-                if thumb_sel_enlarged is not None:
-                    tk_img_sel_enlarged = ImageTk.PhotoImage(thumb_sel_enlarged)
-                else:
-                    tk_img_sel_enlarged = tk_img_selected
+                # Only the plain variant is converted up front; the tinted
+                # and enlarged ones follow the selection (see
+                # _update_thumbnail_highlight)
+                tk_img_normal = _new_photo(thumb_img)
             except Exception:
                 # Skip this file if image conversion fails
                 continue
@@ -1538,11 +5553,10 @@ class DigitalNoticeboard:
             )
             # Prevent the label from shrinking/growing to its image size.
             lbl.pack_propagate(False)
-            # Store different image variants on the label for quick switching
+            # Tk copies of the other variants, made while the notice is
+            # selected or next to the selection
             lbl.normal_image = tk_img_normal
-            lbl.selected_image = tk_img_selected
-            lbl.enlarged_image = tk_img_enlarged
-            lbl.selected_enlarged_image = tk_img_sel_enlarged
+            lbl.variant_images = {}
             lbl.image = tk_img_normal
             try:
                 file_index = idx
@@ -1552,6 +5566,8 @@ class DigitalNoticeboard:
             lbl.bind("<Button-1>", lambda event, idx=file_index: self._select_file(idx))
             lbl.pack(side="left", anchor="s", padx=5, pady=0)
             self.thumbnail_labels.append(lbl)
+        self._account_thumbnail_photos()
+        self.memory.enforce()
         # Update canvas height to accommodate the fixed thumbnail height
         try:
             self.thumbnails_container.update_idletasks()
@@ -1620,28 +5636,1198 @@ class DigitalNoticeboard:
         self._show_page(self.current_page_index)
 
 
+def _rss_bytes() -> int:
+    """Return the resident set size of this process in bytes (0 if unknown)."""
+    try:
+        if sys.platform.startswith("win"):
+            import ctypes
+            from ctypes import wintypes
+
+            class _Counters(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = _Counters()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return int(counters.WorkingSetSize)
+            return 0
+        with open("/proc/self/statm", "r", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return 0
+
+
+class VirtualClock:
+    """A clock that only moves when told to, with an ``after``-style queue.
+
+    Callbacks are kept in a heap ordered by their due time; advancing the
+    clock runs everything that falls due, in order, jumping straight over
+    the idle time in between.
+    """
+
+    def __init__(self, start: float | None = None) -> None:
+        self.now = time.time() if start is None else start
+        self._queue: list[tuple[float, int, str, object, tuple]] = []
+        self._cancelled: set[str] = set()
+        self._seq = 0
+
+    def time(self) -> float:
+        return self.now
+
+    def schedule(self, delay_ms, func, args=()) -> str:
+        self._seq += 1
+        after_id = f"after#v{self._seq}"
+        due = self.now + max(0, int(delay_ms)) / 1000.0
+        heapq.heappush(self._queue, (due, self._seq, after_id, func, args))
+        return after_id
+
+    def cancel(self, after_id) -> None:
+        if any(entry[2] == after_id for entry in self._queue):
+            self._cancelled.add(after_id)
+
+    def _prune(self) -> None:
+        while self._queue and self._queue[0][2] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(self._queue)[2])
+
+    @property
+    def pending(self) -> int:
+        """Number of callbacks waiting to run."""
+        return len(self._queue) - len(self._cancelled)
+
+    def next_due(self) -> float | None:
+        self._prune()
+        return self._queue[0][0] if self._queue else None
+
+    def advance_to(self, when: float) -> int:
+        """Run every callback due up to ``when`` and set the clock to it."""
+        ran = 0
+        while True:
+            self._prune()
+            if not self._queue or self._queue[0][0] > when:
+                break
+            due, _seq, _after_id, func, args = heapq.heappop(self._queue)
+            self.now = max(self.now, due)
+            try:
+                func(*args)
+            except Exception as exc:
+                logging.error("Soak: callback %r failed: %s", func, exc)
+            ran += 1
+        self.now = max(self.now, when)
+        return ran
+
+
+class VirtualRoot:
+    """Proxy for a ``tk.Tk`` root whose timers run on a :class:`VirtualClock`.
+
+    Everything except ``after``, ``after_idle`` and ``after_cancel`` is
+    delegated to the real root, so widgets are created and drawn normally.
+    """
+
+    def __init__(self, root, clock: VirtualClock) -> None:
+        self._root = root
+        self.clock = clock
+
+    def __getattr__(self, name):
+        return getattr(self._root, name)
+
+    def after(self, ms, func=None, *args):
+        if func is None:
+            self.clock.advance_to(self.clock.now + int(ms) / 1000.0)
+            return None
+        return self.clock.schedule(ms, func, args)
+
+    def after_idle(self, func, *args):
+        return self.clock.schedule(0, func, args)
+
+    def after_cancel(self, after_id) -> None:
+        self.clock.cancel(after_id)
+
+
+def _start_xvfb():
+    """Start an Xvfb server if there is no display; returns the process or None."""
+    if sys.platform.startswith("win") or sys.platform == "darwin" or os.environ.get("DISPLAY"):
+        return None
+    import shutil
+    import subprocess
+
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise RuntimeError("No display available and Xvfb is not installed; run under xvfb-run.")
+    for display in range(99, 120):
+        if os.path.exists(f"/tmp/.X11-unix/X{display}"):
+            continue
+        proc = subprocess.Popen(
+            [xvfb, f":{display}", "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for _ in range(50):
+            if os.path.exists(f"/tmp/.X11-unix/X{display}"):
+                os.environ["DISPLAY"] = f":{display}"
+                return proc
+            if proc.poll() is not None:
+                break
+            time.sleep(0.1)
+        proc.terminate()
+    raise RuntimeError("Could not start Xvfb")
+
+
+def _trend(times: list[float], values: list[float]) -> float:
+    """Least-squares slope of ``values`` over ``times``."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_t = sum(times) / n
+    mean_v = sum(values) / n
+    var = sum((t - mean_t) ** 2 for t in times)
+    if not var:
+        return 0.0
+    return sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values)) / var
+
+
+class SoakHarness:
+    """Drive a DigitalNoticeboard through days of simulated operation.
+
+    The board runs on a real Tk root (under Xvfb when there is no display),
+    but all of its timers go through a :class:`VirtualClock`, so rotation,
+    clock ticks, animations and idle checks run back to back instead of in
+    real time.  Random user input and periodic reloads are injected along
+    the way.  At regular virtual intervals the harness samples RSS, the
+    number of live Tk images, pending ``after`` callbacks and the latency
+    of the frames rendered since the last sample.  After a warm-up period,
+    a metric that keeps growing over the run counts as a failure.
+    """
+
+    # Growth over the measured part of the run that is tolerated per metric
+    TOLERANCE = {
+        "rss_mb": 16.0,
+        "tk_images": 4,
+        "pending_after": 4,
+        "frame_ms": 10.0,
+    }
+
+    def __init__(
+        self,
+        pdf_paths,
+        days: float = 3.0,
+        seed: int = 0,
+        sample_minutes: float = 30.0,
+        inputs_per_hour: float = 20.0,
+        reload_hours: float = 6.0,
+        csv_path=None,
+    ) -> None:
+        self.pdf_paths = list(pdf_paths)
+        self.days = days
+        self.rng = random.Random(seed)
+        self.sample_interval = sample_minutes * 60
+        self.inputs_per_hour = inputs_per_hour
+        self.reload_interval = reload_hours * 3600
+        self.csv_path = csv_path
+        self.samples: list[dict] = []
+        self._frame_times: list[float] = []
+
+    def _timed_show_page(self, show_page):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return show_page(*args, **kwargs)
+            finally:
+                self._frame_times.append((time.perf_counter() - start) * 1000)
+
+        return wrapper
+
+    def _random_input(self, board) -> None:
+        actions = [
+            board._show_next_file,
+            board._show_previous_file,
+            board._show_next_page,
+            board._zoom_in,
+            board._zoom_out,
+            board._zoom_reset,
+            board._pan_left,
+            board._pan_right,
+            board._pan_up,
+            board._pan_down,
+            board._cycle_fit_mode,
+            lambda: board._select_file(self.rng.randrange(max(1, len(board.files)))),
+        ]
+        self.rng.choice(actions)()
+
+    def _sample(self, board, root, clock, started: float) -> None:
+        frames = self._frame_times
+        self._frame_times = []
+        self.samples.append({
+            "hours": (clock.now - started) / 3600,
+            "rss_mb": _rss_bytes() / (1024 * 1024),
+            "tk_images": len(root.tk.call("image", "names")),
+            "pending_after": clock.pending + len(root.tk.call("after", "info")),
+            "frame_ms": (sum(frames) / len(frames)) if frames else 0.0,
+            "frames": len(frames),
+        })
+
+    def run(self) -> bool:
+        """Run the soak; returns True if no metric trended upwards."""
+        xvfb = _start_xvfb()
+        try:
+            return self._run()
+        finally:
+            if xvfb is not None:
+                xvfb.terminate()
+
+    def _run(self) -> bool:
+        _require_heavy()
+        real_root = tk.Tk()
+        clock = VirtualClock()
+        root = VirtualRoot(real_root, clock)
+        board = DigitalNoticeboard(root, self.pdf_paths, restore_state=False)
+        board.clock = clock.time
+        board.last_interaction_time = clock.now
+        board._show_page = self._timed_show_page(board._show_page)
+        started = clock.now
+        end = started + self.days * 86400
+        next_sample = started
+        next_reload = started + self.reload_interval
+        mean_gap = 3600 / self.inputs_per_hour if self.inputs_per_hour > 0 else float("inf")
+        next_input = started + self.rng.expovariate(1 / mean_gap) if mean_gap != float("inf") else float("inf")
+        board._show_page(0)
+        steps = 0
+        wall_start = time.perf_counter()
+        while clock.now < end:
+            due = clock.next_due()
+            target = min(t for t in (due, next_sample, next_reload, next_input, end) if t is not None)
+            clock.advance_to(target)
+            if clock.now >= next_input:
+                self._random_input(board)
+                next_input = clock.now + self.rng.expovariate(1 / mean_gap)
+            if clock.now >= next_reload:
+                board._reload_pdfs()
+                next_reload += self.reload_interval
+            if clock.now >= next_sample:
+                real_root.update()
+                self._sample(board, real_root, clock, started)
+                next_sample += self.sample_interval
+            steps += 1
+            if steps % 200 == 0:
+                real_root.update()
+        self._sample(board, real_root, clock, started)
+        logging.info(
+            "Soak: simulated %.1f days in %.1f s (%d steps)",
+            self.days,
+            time.perf_counter() - wall_start,
+            steps,
+        )
+        try:
+            real_root.destroy()
+        except Exception:
+            pass
+        if self.csv_path:
+            self._write_csv()
+        return self.report()
+
+    def _write_csv(self) -> None:
+        import csv
+
+        with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.samples[0]))
+            writer.writeheader()
+            writer.writerows(self.samples)
+
+    def report(self) -> bool:
+        """Print the trend of every metric; returns False if any grew."""
+        # Ignore the first fifth of the run while caches fill up
+        measured = self.samples[len(self.samples) // 5:]
+        ok = True
+        print(f"Soak: {len(self.samples)} samples over {self.days:g} simulated days")
+        if len(measured) < 3:
+            print("Soak: not enough samples to judge trends")
+            return True
+        hours = [s["hours"] for s in measured]
+        span = hours[-1] - hours[0]
+        for metric, tolerance in self.TOLERANCE.items():
+            values = [float(s[metric]) for s in measured]
+            growth = _trend(hours, values) * span
+            failed = growth > tolerance
+            ok = ok and not failed
+            print(
+                f"  {metric:<14} start {values[0]:10.2f}  end {values[-1]:10.2f}  "
+                f"trend {growth:+10.2f}  {'FAIL' if failed else 'ok'}"
+            )
+        return ok
+
+
+# ----------------------------------------------------------------------
+# Headless export
+#
+# Renders every frame of the rotation the way the board lays it out (top
+# bar with clock, logo and notice indicator above the page, fitted with the
+# configured fit_mode on the background colour) so the notices can be
+# published where DigiBoard itself cannot run.
+
+_EXPORT_FORMATS = ("png", "webp", "gif", "animated-webp")
+
+
+def _load_font(size: int):
+    from PIL import ImageFont
+
+    for name in ("DejaVuSans.ttf", "arial.ttf", "Helvetica.ttc"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def _export_frame(task: dict) -> str:
+    """Render one rotation frame to ``task["out"]``; runs in a pool worker."""
+    from PIL import ImageDraw
+
+    _require_heavy()
+    width, height = task["size"]
+    frame = Image.new("RGB", (width, height), task["background"])
+    draw = ImageDraw.Draw(frame)
+    # Top bar: logo centred, clock on the left, notice indicator on the right
+    logo_h = max(1, min(task["max_logo_height"], int(height * 0.08)))
+    clock_font = _load_font(max(8, task["clock_font_size"] * 4 // 3))
+    clock_h = draw.multiline_textbbox((10, 10), task["clock"], font=clock_font)[3] - 10
+    bar_h = max(logo_h, clock_h) + 15
+    if task["logo"]:
+        try:
+            with Image.open(task["logo"]) as logo:
+                logo = logo.convert("RGBA")
+                logo = logo.resize((max(1, int(logo.width * logo_h / logo.height)), logo_h), Image.LANCZOS)
+                frame.paste(logo, ((width - logo.width) // 2, 10), logo)
+        except Exception as exc:
+            logging.warning("Could not load logo %s: %s", task["logo"], exc)
+    draw.multiline_text((10, 10), task["clock"], fill="black", font=clock_font)
+    indicator = f"{task['file_number']} / {task['file_count']}"
+    indicator_font = _load_font(24)
+    draw.text((width - 10 - draw.textlength(indicator, font=indicator_font), 10), indicator, fill="black", font=indicator_font)
+    # The page, rendered directly at the size it is shown
+    area_w, area_h = width, max(1, height - bar_h - 20)
+    if _is_image_notice(task["path"]) or _is_frame_set(task["path"]):
+        source = task["path"]
+        if _is_frame_set(source):
+            source = Path(source) / f"p{task['page'] + 1:04d}.png"
+        img = _load_image_notice(source, (area_w, area_h))
+        scale = _fit_scale(task["fit_mode"], img.width, img.height, area_w, area_h)
+        if scale != 1.0:
+            img = img.resize((max(1, int(img.width * scale)), max(1, int(img.height * scale))), Image.LANCZOS)
+    else:
+        with fitz.open(task["path"]) as doc:
+            page = doc[task["page"]]
+            scale = _fit_scale(task["fit_mode"], page.rect.width, page.rect.height, area_w, area_h)
+            img = _pixmap_to_image(_render_pixmap(page, scale))
+    if img.width > area_w or img.height > area_h:
+        img = img.crop((0, 0, min(area_w, img.width), min(area_h, img.height)))
+    frame.paste(img, ((area_w - img.width) // 2, bar_h + (area_h - img.height) // 2))
+    if task["format"] == "webp":
+        frame.save(task["out"], "WEBP", quality=90)
+    else:
+        frame.save(task["out"], "PNG", compress_level=1)
+    return task["out"]
+
+
+def export_rotation(pdf_paths, out_dir, size=(1920, 1080), fmt="png", workers=None) -> Path:
+    """Export every page of the rotation as images; returns the output path.
+
+    ``fmt`` is ``png`` or ``webp`` for numbered frames in ``out_dir``, or
+    ``gif`` / ``animated-webp`` for a single animation (``rotation.gif`` /
+    ``rotation.webp``) showing each frame for ``cycle_interval`` seconds.
+    Frames are rendered in parallel by a process pool.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    if fmt not in _EXPORT_FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    animated = fmt in ("gif", "animated-webp")
+    frame_dir = Path(tempfile.mkdtemp(prefix="frames-", dir=out_dir)) if animated else out_dir
+    logo = _find_logo_file()
+    clock = _clock_text(bool(CFG.get("show_date", False)))
+    tasks = []
+    for file_number, path in enumerate(pdf_paths, start=1):
+        try:
+            if _is_image_notice(path):
+                page_count = 1
+            elif _is_frame_set(path):
+                page_count = len(_frame_set_pages(path))
+            else:
+                with fitz.open(path) as doc:
+                    page_count = len(doc)
+        except Exception as exc:
+            logging.error("Skipping %s in export: %s", path, exc)
+            continue
+        for page_num in range(page_count):
+            tasks.append(
+                {
+                    "path": str(path),
+                    "page": page_num,
+                    "file_number": file_number,
+                    "file_count": len(pdf_paths),
+                    "size": tuple(size),
+                    "background": CFG.get("background_color", "#FFFFFF"),
+                    "fit_mode": CFG.get("fit_mode", "fit_page"),
+                    "max_logo_height": int(CFG.get("max_logo_height", LOGO_MAX_HEIGHT)),
+                    "clock_font_size": int(CFG.get("clock_font_size", 24)),
+                    "logo": str(logo) if logo else None,
+                    "clock": clock,
+                    "format": "png" if animated else fmt,
+                }
+            )
+    ext = "png" if animated else fmt
+    for number, task in enumerate(tasks, start=1):
+        task["out"] = str(frame_dir / f"frame_{number:04d}.{ext}")
+    start = time.perf_counter()
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        frames = [Path(out) for out in pool.map(_export_frame, tasks, chunksize=4)]
+    logging.info("Exported %d frames in %.1f s", len(frames), time.perf_counter() - start)
+    if not animated:
+        return out_dir
+    if not frames:
+        raise RuntimeError("nothing to export")
+    target = out_dir / ("rotation.gif" if fmt == "gif" else "rotation.webp")
+    duration = max(3, int(CFG.get("cycle_interval", 10))) * 1000
+
+    def _rest():
+        for path in frames[1:]:
+            with Image.open(path) as img:
+                yield img.convert("RGB")
+
+    with Image.open(frames[0]) as first:
+        first = first.convert("RGB")
+        if fmt == "gif":
+            first.save(target, save_all=True, append_images=_rest(), duration=duration, loop=0, optimize=False)
+        else:
+            first.save(target, "WEBP", save_all=True, append_images=_rest(), duration=duration, loop=0, quality=85)
+    for path in frames:
+        path.unlink()
+    frame_dir.rmdir()
+    return target
+
+
+# ----------------------------------------------------------------------
+# Central pre-rendering
+#
+# One FrameServer renders the notices once per screen resolution in use
+# across the fleet; boards running a FrameClient mirror the result and
+# play it back as frame-set notices instead of rasterising PDFs themselves.
+
+
+# Largest frame the server renders (8K UHD); anything bigger is refused so
+# a client cannot make it allocate arbitrarily large bitmaps.
+_MAX_FRAME_RESOLUTION = (7680, 4320)
+
+
+def _parse_resolution(text: str) -> tuple[int, int]:
+    width, height = (int(v) for v in str(text).lower().split("x"))
+    if not (0 < width <= _MAX_FRAME_RESOLUTION[0] and 0 < height <= _MAX_FRAME_RESOLUTION[1]):
+        raise ValueError(f"invalid resolution {text!r}")
+    return width, height
+
+
+def _png_bytes(img) -> bytes:
+    import io
+
+    buf = io.BytesIO()
+    img.save(buf, "PNG", compress_level=6)
+    return buf.getvalue()
+
+
+class FrameServer:
+    """Pre-render notices for each registered resolution and serve them.
+
+    A build thread rescans ``source`` every ``scan_interval`` seconds and
+    renders new or changed notices: every page fitted to each resolution,
+    a thumbnail of every page and its text.  Assets are PNG files in
+    ``store`` named by the SHA-1 of their content, which doubles as the
+    ETag, so unchanged pages keep their names across rebuilds.  Assets no
+    manifest refers to any more are deleted after each rebuild.
+
+    * ``GET /manifest/<W>x<H>`` lists the notices and their asset ETags.
+      A resolution that is not rendered yet is registered (up to
+      ``max_resolutions``) and answered with ``503`` until it is ready,
+      so boards can ask for exactly the size of their display area.
+      Sizes above ``_MAX_FRAME_RESOLUTION`` get ``400``.
+    * ``GET /assets/<etag>.png`` returns an asset.
+
+    Both honour ``If-None-Match`` with ``304 Not Modified`` and keep
+    connections alive (HTTP/1.1).  Pass ``port=0`` for an ephemeral port.
+    """
+
+    def __init__(
+        self,
+        source: Path,
+        resolutions,
+        store: Path,
+        host: str = "0.0.0.0",
+        port: int = 8765,
+        scan_interval: float = 10.0,
+        thumb_height: int = 160,
+        max_resolutions: int = 8,
+    ) -> None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                code, body, etag, ctype = server.lookup(path)
+                if code == 200 and etag is not None and self.headers.get("If-None-Match") == f'"{etag}"':
+                    code, body = 304, b""
+                self.send_response(code)
+                if etag is not None:
+                    self.send_header("ETag", f'"{etag}"')
+                    if path.startswith("/assets/"):
+                        self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+                if code == 503:
+                    self.send_header("Retry-After", "10")
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                logging.debug("frames: " + fmt, *args)
+
+        self.source = Path(source)
+        self.resolutions = [tuple(r) for r in resolutions]
+        self.max_resolutions = max(len(self.resolutions), int(max_resolutions))
+        self.store = Path(store)
+        self.scan_interval = scan_interval
+        self.thumb_height = thumb_height
+        self._notices: dict[str, dict] = {}
+        self._manifests: dict[str, tuple[bytes, str]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.host, self.port = self.httpd.server_address[:2]
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        self.store.mkdir(parents=True, exist_ok=True)
+        self._threads = [
+            threading.Thread(target=self.httpd.serve_forever, name="frames-http", daemon=True),
+            threading.Thread(target=self._build_loop, name="frames-build", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        logging.info("Frame server listening on http://%s:%d/", self.host, self.port)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def lookup(self, path: str) -> tuple[int, bytes, str | None, str]:
+        """Return ``(status, body, etag, content type)`` for a request path."""
+        not_found = (404, b"not found\n", None, "text/plain")
+        if path.startswith("/manifest/"):
+            res = path[len("/manifest/"):]
+            with self._lock:
+                manifest = self._manifests.get(res)
+            if manifest is not None:
+                return 200, manifest[0], manifest[1], "application/json"
+            try:
+                resolution = _parse_resolution(res)
+            except ValueError:
+                return 400, b"bad resolution\n", None, "text/plain"
+            if not self.request_resolution(resolution):
+                return not_found
+            return 503, b"rendering\n", None, "text/plain"
+        if path.startswith("/assets/") and path.endswith(".png"):
+            etag = path[len("/assets/"):-len(".png")]
+            if not re.fullmatch(r"[0-9a-f]{40}", etag):
+                return not_found
+            try:
+                return 200, (self.store / f"{etag}.png").read_bytes(), etag, "image/png"
+            except OSError:
+                return not_found
+        return not_found
+
+    def request_resolution(self, resolution: tuple[int, int]) -> bool:
+        """Register a resolution to render; False if the limit is reached."""
+        width, height = resolution
+        if not (0 < width <= _MAX_FRAME_RESOLUTION[0] and 0 < height <= _MAX_FRAME_RESOLUTION[1]):
+            return False
+        with self._lock:
+            if resolution in self.resolutions:
+                return True
+            if len(self.resolutions) >= self.max_resolutions:
+                return False
+            self.resolutions.append(resolution)
+        logging.info("Frame server: rendering for a new resolution %dx%d", *resolution)
+        self._wake.set()
+        return True
+
+    def _build_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.scan()
+            except Exception as exc:
+                logging.error("Frame server scan failed: %s", exc)
+            self._wake.wait(self.scan_interval)
+            self._wake.clear()
+
+    def _asset(self, img) -> dict:
+        data = _png_bytes(img)
+        etag = hashlib.sha1(data).hexdigest()
+        target = self.store / f"{etag}.png"
+        if not target.exists():
+            tmp = target.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, target)
+        return {"etag": etag, "bytes": len(data)}
+
+    def _render_notice(self, path: Path, resolutions) -> dict:
+        _require_heavy()
+        frames = {f"{w}x{h}": [] for w, h in resolutions}
+        thumbs, texts = [], []
+
+        def add_page(render, width: float, height: float, text: str) -> None:
+            texts.append(text)
+            for w, h in resolutions:
+                frames[f"{w}x{h}"].append(self._asset(render(_fit_scale("fit_page", width, height, w, h))))
+            thumbs.append(self._asset(render(self.thumb_height / max(1.0, height))))
+
+        if _is_image_notice(path):
+            largest = (max(w for w, _ in resolutions), max(h for _, h in resolutions))
+            img = _load_image_notice(path, largest)
+
+            def render(scale):
+                size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+                return img if size == img.size else img.resize(size, Image.LANCZOS)
+
+            add_page(render, img.width, img.height, "")
+        else:
+            with fitz.open(path) as doc:
+                for page in doc:
+                    add_page(
+                        lambda scale: _pixmap_to_image(_render_pixmap(page, scale)),
+                        page.rect.width,
+                        page.rect.height,
+                        page.get_text(),
+                    )
+        return {"frames": frames, "thumbs": thumbs, "text": texts}
+
+    def scan(self) -> bool:
+        """Render new and changed notices; returns True if anything changed."""
+        with self._lock:
+            resolutions = list(self.resolutions)
+        wanted = {f"{w}x{h}" for w, h in resolutions}
+        changed = False
+        seen = set()
+        for path in find_pdf_files(self.source):
+            if _is_frame_set(path):
+                continue
+            name = path.relative_to(self.source).as_posix()
+            seen.add(name)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            signature = [st.st_mtime_ns, st.st_size]
+            known = self._notices.get(name)
+            if known is not None and known["signature"] == signature and wanted <= set(known["frames"]):
+                continue
+            start = time.perf_counter()
+            try:
+                rendered = self._render_notice(path, resolutions)
+            except Exception as exc:
+                logging.error("Frame server could not render %s: %s", path, exc)
+                continue
+            self._notices[name] = {"signature": signature, **rendered}
+            changed = True
+            logging.info("Pre-rendered %s in %.1f s", name, time.perf_counter() - start)
+        for name in [n for n in self._notices if n not in seen]:
+            del self._notices[name]
+            changed = True
+        if changed or set(self._manifests) != wanted:
+            self._publish(resolutions)
+            self._prune()
+        return changed
+
+    def _publish(self, resolutions) -> None:
+        manifests = {}
+        for w, h in resolutions:
+            res = f"{w}x{h}"
+            notices = [
+                {
+                    "name": name,
+                    "pages": [
+                        {"frame": frame["etag"], "thumb": thumb["etag"]}
+                        for frame, thumb in zip(info["frames"][res], info["thumbs"])
+                    ],
+                    "text": info["text"],
+                }
+                for name, info in sorted(self._notices.items())
+                if res in info["frames"]
+            ]
+            body = json.dumps({"version": 1, "resolution": res, "notices": notices}).encode("utf-8")
+            manifests[res] = (body, hashlib.sha1(body).hexdigest())
+        with self._lock:
+            self._manifests = manifests
+
+    def _prune(self) -> None:
+        """Delete assets that no notice refers to any more."""
+        referenced = set()
+        for info in self._notices.values():
+            for frames in info["frames"].values():
+                referenced.update(frame["etag"] for frame in frames)
+            referenced.update(thumb["etag"] for thumb in info["thumbs"])
+        removed = 0
+        for asset in self.store.glob("*.png"):
+            if asset.stem not in referenced:
+                try:
+                    asset.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logging.info("Frame server: removed %d unused assets", removed)
+
+
+class FrameClient:
+    """Mirror a frame server's notices for one resolution.
+
+    Each notice becomes a ``<name>~<version>.frames`` directory under
+    ``notices_dir``.  A directory is complete and never modified once it
+    exists: a changed notice is assembled next to it under a new version,
+    reusing the pages it already has and downloading the rest in parallel
+    over a small pool of keep-alive connections.  Superseded and removed
+    directories are only deleted by :meth:`collect_garbage`, which the board
+    calls after it has reloaded, so nothing disappears while it is shown.
+    """
+
+    def __init__(self, base_url: str, resolution: tuple[int, int], mirror_dir: Path, workers: int = 4, timeout: float = 10.0) -> None:
+        import queue
+        from urllib.parse import urlsplit
+
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", ""):
+            raise ValueError(f"unsupported frame server URL {base_url!r}")
+        self.host = url.hostname or "127.0.0.1"
+        self.port = url.port or 80
+        self.resolution = f"{resolution[0]}x{resolution[1]}"
+        self.notices_dir = Path(mirror_dir) / "notices"
+        self.workers = max(1, int(workers))
+        self.timeout = timeout
+        self._pool: queue.LifoQueue = queue.LifoQueue()
+        self._manifest_etag = None
+        # Notices of the last synced manifest (None before the first sync)
+        self._live: set[str] | None = None
+        self._garbage: list[Path] = []
+        self._lock = threading.Lock()
+        self.downloads = 0
+        # Status of the last manifest request (200, or 304 if unchanged)
+        self.last_status: int | None = None
+
+    @staticmethod
+    def saved_resolution(mirror_dir: Path) -> tuple[int, int] | None:
+        """Resolution the mirror in ``mirror_dir`` was last synced for."""
+        try:
+            with open(Path(mirror_dir) / "client.json", "r", encoding="utf-8") as f:
+                return _parse_resolution(json.load(f)["resolution"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set_resolution(self, resolution: tuple[int, int]) -> bool:
+        """Switch to another resolution; returns True if it changed."""
+        res = f"{resolution[0]}x{resolution[1]}"
+        if res == self.resolution:
+            return False
+        self.resolution, self._manifest_etag = res, None
+        try:
+            self.notices_dir.parent.mkdir(parents=True, exist_ok=True)
+            _write_json_atomic(self.notices_dir.parent / "client.json", {"resolution": res})
+        except OSError as exc:
+            logging.warning("Could not save the frame resolution: %s", exc)
+        return True
+
+    # -- pooled HTTP -------------------------------------------------------
+    def _get(self, path: str, headers=None) -> tuple[int, dict, bytes]:
+        import http.client
+
+        try:
+            conn = self._pool.get_nowait()
+        except Exception:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        for attempt in (0, 1):
+            try:
+                conn.request("GET", path, headers=headers or {})
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if attempt:
+                    raise
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        if response.will_close:
+            conn.close()
+        else:
+            self._pool.put(conn)
+        return response.status, {k.lower(): v for k, v in response.getheaders()}, body
+
+    def close(self) -> None:
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+    # -- mirroring ----------------------------------------------------------
+    def _dir_name(self, notice: dict) -> str:
+        """Local directory name of a notice; ValueError if the name is unsafe.
+
+        Names come from the server and must stay inside ``notices_dir``, so
+        backslashes, drive prefixes and ``.``/``..`` components are refused.
+        """
+        name = notice["name"]
+        if (
+            not isinstance(name, str)
+            or "\\" in name
+            or ":" in name
+            or any(ord(c) < 32 for c in name)
+            or any(part in ("", ".", "..") for part in name.split("/"))
+        ):
+            raise ValueError(f"unsafe notice name {name!r}")
+        version = hashlib.sha1(
+            json.dumps([notice["pages"], notice.get("text", [])], sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+        dir_name = f"{name.replace('/', '__')}~{version}{_FRAME_SET_SUFFIX}"
+        if (self.notices_dir / dir_name).resolve().parent != self.notices_dir.resolve():
+            raise ValueError(f"unsafe notice name {name!r}")
+        return dir_name
+
+    def _fetch(self, etag: str, target: Path) -> None:
+        status, _headers, body = self._get(f"/assets/{etag}.png")
+        if status != 200 or hashlib.sha1(body).hexdigest() != etag:
+            raise RuntimeError(f"bad asset {etag} (HTTP {status})")
+        target.write_bytes(body)
+        self.downloads += 1
+
+    def _local_assets(self) -> dict[str, Path]:
+        """Map the ETag of every page already mirrored to its file."""
+        found: dict[str, Path] = {}
+        for directory in self.notices_dir.glob("*" + _FRAME_SET_SUFFIX):
+            try:
+                with open(directory / "etags.json", "r", encoding="utf-8") as f:
+                    etags = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for file_name, etag in etags.items():
+                found.setdefault(etag, directory / file_name)
+        return found
+
+    def is_live(self, path) -> bool:
+        """Whether ``path`` belongs to the latest synced manifest."""
+        with self._lock:
+            return self._live is None or Path(path).name in self._live
+
+    def sync(self) -> bool:
+        """Bring the mirror up to date; returns True if any notice changed."""
+        import shutil
+        from concurrent.futures import ThreadPoolExecutor
+
+        headers = {"If-None-Match": f'"{self._manifest_etag}"'} if self._manifest_etag else {}
+        status, response_headers, body = self._get(f"/manifest/{self.resolution}", headers)
+        self.last_status = status
+        if status == 304:
+            return False
+        if status == 503:
+            raise RuntimeError(f"frame server is still rendering for {self.resolution}")
+        if status != 200:
+            raise RuntimeError(f"frame server has no manifest for {self.resolution} (HTTP {status})")
+        manifest = json.loads(body)
+        self.notices_dir.mkdir(parents=True, exist_ok=True)
+        local = self._local_assets()
+        jobs = []
+        building = []
+        wanted = set()
+        for notice in manifest["notices"]:
+            try:
+                name = self._dir_name(notice)
+            except ValueError as exc:
+                logging.error("Skipping notice from frame server: %s", exc)
+                continue
+            wanted.add(name)
+            final = self.notices_dir / name
+            if final.exists():
+                continue
+            tmp = final.with_name(name + ".tmp")
+            shutil.rmtree(tmp, ignore_errors=True)
+            tmp.mkdir(parents=True)
+            etags = {}
+            for number, page in enumerate(notice["pages"], start=1):
+                for kind, etag in (("p", page["frame"]), ("t", page["thumb"])):
+                    file_name = f"{kind}{number:04d}.png"
+                    etags[file_name] = etag
+                    have = local.get(etag)
+                    if have is not None:
+                        try:
+                            os.link(have, tmp / file_name)
+                        except OSError:
+                            shutil.copyfile(have, tmp / file_name)
+                    else:
+                        jobs.append((etag, tmp / file_name))
+            _write_json_atomic(tmp / "text.json", notice.get("text", []))
+            _write_json_atomic(tmp / "etags.json", etags)
+            building.append((tmp, final))
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for future in [pool.submit(self._fetch, etag, target) for etag, target in jobs]:
+                    future.result()
+        except Exception:
+            # Half-built notices would otherwise be listed as loose images
+            for tmp, _final in building:
+                shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        # Each notice appears in one step, complete
+        for tmp, final in building:
+            os.replace(tmp, final)
+        stale = [
+            d
+            for d in self.notices_dir.iterdir()
+            if d.is_dir() and d.name not in wanted and d.name.endswith((_FRAME_SET_SUFFIX, ".tmp"))
+        ]
+        with self._lock:
+            self._live = wanted
+            self._garbage.extend(d for d in stale if d not in self._garbage)
+        self._manifest_etag = response_headers.get("etag", "").strip('"') or None
+        if building or stale:
+            logging.info(
+                "Frame sync: %d assets downloaded, %d notices updated, %d superseded",
+                len(jobs),
+                len(building),
+                len(stale),
+            )
+            return True
+        return False
+
+    def collect_garbage(self) -> None:
+        """Delete superseded and removed notices; call once they are not shown."""
+        import shutil
+
+        with self._lock:
+            garbage, self._garbage = self._garbage, []
+        for directory in garbage:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
 def find_pdf_files(directory: Path) -> list:
     """
-    Recursively find PDF files in the given directory.
+    Recursively find PDF files (and image notices) in the given directory.
 
     This function performs a case‑insensitive check on the file suffix so
     that files with ``.PDF`` or mixed case extensions are detected as well.
+    PNG, JPEG and the other ``_IMAGE_SUFFIXES`` are shown as one-page
+    notices.
     """
     pdfs: list[Path] = []
     for path in directory.rglob("*"):
-        if path.is_file() and path.suffix.lower() == ".pdf":
+        suffix = path.suffix.lower()
+        if any(_is_frame_set(parent) for parent in path.relative_to(directory).parents):
+            # Pages inside a frame set belong to that notice
+            continue
+        if path.is_dir() and suffix == _FRAME_SET_SUFFIX:
+            pdfs.append(path)
+        elif path.is_file() and (suffix == ".pdf" or suffix in _IMAGE_SUFFIXES):
             pdfs.append(path)
     pdfs.sort(key=lambda p: p.name.lower())
     return pdfs
 
 
+def _parse_args(argv):
+    """Parse command line options."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="DigiBoard digital noticeboard")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print a phase-by-phase breakdown of startup time once the first frame is shown",
+    )
+    parser.add_argument(
+        "--soak",
+        type=float,
+        metavar="DAYS",
+        help="run a soak test simulating DAYS of operation on a virtual clock and exit",
+    )
+    parser.add_argument("--soak-seed", type=int, default=0, help="random seed for the soak test input")
+    parser.add_argument("--soak-csv", metavar="PATH", help="write the soak test samples to a CSV file")
+    parser.add_argument(
+        "--report-costs",
+        type=int,
+        nargs="?",
+        const=10,
+        metavar="N",
+        help="print the N notices that are most expensive to render (default 10) and exit",
+    )
+    parser.add_argument("--export", metavar="DIR", help="render every frame of the rotation into DIR and exit")
+    parser.add_argument(
+        "--export-size",
+        default="1920x1080",
+        metavar="WxH",
+        help="resolution of the exported frames (default 1920x1080)",
+    )
+    parser.add_argument(
+        "--export-format",
+        choices=_EXPORT_FORMATS,
+        default="png",
+        help="numbered png/webp frames, or a single animated gif/webp",
+    )
+    parser.add_argument("--export-workers", type=int, metavar="N", help="number of export processes (default: CPU count)")
+    parser.add_argument(
+        "--serve-frames",
+        action="store_true",
+        help="pre-render the notices for --resolutions and serve them to boards (see frame_server)",
+    )
+    parser.add_argument("--frame-host", default="0.0.0.0", help="address the frame server listens on")
+    parser.add_argument("--frame-port", type=int, default=8765, help="port the frame server listens on (default 8765)")
+    parser.add_argument(
+        "--resolutions",
+        default="1920x1080",
+        metavar="WxH[,WxH...]",
+        help="comma-separated resolutions to pre-render for before any board asks (default 1920x1080)",
+    )
+    return parser.parse_args(argv)
+
+
+def _serve_frames(args) -> None:
+    """Run the frame server in the foreground until interrupted."""
+    try:
+        resolutions = [_parse_resolution(r) for r in args.resolutions.split(",") if r.strip()]
+    except ValueError:
+        sys.exit(f"Invalid --resolutions {args.resolutions!r}; expected WIDTHxHEIGHT[,WIDTHxHEIGHT...]")
+    try:
+        thumb_height = int(CFG.get("overview_thumb_height", 160))
+    except Exception:
+        thumb_height = 160
+    _require_heavy()
+    server = FrameServer(
+        PDF_DIR,
+        resolutions,
+        CACHE_DIR / "frames",
+        host=args.frame_host,
+        port=args.frame_port,
+        thumb_height=thumb_height,
+    )
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+def _start_frame_client(root) -> "FrameClient | None":
+    """Mirror the configured frame server and point PDF_DIR at the copy.
+
+    If the server cannot be reached the frames from the last successful
+    sync are used, so a board keeps running through a server outage.
+    """
+    global PDF_DIR
+    url = str(CFG.get("frame_server", "") or "").strip()
+    if not url:
+        return None
+    try:
+        resolution = _parse_resolution(CFG.get("frame_resolution") or "")
+    except ValueError:
+        # The board switches to its display area once it is laid out
+        resolution = FrameClient.saved_resolution(CACHE_DIR / "frame_mirror") or (
+            root.winfo_screenwidth(),
+            root.winfo_screenheight(),
+        )
+    try:
+        client = FrameClient(url, resolution, CACHE_DIR / "frame_mirror")
+    except ValueError as exc:
+        logging.error("%s", exc)
+        return None
+    try:
+        with PROFILER.phase("sync frames"):
+            client.sync()
+        # Nothing is shown yet, so superseded versions can go right away
+        client.collect_garbage()
+    except Exception as exc:
+        logging.warning("Could not sync frames from %s, using the last copy: %s", url, exc)
+    PDF_DIR = client.notices_dir
+    return client
+
+
 def main(argv=None) -> None:
-    pdf_files = find_pdf_files(PDF_DIR)
+    import multiprocessing
+
+    # Lets the render worker start from a PyInstaller executable
+    multiprocessing.freeze_support()
+    args = _parse_args(argv)
+    if args.report_costs:
+        print(RenderCostStats(CACHE_DIR / "render_costs.json").report(args.report_costs))
+        return
+    if args.serve_frames:
+        _serve_frames(args)
+        return
+    PROFILER.enabled = args.profile_startup
+    # Load PyMuPDF and Pillow while the notice folder is scanned and Tk
+    # creates its window.
+    _start_heavy_imports()
+    root = frame_client = None
+    if CFG.get("frame_server") and not (args.export or args.soak):
+        # The screen size picks the resolution to fetch, so Tk comes first
+        with PROFILER.phase("create Tk root"):
+            root = tk.Tk()
+        frame_client = _start_frame_client(root)
+    with PROFILER.phase("find notices"):
+        pdf_files = find_pdf_files(PDF_DIR)
     if not pdf_files:
         print(f"No PDFs found in {PDF_DIR}. Please add your notice PDFs and restart.")
+        if root is not None:
+            root.destroy()
+        return
+    if args.export:
+        _require_heavy()
+        try:
+            width, height = (int(v) for v in args.export_size.lower().split("x"))
+        except ValueError:
+            sys.exit(f"Invalid --export-size {args.export_size!r}; expected WIDTHxHEIGHT")
+        target = export_rotation(
+            pdf_files, args.export, (width, height), args.export_format, workers=args.export_workers
+        )
+        print(f"Exported to {target}")
         return
-    root = tk.Tk()
+    if args.soak:
+        harness = SoakHarness(pdf_files, days=args.soak, seed=args.soak_seed, csv_path=args.soak_csv)
+        sys.exit(0 if harness.run() else 1)
+    if root is None:
+        with PROFILER.phase("create Tk root"):
+            root = tk.Tk()
+    _require_heavy()
     board = DigitalNoticeboard(root, pdf_files, cycle_interval=10)
+    if frame_client is not None:
+        try:
+            interval = max(5.0, float(CFG.get("frame_sync_interval", 60)))
+        except Exception:
+            interval = 60.0
+        board.start_frame_sync(frame_client, interval)
     board.run()
 
 
@@ -0,0 +1,110 @@
+import pytest
+
+import DigiBoard
+
+
+def _make_pdf(path, texts):
+    doc = DigiBoard.fitz.open()
+    for text in texts:
+        doc.new_page(width=595, height=842).insert_text((72, 144), text, fontsize=36)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def frames(tmp_path):
+    DigiBoard._require_heavy()
+    source = tmp_path / "source"
+    source.mkdir()
+    _make_pdf(source / "a.pdf", ["first", "second"])
+    _make_pdf(source / "b.pdf", ["other"])
+    server = DigiBoard.FrameServer(
+        source, [(640, 360)], tmp_path / "store", host="127.0.0.1", port=0, scan_interval=3600
+    )
+    server.store.mkdir(parents=True)
+    server.scan()
+    server.start()
+    client = DigiBoard.FrameClient(f"http://127.0.0.1:{server.port}", (640, 360), tmp_path / "mirror")
+    yield source, server, client
+    client.close()
+    server.stop()
+
+
+def test_sync_downloads_then_304_then_only_changed_assets(frames):
+    source, server, client = frames
+    # Two frames and two thumbnails for a.pdf, one of each for b.pdf
+    assert client.sync()
+    assert client.last_status == 200
+    assert client.downloads == 6
+    mirrored = DigiBoard.find_pdf_files(client.notices_dir)
+    assert len(mirrored) == 2
+    assert all(DigiBoard._is_frame_set(p) and client.is_live(p) for p in mirrored)
+
+    assert not client.sync()
+    assert client.last_status == 304
+    assert client.downloads == 6
+
+    _make_pdf(source / "a.pdf", ["first", "changed"])
+    server.scan()
+    assert client.sync()
+    # Only the second page's frame and thumbnail changed
+    assert client.downloads == 8
+
+
+def test_superseded_versions_are_kept_until_collected(frames):
+    source, server, client = frames
+    client.sync()
+    old = {p.name for p in DigiBoard.find_pdf_files(client.notices_dir)}
+    _make_pdf(source / "a.pdf", ["first", "changed"])
+    server.scan()
+    client.sync()
+    # The version on screen must survive until the board has reloaded
+    assert len(DigiBoard.find_pdf_files(client.notices_dir)) == 3
+    stale = [p for p in DigiBoard.find_pdf_files(client.notices_dir) if not client.is_live(p)]
+    assert len(stale) == 1 and stale[0].name in old
+    client.collect_garbage()
+    assert not stale[0].exists()
+    assert len(DigiBoard.find_pdf_files(client.notices_dir)) == 2
+
+
+def test_removed_notice_and_unused_assets_are_pruned(frames):
+    source, server, client = frames
+    client.sync()
+    assets = len(list(server.store.glob("*.png")))
+    (source / "b.pdf").unlink()
+    server.scan()
+    assert len(list(server.store.glob("*.png"))) == assets - 2
+    assert client.sync()
+    client.collect_garbage()
+    assert [p.name.split("~")[0] for p in DigiBoard.find_pdf_files(client.notices_dir)] == ["a.pdf"]
+
+
+def test_new_resolution_is_rendered_on_request(frames):
+    _source, server, client = frames
+    client.set_resolution((800, 450))
+    with pytest.raises(RuntimeError):
+        client.sync()
+    assert client.last_status == 503
+    server.scan()
+    assert client.sync()
+    assert DigiBoard.FrameClient.saved_resolution(client.notices_dir.parent) == (800, 450)
+
+
+def test_oversized_resolution_is_refused(frames):
+    _source, server, _client = frames
+    assert server.lookup("/manifest/100000x100000")[0] == 400
+    assert server.lookup("/manifest/nonsense")[0] == 400
+    assert (100000, 100000) not in server.resolutions
+
+
+@pytest.mark.parametrize("name", ["../x.pdf", "..\\x.pdf", "C:x.pdf", "/abs.pdf", "a//b.pdf", "a/./b.pdf"])
+def test_unsafe_notice_names_are_refused(tmp_path, name):
+    client = DigiBoard.FrameClient("http://127.0.0.1:1", (640, 360), tmp_path)
+    with pytest.raises(ValueError):
+        client._dir_name({"name": name, "pages": []})
+
+
+def test_nested_notice_name_stays_in_mirror(tmp_path):
+    client = DigiBoard.FrameClient("http://127.0.0.1:1", (640, 360), tmp_path)
+    name = client._dir_name({"name": "sub/a.pdf", "pages": []})
+    assert "/" not in name and name.startswith("sub__a.pdf~")
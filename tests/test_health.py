@@ -0,0 +1,71 @@
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+import DigiBoard
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read()
+
+
+@pytest.fixture
+def health():
+    status = {"heartbeat": time.time(), "last_frame": time.time(), "notices": 3}
+    server = DigiBoard.HealthServer("127.0.0.1", 0, lambda: status, stale_after=5.0)
+    server.start()
+    yield server, status
+    server.stop()
+
+
+def test_health_ok_while_heartbeat_is_fresh(health):
+    server, _status = health
+    code, body = _get(f"http://127.0.0.1:{server.port}/health")
+    report = json.loads(body)
+    assert code == 200
+    assert report["status"] == "ok"
+    assert report["notices"] == 3
+    assert "heartbeat" not in report
+
+
+def test_health_503_when_heartbeat_is_stale(health):
+    server, status = health
+    status["heartbeat"] = time.time() - 60
+    code, body = _get(f"http://127.0.0.1:{server.port}/health")
+    assert code == 503
+    assert json.loads(body)["status"] == "stale"
+
+
+def test_old_last_frame_alone_is_healthy(health):
+    # A paused board draws nothing new but its Tk loop is still alive
+    server, status = health
+    status["last_frame"] = time.time() - 3600
+    code, _body = _get(f"http://127.0.0.1:{server.port}/health")
+    assert code == 200
+
+
+def test_metrics(health):
+    server, status = health
+    DigiBoard.METRICS.incr("test_health_requests")
+    code, body = _get(f"http://127.0.0.1:{server.port}/metrics")
+    text = body.decode("utf-8")
+    assert code == 200
+    assert "digiboard_up 1" in text
+    assert "digiboard_notices 3" in text
+    assert "digiboard_test_health_requests_total" in text
+    status["heartbeat"] = None
+    _code, body = _get(f"http://127.0.0.1:{server.port}/metrics")
+    assert "digiboard_up 0" in body.decode("utf-8")
+
+
+def test_unknown_path_is_404(health):
+    server, _status = health
+    code, _body = _get(f"http://127.0.0.1:{server.port}/nope")
+    assert code == 404
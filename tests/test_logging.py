@@ -0,0 +1,63 @@
+import logging
+import threading
+
+import DigiBoard
+
+
+def _record(msg, created, level=logging.WARNING, args=None):
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.created = created
+    return record
+
+
+def test_repeats_inside_the_window_are_counted_then_reported():
+    repeat = DigiBoard.RepeatFilter(window=60)
+    assert repeat.filter(_record("disk full", 0))
+    assert not repeat.filter(_record("disk full", 10))
+    assert not repeat.filter(_record("disk full", 20))
+    # Another level or message is logged normally
+    assert repeat.filter(_record("disk full", 20, level=logging.ERROR))
+    assert repeat.filter(_record("other", 20))
+    record = _record("disk full", 61)
+    assert repeat.filter(record)
+    assert record.getMessage() == "disk full (repeated 2 more times in the previous 60 s)"
+
+
+def test_formatted_messages_are_compared():
+    repeat = DigiBoard.RepeatFilter(window=60)
+    assert repeat.filter(_record("page %d failed", 0, args=(1,)))
+    assert repeat.filter(_record("page %d failed", 1, args=(2,)))
+    assert not repeat.filter(_record("page %d failed", 2, args=(1,)))
+
+
+def test_zero_window_disables_filtering():
+    repeat = DigiBoard.RepeatFilter(window=0)
+    assert all(repeat.filter(_record("same", t)) for t in range(5))
+
+
+def test_old_keys_are_trimmed():
+    repeat = DigiBoard.RepeatFilter(window=10, max_keys=5)
+    for n in range(5):
+        repeat.filter(_record(f"message {n}", n))
+    repeat.filter(_record("late", 100))
+    assert len(repeat._seen) == 1
+
+
+def test_concurrent_repeats_are_logged_once():
+    repeat = DigiBoard.RepeatFilter(window=3600)
+    passed = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for _ in range(500):
+            if repeat.filter(_record("busy", 1.0)):
+                passed.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(passed) == 1
+    assert repeat._seen[(logging.WARNING, "busy")][1] == 8 * 500 - 1
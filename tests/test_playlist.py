@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+import DigiBoard
+
+
+def test_sequential_order_runs_file_by_file():
+    playlist = DigiBoard.Playlist([2, 1, 3])
+    assert len(playlist) == 6
+    assert playlist.current() == (0, 0)
+    seen = [playlist.next() for _ in range(6)]
+    assert seen == [(0, 1), (1, 0), (2, 0), (2, 1), (2, 2), (0, 0)]
+    assert playlist.cycle == 1
+
+
+def test_order_is_built_lazily():
+    playlist = DigiBoard.Playlist([1000] * 1000)
+    assert playlist._entries is None
+    assert len(playlist) == 1000 * 1000
+    assert playlist._entries is None
+
+
+def test_seek_and_previous():
+    playlist = DigiBoard.Playlist([2, 2])
+    playlist.seek(1, 1)
+    assert playlist.current() == (1, 1)
+    assert playlist.previous() == (1, 0)
+    # Unknown entries leave the position alone
+    playlist.seek(5, 0)
+    assert playlist.current() == (1, 0)
+
+
+def test_shuffle_covers_every_page_once_per_cycle():
+    playlist = DigiBoard.Playlist([3, 4, 5], shuffle=True, rng=random.Random(1))
+    for _cycle in range(3):
+        shown = [playlist.current()] + [playlist.next() for _ in range(len(playlist) - 1)]
+        assert sorted(shown) == [(f, p) for f, n in enumerate([3, 4, 5]) for p in range(n)]
+        last = shown[-1]
+        # No page is shown twice in a row across the reshuffle
+        assert playlist.next() != last
+
+
+def test_upcoming_matches_what_is_shown_next():
+    playlist = DigiBoard.Playlist([3, 3], shuffle=True, rng=random.Random(7))
+    for _ in range(4):
+        playlist.next()
+    ahead = playlist.upcoming(5)
+    assert [playlist.next() for _ in range(5)] == ahead
+
+
+def test_restore_requires_the_same_pages():
+    playlist = DigiBoard.Playlist([2, 1], shuffle=True)
+    playlist.restore([(1, 0), (0, 1), (0, 0)], position=1)
+    assert playlist.current() == (0, 1)
+    with pytest.raises(ValueError):
+        playlist.restore([(0, 0), (0, 1)])
+
+
+def test_empty_playlist():
+    playlist = DigiBoard.Playlist([])
+    assert playlist.current() is None
+    assert playlist.next() is None
+    assert playlist.upcoming(3) == []
@@ -0,0 +1,66 @@
+import json
+from datetime import datetime
+
+import pytest
+
+import DigiBoard
+
+
+def _ts(text):
+    return datetime.fromisoformat(text).timestamp()
+
+
+def test_parse_when():
+    assert DigiBoard._parse_when("2026-03-01") == _ts("2026-03-01T00:00")
+    # A bare end date includes the whole day
+    assert DigiBoard._parse_when("2026-03-01", end=True) == _ts("2026-03-02T00:00")
+    assert DigiBoard._parse_when("2026-03-01 08:30") == _ts("2026-03-01T08:30")
+    assert DigiBoard._parse_when("2026-03-01T08:30", end=True) == _ts("2026-03-01T08:30")
+    assert DigiBoard._parse_when("") is None
+    assert DigiBoard._parse_when(None) is None
+    with pytest.raises(ValueError):
+        DigiBoard._parse_when("next tuesday")
+
+
+def test_window_from_file_name_and_manifest(tmp_path):
+    tagged = tmp_path / "fair [2026-03-01..2026-03-03].pdf"
+    listed = tmp_path / "sub" / "menu.pdf"
+    plain = tmp_path / "always.pdf"
+    (tmp_path / "schedule.json").write_text(
+        json.dumps({"sub/menu.pdf": {"start": "2026-03-02 12:00"}}), encoding="utf-8"
+    )
+    schedule = DigiBoard.NoticeSchedule([tagged, listed, plain], tmp_path, now=_ts("2026-01-01T00:00"))
+    assert schedule.window(tagged) == (_ts("2026-03-01T00:00"), _ts("2026-03-04T00:00"))
+    assert schedule.window(listed) == (_ts("2026-03-02T12:00"), None)
+    assert schedule.window(plain) == (None, None)
+    assert schedule.is_active(plain, _ts("2026-01-01T00:00"))
+    assert not schedule.is_active(tagged, _ts("2026-02-28T23:59"))
+    assert schedule.is_active(tagged, _ts("2026-03-03T23:59"))
+    assert schedule.is_expired(tagged, _ts("2026-03-04T00:00"))
+    assert not schedule.is_expired(listed, _ts("2030-01-01T00:00"))
+
+
+def test_malformed_window_is_ignored(tmp_path):
+    (tmp_path / "schedule.json").write_text(json.dumps({"a.pdf": {"start": "soon"}}), encoding="utf-8")
+    schedule = DigiBoard.NoticeSchedule([tmp_path / "a.pdf"], tmp_path)
+    assert schedule.window(tmp_path / "a.pdf") == (None, None)
+
+
+def test_timeline_hands_out_events_in_order(tmp_path):
+    a = tmp_path / "a [2026-03-01..2026-03-01].pdf"
+    b = tmp_path / "b [2026-03-01 12:00..].pdf"
+    schedule = DigiBoard.NoticeSchedule([a, b], tmp_path, lead=600, now=_ts("2026-02-01T00:00"))
+    assert schedule.next_time() == _ts("2026-03-01T00:00") - 600
+    assert schedule.due(_ts("2026-02-28T00:00")) == []
+    assert schedule.due(_ts("2026-03-01T00:00")) == [("prepare", str(a)), ("start", str(a))]
+    assert schedule.preparing(_ts("2026-03-01T11:55")) == [str(b)]
+    assert schedule.due(_ts("2026-03-02T00:00")) == [("prepare", str(b)), ("start", str(b)), ("end", str(a))]
+    assert schedule.next_time() is None
+    assert schedule.due(_ts("2027-01-01T00:00")) == []
+
+
+def test_past_events_are_not_replayed(tmp_path):
+    a = tmp_path / "a [2026-03-01..2026-03-05].pdf"
+    schedule = DigiBoard.NoticeSchedule([a], tmp_path, now=_ts("2026-03-03T00:00"))
+    assert schedule.due(_ts("2026-03-03T00:00")) == []
+    assert schedule.due(_ts("2026-03-06T00:00")) == [("end", str(a))]
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+import DigiBoard
+
+
+def _make_pdf(path, texts):
+    doc = DigiBoard.fitz.open()
+    for text in texts:
+        doc.new_page().insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def notices(tmp_path):
+    DigiBoard._require_heavy()
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    _make_pdf(a, ["Fire drill on Monday", "Canteen menu"])
+    _make_pdf(b, ["Monday staff meeting"])
+    return tmp_path, a, b
+
+
+def test_search_matches_every_word_and_prefixes_the_last(notices):
+    tmp_path, a, b = notices
+    index = DigiBoard.SearchIndex(tmp_path / "search_index.json")
+    assert index.update([a, b])
+    assert sorted((p, n) for p, n, _ in index.search("monday")) == [(str(a), 0), (str(b), 0)]
+    assert [(p, n) for p, n, _ in index.search("fire mon")] == [(str(a), 0)]
+    assert [(p, n) for p, n, _ in index.search("cant")] == [(str(a), 1)]
+    assert index.search("holiday") == []
+    assert index.search("  ") == []
+    _path, _page, snippet = index.search("drill")[0]
+    assert "drill" in snippet.lower()
+
+
+def test_index_is_persisted_and_only_changes_are_extracted(notices, monkeypatch):
+    tmp_path, a, b = notices
+    DigiBoard.SearchIndex(tmp_path / "search_index.json").update([a, b])
+    index = DigiBoard.SearchIndex(tmp_path / "search_index.json")
+    assert index.search("meeting")
+    extracted = []
+    real_extract = DigiBoard.SearchIndex._extract
+    monkeypatch.setattr(DigiBoard.SearchIndex, "_extract", staticmethod(lambda p: extracted.append(p) or real_extract(p)))
+    assert not index.update([a, b])
+    assert extracted == []
+
+    _make_pdf(b, ["Tuesday staff meeting"])
+    os.utime(b, (os.stat(b).st_atime, os.stat(b).st_mtime + 10))
+    assert index.update([a, b])
+    assert extracted == [b]
+    assert [p for p, _n, _s in index.search("monday")] == [str(a)]
+
+
+def test_removed_notices_are_dropped(notices):
+    tmp_path, a, b = notices
+    index = DigiBoard.SearchIndex(tmp_path / "search_index.json")
+    index.update([a, b])
+    assert index.update([a])
+    assert index.search("meeting") == []
@@ -0,0 +1,89 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+import DigiBoard
+
+
+def test_virtual_clock_runs_callbacks_in_order_without_waiting():
+    clock = DigiBoard.VirtualClock(start=1000.0)
+    ran = []
+    clock.schedule(2000, ran.append, ("b",))
+    clock.schedule(1000, ran.append, ("a",))
+    cancelled = clock.schedule(1500, ran.append, ("x",))
+    clock.cancel(cancelled)
+    assert clock.pending == 2
+    assert clock.next_due() == 1001.0
+    assert clock.advance_to(1001.5) == 1
+    assert ran == ["a"]
+    assert clock.time() == 1001.5
+    clock.advance_to(5000.0)
+    assert ran == ["a", "b"]
+    assert clock.pending == 0
+
+
+def test_virtual_clock_callbacks_can_reschedule():
+    clock = DigiBoard.VirtualClock(start=0.0)
+    ticks = []
+
+    def tick():
+        ticks.append(clock.now)
+        clock.schedule(1000, tick)
+
+    clock.schedule(1000, tick)
+    clock.advance_to(10.0)
+    assert ticks == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+
+
+def test_trend():
+    assert DigiBoard._trend([0, 1, 2, 3], [5, 7, 9, 11]) == pytest.approx(2.0)
+    assert DigiBoard._trend([0, 1, 2], [4, 4, 4]) == 0.0
+    assert DigiBoard._trend([1], [3]) == 0.0
+
+
+def _samples(rss):
+    return [
+        {"hours": h, "rss_mb": value, "tk_images": 10, "pending_after": 5, "frame_ms": 20.0, "frames": 100}
+        for h, value in enumerate(rss)
+    ]
+
+
+def test_report_passes_flat_metrics(capsys):
+    harness = DigiBoard.SoakHarness([], days=1)
+    # Growth during warm-up (the first fifth) is ignored
+    harness.samples = _samples([100, 150] + [200] * 8)
+    assert harness.report()
+    assert "FAIL" not in capsys.readouterr().out
+
+
+def test_report_fails_on_steady_growth(capsys):
+    harness = DigiBoard.SoakHarness([], days=1)
+    harness.samples = _samples([100 + 10 * h for h in range(10)])
+    assert not harness.report()
+    assert "rss_mb" in capsys.readouterr().out
+
+
+def _has_display():
+    if sys.platform.startswith("win") or sys.platform == "darwin" or os.environ.get("DISPLAY"):
+        return True
+    return shutil.which("Xvfb") is not None
+
+
+@pytest.mark.skipif(not _has_display(), reason="needs a display or Xvfb")
+def test_short_soak_run(tmp_path):
+    DigiBoard._require_heavy()
+    paths = []
+    for n in range(3):
+        doc = DigiBoard.fitz.open()
+        for page in range(2):
+            doc.new_page().insert_text((72, 72), f"notice {n} page {page}")
+        path = tmp_path / f"n{n}.pdf"
+        doc.save(str(path))
+        doc.close()
+        paths.append(path)
+    harness = DigiBoard.SoakHarness(paths, days=0.25, seed=1, sample_minutes=30)
+    harness.run()
+    assert len(harness.samples) >= 10
+    assert sum(s["frames"] for s in harness.samples) > 0